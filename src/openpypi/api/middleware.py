@@ -7,7 +7,7 @@ import time
 import uuid
 from collections import defaultdict, deque
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, TypedDict
 from urllib.parse import urlparse
 
 from fastapi import HTTPException, Request, Response
@@ -412,13 +412,24 @@ ErrorHandlingMiddleware = (
 )
 
 
-def get_middleware_metrics() -> Dict[str, Any]:
+class MiddlewareMetrics(TypedDict):
+    """Snapshot of the global request metrics returned by get_middleware_metrics."""
+
+    total_requests: int
+    total_errors: int
+    average_response_time: float
+    request_counts: Dict[str, int]
+    error_counts: Dict[str, int]
+    active_connections: int
+
+
+def get_middleware_metrics() -> MiddlewareMetrics:
     """Get middleware metrics."""
-    total_requests = sum(request_counts.values())
     avg_response_time = sum(response_times) / len(response_times) if response_times else 0
 
     return {
-        "total_requests": total_requests,
+        "total_requests": sum(request_counts.values()),
+        "total_errors": sum(error_counts.values()),
         "average_response_time": avg_response_time,
         "request_counts": dict(request_counts),
         "error_counts": dict(error_counts),
@@ -21,6 +21,10 @@ from openpypi.utils.logger import get_logger
 logger = get_logger(__name__)
 router = APIRouter()
 
+# cpu_percent(interval=None) reports usage since the previous call; prime it
+# here so the first request has a baseline instead of sleeping for a sample
+psutil.cpu_percent(interval=None)
+
 
 class SystemMetrics(BaseModel):
     """System resource metrics."""
@@ -81,7 +85,7 @@ def get_system_metrics() -> SystemMetrics:
     """Get current system resource metrics."""
     try:
         # CPU metrics
-        cpu_percent = psutil.cpu_percent(interval=1)
+        cpu_percent = psutil.cpu_percent(interval=None)
 
         # Memory metrics
         memory = psutil.virtual_memory()
@@ -4,6 +4,7 @@ Stage 4: Testing and Validation - Generate comprehensive tests and validation.
 
 import ast
 import json
+import re
 import subprocess
 import tempfile
 from pathlib import Path
@@ -12,6 +13,7 @@ from typing import Any, Dict, List
 from openpypi.core.context import PackageContext
 from openpypi.stages.base import BaseStage
 from openpypi.utils.logger import get_logger
+from openpypi.utils.validators import FileIndex
 
 logger = get_logger(__name__)
 
@@ -252,12 +254,14 @@ class ValidatorStage(BaseStage):
         }
 
         # Check syntax for all Python files
-        for file_path in context.output_dir.rglob("*.py"):
+        for file_path in FileIndex(context.output_dir).py_files:
             if file_path.name.startswith("test_"):
                 continue
 
+            # The parser takes raw bytes, honouring any coding cookie, so the
+            # source is never decoded into a str just to be parsed
             try:
-                with open(file_path, "r", encoding="utf-8") as f:
+                with open(file_path, "rb") as f:
                     source = f.read()
                 ast.parse(source)
             except SyntaxError as e:
@@ -563,8 +567,6 @@ exclude = .git,__pycache__,docs,build,dist
 
     def _extract_code_from_response(self, response_content: str) -> str:
         """Extract code from AI response."""
-        import re
-
         # Look for code blocks
         code_block_pattern = r"```python\n(.*?)\n```"
         matches = re.findall(code_block_pattern, response_content, re.DOTALL)
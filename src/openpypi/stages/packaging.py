@@ -3,6 +3,7 @@ Packaging stage for building and packaging the project.
 """
 
 import logging
+import shutil
 import subprocess
 from pathlib import Path
 from typing import Any, Dict
@@ -79,13 +80,9 @@ class PackagingStage(Stage):
             dist_dir = project_dir / "dist"
 
             if build_dir.exists():
-                import shutil
-
                 shutil.rmtree(build_dir)
 
             if dist_dir.exists():
-                import shutil
-
                 shutil.rmtree(dist_dir)
 
             # Build package
@@ -2,15 +2,42 @@
 Testing stage for running tests and quality checks.
 """
 
+import json
 import logging
+import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeoutError
 from pathlib import Path
 from typing import Any, Dict
 
 from . import Stage, StageResult, StageStatus, register_stage
 
+try:
+    from bandit.core import config as bandit_config
+    from bandit.core import manager as bandit_manager
+
+    BANDIT_AVAILABLE = True
+except ImportError:
+    BANDIT_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+LINT_COMMANDS = {
+    "black": ["python", "-m", "black", "--check", "src/", "tests/"],
+    "isort": ["python", "-m", "isort", "--check-only", "src/", "tests/"],
+    "flake8": ["python", "-m", "flake8", "src/", "tests/"],
+}
+
+# ruff covers the same checks as black, isort and flake8 from one native binary
+RUFF_COMMANDS = {
+    "ruff": ["ruff", "check", "--extend-select", "I", "--output-format=json", "src/", "tests/"],
+    "ruff_format": ["ruff", "format", "--check", "src/", "tests/"],
+}
+
+# Seconds a bandit scan may take, in process or through the CLI
+BANDIT_TIMEOUT = 120
+
 
 @register_stage
 class TestingStage(Stage):
@@ -44,13 +71,19 @@ class TestingStage(Stage):
                     message=f"Project directory does not exist: {project_path}",
                 )
 
-            # Run tests and quality checks
-            test_results = {
-                "pytest": self._run_pytest(project_dir),
-                "linting": self._run_linting(project_dir),
-                "type_checking": self._run_type_checking(project_dir),
-                "security_scan": self._run_security_scan(project_dir),
+            # Run tests and quality checks; each one waits on child processes,
+            # so they run side by side in threads
+            checks = {
+                "pytest": self._run_pytest,
+                "linting": self._run_linting,
+                "type_checking": self._run_type_checking,
+                "security_scan": self._run_security_scan,
             }
+            with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+                futures = {
+                    name: executor.submit(check, project_dir) for name, check in checks.items()
+                }
+                test_results = {name: future.result() for name, future in futures.items()}
 
             # Determine overall status
             failed_checks = [name for name, result in test_results.items() if not result["success"]]
@@ -100,61 +133,53 @@ class TestingStage(Stage):
             return {"success": False, "error": str(e)}
 
     def _run_linting(self, project_dir: Path) -> Dict[str, Any]:
-        """Run code linting checks."""
-        try:
-            # Run black check
-            black_result = subprocess.run(
-                ["python", "-m", "black", "--check", "src/", "tests/"],
-                cwd=project_dir,
-                capture_output=True,
-                text=True,
-                timeout=60,
-            )
+        """
+        Run code linting checks as concurrent child processes.
 
-            # Run isort check
-            isort_result = subprocess.run(
-                ["python", "-m", "isort", "--check-only", "src/", "tests/"],
-                cwd=project_dir,
-                capture_output=True,
-                text=True,
-                timeout=60,
-            )
+        The ``linter`` config option selects the separate black/isort/flake8
+        tools with ``"legacy"`` (the default), ``"ruff"``, or ``"auto"``, which
+        uses ruff only when it is installed.
+        """
+        linter = self.config.get("linter", "legacy")
+        use_ruff = linter == "ruff" or (linter == "auto" and shutil.which("ruff") is not None)
+        commands = RUFF_COMMANDS if use_ruff else LINT_COMMANDS
 
-            # Run flake8
-            flake8_result = subprocess.run(
-                ["python", "-m", "flake8", "src/", "tests/"],
-                cwd=project_dir,
-                capture_output=True,
-                text=True,
-                timeout=60,
-            )
+        try:
+            # Each tool runs in its own thread with its own 60s timeout, and
+            # subprocess.run drains its pipes, so a verbose tool never blocks
+            # on a full pipe while another is being waited on
+            with ThreadPoolExecutor(max_workers=len(commands)) as executor:
+                futures = {
+                    tool: executor.submit(
+                        subprocess.run,
+                        cmd,
+                        cwd=project_dir,
+                        capture_output=True,
+                        text=True,
+                        timeout=60,
+                    )
+                    for tool, cmd in commands.items()
+                }
+                completed = {tool: future.result() for tool, future in futures.items()}
+
+            results = {
+                tool: {
+                    "exit_code": result.returncode,
+                    "stdout": result.stdout,
+                    "stderr": result.stderr,
+                }
+                for tool, result in completed.items()
+            }
 
-            success = all(
-                [
-                    black_result.returncode == 0,
-                    isort_result.returncode == 0,
-                    flake8_result.returncode == 0,
-                ]
-            )
+            success = all(result["exit_code"] == 0 for result in results.values())
 
-            return {
-                "success": success,
-                "black": {
-                    "exit_code": black_result.returncode,
-                    "stdout": black_result.stdout,
-                    "stderr": black_result.stderr,
-                },
-                "isort": {
-                    "exit_code": isort_result.returncode,
-                    "stdout": isort_result.stdout,
-                    "stderr": isort_result.stderr,
-                },
-                "flake8": {
-                    "exit_code": flake8_result.returncode,
-                    "stdout": flake8_result.stdout,
-                    "stderr": flake8_result.stderr,
-                },
-            }
+            if "ruff" in results:
+                try:
+                    results["ruff"]["issues"] = json.loads(results["ruff"]["stdout"] or "[]")
+                except json.JSONDecodeError:
+                    results["ruff"]["issues"] = []
+
+            return {"success": success, **results}
 
         except Exception as e:
             return {"success": False, "error": str(e)}
@@ -179,10 +204,28 @@ class TestingStage(Stage):
 
     def _run_security_scan(self, project_dir: Path) -> Dict[str, Any]:
         """Run security scanning with bandit."""
+        if BANDIT_AVAILABLE:
+            # The in-process scan has no timeout of its own, so bound the wait for
+            # it the way the CLI run is bounded. A timed-out scan cannot be
+            # interrupted; it is reported as failed rather than run a second time
+            executor = ThreadPoolExecutor(max_workers=1)
+            try:
+                future = executor.submit(self._run_bandit_in_process, project_dir)
+                return future.result(timeout=BANDIT_TIMEOUT)
+            except FuturesTimeoutError:
+                logger.warning(f"Bandit scan timed out after {BANDIT_TIMEOUT}s")
+                return {"success": False, "error": "bandit timed out"}
+            finally:
+                executor.shutdown(wait=False)
+
+        return self._run_bandit_cli(project_dir)
+
+    def _run_bandit_cli(self, project_dir: Path) -> Dict[str, Any]:
+        """Run bandit as a child process."""
         try:
             cmd = ["python", "-m", "bandit", "-r", "src/", "-f", "json"]
             result = subprocess.run(
-                cmd, cwd=project_dir, capture_output=True, text=True, timeout=120
+                cmd, cwd=project_dir, capture_output=True, text=True, timeout=BANDIT_TIMEOUT
             )
 
             # Bandit returns non-zero if issues found, but that's expected
@@ -199,6 +242,32 @@ class TestingStage(Stage):
         except Exception as e:
             return {"success": False, "error": str(e)}
 
+    def _run_bandit_in_process(self, project_dir: Path) -> Dict[str, Any]:
+        """Run bandit through its manager API, skipping interpreter startup."""
+        try:
+            b_mgr = bandit_manager.BanditManager(bandit_config.BanditConfig(), "file", quiet=True)
+            b_mgr.discover_files([str(project_dir / "src")], recursive=True)
+            b_mgr.run_tests()
+            issues = b_mgr.get_issue_list()
+
+            # Mirror the exit code and JSON report of the bandit CLI
+            report = {
+                "errors": [
+                    {"filename": filename, "reason": reason} for filename, reason in b_mgr.skipped
+                ],
+                "results": [issue.as_dict() for issue in issues],
+            }
+
+            return {
+                "success": True,
+                "exit_code": 1 if issues else 0,
+                "stdout": json.dumps(report, indent=2),
+                "stderr": "",
+            }
+
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+
     def can_execute(self, context: Dict[str, Any]) -> bool:
         """Check if testing stage can execute."""
         # Need project path from generation stage
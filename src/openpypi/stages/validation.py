@@ -2,10 +2,17 @@
 Validation stage for input validation and configuration checking.
 """
 
+import keyword
 import logging
+import os
 import re
+import stat
+import string
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Mapping, Tuple
 
 from ..core.config import Config
 from ..core.exceptions import ValidationError
@@ -13,6 +20,305 @@ from . import Stage, StageResult, StageStatus, register_stage
 
 logger = logging.getLogger(__name__)
 
+# Reserved words of the running Python version
+_PYTHON_KEYWORDS = frozenset(keyword.kwlist)
+
+# Basic email validation: translating with these tables deletes every allowed
+# character, so a valid local part or domain translates to ""
+_EMAIL_LOCAL_DELETE = str.maketrans("", "", string.ascii_letters + string.digits + "._%+-")
+_EMAIL_DOMAIN_DELETE = str.maketrans("", "", string.ascii_letters + string.digits + ".-")
+
+# One comma-separated clause of a python_requires specifier, e.g. ">=3.8" or "==3.8.*"
+_PYTHON_REQUIRES_CLAUSE_RE = re.compile(r"(>=|<=|==|!=|>|<)\s*\d+\.\d+(?:\.\d+)?(?:\.\*)?")
+
+# Shared read-only results for each passing check
+_OK_PKG = MappingProxyType({"valid": True, "message": "Package name is valid"})
+_OK_PROJECT = MappingProxyType({"valid": True, "message": "Project name is valid"})
+_OK_AUTHOR = MappingProxyType({"valid": True, "message": "Author name is valid"})
+_OK_EMAIL = MappingProxyType({"valid": True, "message": "Email address is valid"})
+_OK_VERSION = MappingProxyType({"valid": True, "message": "Version is valid"})
+_OK_PYTHON = MappingProxyType({"valid": True, "message": "Python version requirement is valid"})
+_OK_OUTPUT = MappingProxyType({"valid": True, "message": "Output directory is valid"})
+_OK_DEPS = MappingProxyType({"valid": True, "message": "Dependencies are valid"})
+
+# Shared read-only results for the failures whose message never varies
+_ERR_PKG_EMPTY = MappingProxyType({"valid": False, "message": "Package name is required"})
+_ERR_PKG_BAD = MappingProxyType(
+    {
+        "valid": False,
+        "message": (
+            "Package name must start with lowercase letter and contain only lowercase letters, "
+            "numbers, and underscores"
+        ),
+    }
+)
+_ERR_PROJECT_EMPTY = MappingProxyType({"valid": False, "message": "Project name is required"})
+_ERR_PROJECT_LONG = MappingProxyType(
+    {"valid": False, "message": "Project name too long (max 100 characters)"}
+)
+_ERR_AUTHOR_EMPTY = MappingProxyType({"valid": False, "message": "Author name is required"})
+_ERR_AUTHOR_LONG = MappingProxyType(
+    {"valid": False, "message": "Author name too long (max 100 characters)"}
+)
+_ERR_EMAIL_EMPTY = MappingProxyType({"valid": False, "message": "Email address is required"})
+_ERR_EMAIL_BAD = MappingProxyType({"valid": False, "message": "Invalid email address format"})
+_ERR_VERSION_EMPTY = MappingProxyType({"valid": False, "message": "Version is required"})
+_ERR_VERSION_BAD = MappingProxyType(
+    {"valid": False, "message": "Version must follow semantic versioning format (e.g., 1.0.0)"}
+)
+_ERR_PYTHON_EMPTY = MappingProxyType(
+    {"valid": False, "message": "Python version requirement is required"}
+)
+_ERR_PYTHON_BAD = MappingProxyType(
+    {"valid": False, "message": 'Invalid Python version requirement format (e.g., ">=3.8")'}
+)
+_ERR_OUTPUT_EMPTY = MappingProxyType({"valid": False, "message": "Output directory is required"})
+_ERR_DEPS_NOT_LIST = MappingProxyType({"valid": False, "message": "Dependencies must be a list"})
+_ERR_DEP_NOT_STR = MappingProxyType({"valid": False, "message": "Each dependency must be a string"})
+
+# Maximum number of distinct configs whose validation results are kept
+_VALIDATION_CACHE_SIZE = 128
+
+# Characters allowed in a dependency name and in the version after its specifier
+_DEPENDENCY_NAME_CHARS = frozenset(string.ascii_letters + string.digits + "._-")
+
+# Comparison operators that may open a dependency's version specifier
+_SPECIFIER_OPERATOR_CHARS = "<>=!"
+
+# One dependency spec per line, the same grammar _is_valid_dependency scans
+_DEPENDENCY_LINE_RE = re.compile(
+    r"^[a-zA-Z0-9][a-zA-Z0-9._-]*(?:\[.*\])?(?:[<>=!]+[0-9][a-zA-Z0-9._-]*)?$", re.MULTILINE
+)
+
+
+def _is_numeric_identifier(part: str) -> bool:
+    """Check for an ASCII number without leading zeros."""
+    return part.isascii() and part.isdigit() and (part == "0" or part[0] != "0")
+
+
+def _is_alphanumeric_identifier(part: str) -> bool:
+    """Check for a non-empty run of ASCII letters, digits and hyphens."""
+    stripped = part.replace("-", "")
+    return bool(part) and part.isascii() and (not stripped or stripped.isalnum())
+
+
+def _is_valid_dependency(spec: str) -> bool:
+    """
+    Check a dependency spec such as ``requests``, ``uvicorn[standard]`` or
+    ``pydantic>=2.0``.
+
+    Scans the name, then the optional ``[extras]`` and version specifier, in
+    a single forward pass.
+    """
+    end = 0
+    while end < len(spec) and spec[end] in _DEPENDENCY_NAME_CHARS:
+        end += 1
+    if not end or not (spec[0].isascii() and spec[0].isalnum()):
+        return False
+
+    rest = spec[end:]
+    if rest.startswith("["):
+        # Version specifiers never contain "]", so the extras end at the last one
+        close = rest.rfind("]")
+        if close == -1 or "\n" in rest[:close]:
+            return False
+        rest = rest[close + 1 :]
+
+    if not rest:
+        return True
+
+    version = rest.lstrip(_SPECIFIER_OPERATOR_CHARS)
+    if len(version) == len(rest) or not version:
+        return False
+    return version[0] in string.digits and all(char in _DEPENDENCY_NAME_CHARS for char in version)
+
+
+def _is_valid_email(email: str) -> bool:
+    """Check for ``local@domain.tld`` with an alphabetic top-level domain."""
+    at = email.rfind("@")
+    if at < 1 or at == len(email) - 1:
+        return False
+
+    local, domain = email[:at], email[at + 1 :]
+    if local.translate(_EMAIL_LOCAL_DELETE) or domain.translate(_EMAIL_DOMAIN_DELETE):
+        return False
+
+    host, dot, tld = domain.rpartition(".")
+    return bool(host) and len(tld) >= 2 and tld.isalpha()
+
+
+def _parse_semver(version: str) -> bool:
+    """
+    Check a version string against the semantic versioning 2.0.0 grammar.
+
+    A linear scan over the split identifiers, with none of the backtracking
+    the equivalent regex can fall into on long ambiguous pre-release tags.
+    """
+    version, plus, build = version.partition("+")
+    if plus and not all(_is_alphanumeric_identifier(part) for part in build.split(".")):
+        return False
+
+    core, dash, prerelease = version.partition("-")
+    parts = core.split(".")
+    if len(parts) != 3 or not all(_is_numeric_identifier(part) for part in parts):
+        return False
+
+    if dash:
+        for part in prerelease.split("."):
+            if not _is_alphanumeric_identifier(part):
+                return False
+            # Numeric identifiers must not have leading zeros
+            if part.isdigit() and not _is_numeric_identifier(part):
+                return False
+
+    return True
+
+
+def _validate_package_name(package_name: str) -> Mapping[str, Any]:
+    """Validate package name follows Python naming conventions."""
+    if not package_name:
+        return _ERR_PKG_EMPTY
+
+    # Python package naming rules: a lowercase ASCII identifier starting with a letter
+    if not (
+        package_name.isascii()
+        and package_name.islower()
+        and package_name.isidentifier()
+        and package_name[0].isalpha()
+    ):
+        return _ERR_PKG_BAD
+
+    # Reserved keywords check
+    if package_name in _PYTHON_KEYWORDS:
+        return {"valid": False, "message": f'Package name "{package_name}" is a Python keyword'}
+
+    return _OK_PKG
+
+
+def _validate_project_name(project_name: str) -> Mapping[str, Any]:
+    """Validate project name."""
+    if not project_name:
+        return _ERR_PROJECT_EMPTY
+
+    if len(project_name) > 100:
+        return _ERR_PROJECT_LONG
+
+    return _OK_PROJECT
+
+
+def _validate_author(author: str) -> Mapping[str, Any]:
+    """Validate author name."""
+    if not author:
+        return _ERR_AUTHOR_EMPTY
+
+    if len(author) > 100:
+        return _ERR_AUTHOR_LONG
+
+    return _OK_AUTHOR
+
+
+def _validate_email(email: str) -> Mapping[str, Any]:
+    """Validate email address."""
+    if not email:
+        return _ERR_EMAIL_EMPTY
+
+    if not _is_valid_email(email):
+        return _ERR_EMAIL_BAD
+
+    return _OK_EMAIL
+
+
+def _validate_version(version: str) -> Mapping[str, Any]:
+    """Validate version string follows semantic versioning."""
+    if not version:
+        return _ERR_VERSION_EMPTY
+
+    if not _parse_semver(version):
+        return _ERR_VERSION_BAD
+
+    return _OK_VERSION
+
+
+def _validate_python_version(python_requires: str) -> Mapping[str, Any]:
+    """Validate Python version requirement."""
+    if not python_requires:
+        return _ERR_PYTHON_EMPTY
+
+    # Common patterns: >=3.8, >=3.8,<4.0, ==3.8.*, etc. Each clause is
+    # matched on its own, so there is no repeated group to backtrack over
+    clauses = python_requires.split(",")
+    if python_requires != python_requires.strip() or not all(
+        _PYTHON_REQUIRES_CLAUSE_RE.fullmatch(clause.strip()) for clause in clauses
+    ):
+        return _ERR_PYTHON_BAD
+
+    return _OK_PYTHON
+
+
+def _validate_output_directory(output_dir: str) -> Mapping[str, Any]:
+    """Validate output directory."""
+    if not output_dir:
+        return _ERR_OUTPUT_EMPTY
+
+    try:
+        output_path = Path(output_dir)
+
+        # One stat call answers both "exists" and "is a directory"
+        try:
+            parent_stat = os.stat(output_path.parent)
+        except (FileNotFoundError, NotADirectoryError):
+            return {
+                "valid": False,
+                "message": f"Parent directory does not exist: {output_path.parent}",
+            }
+
+        if not stat.S_ISDIR(parent_stat.st_mode):
+            return {
+                "valid": False,
+                "message": f"Parent path is not a directory: {output_path.parent}",
+            }
+
+        return _OK_OUTPUT
+
+    except Exception as e:
+        return {"valid": False, "message": f"Invalid output directory: {e}"}
+
+
+def _validate_dependencies(dependencies: list) -> Mapping[str, Any]:
+    """Validate project dependencies."""
+    if not isinstance(dependencies, list):
+        return _ERR_DEPS_NOT_LIST
+
+    if not all(isinstance(dep, str) for dep in dependencies):
+        return _ERR_DEP_NOT_STR
+
+    # Match the whole list in one regex pass; only when some line fails is
+    # each dependency scanned on its own to report the offending one
+    buffer = "\n".join(dependencies)
+    if buffer.count("\n") == len(dependencies) - 1 and sum(
+        1 for _ in _DEPENDENCY_LINE_RE.finditer(buffer)
+    ) == len(dependencies):
+        return _OK_DEPS
+
+    for dep in dependencies:
+        if not _is_valid_dependency(dep):
+            return {"valid": False, "message": f"Invalid dependency format: {dep}"}
+
+    return _OK_DEPS
+
+
+# Config field validators in cost order: length checks first, then the string
+# parsers. Each entry is (result key, validator, Config attribute)
+_VALIDATORS: Tuple[Tuple[str, Callable[[Any], Mapping[str, Any]], str], ...] = (
+    ("project_name", _validate_project_name, "project_name"),
+    ("author", _validate_author, "author"),
+    ("package_name", _validate_package_name, "package_name"),
+    ("email", _validate_email, "email"),
+    ("version", _validate_version, "version"),
+    ("python_requires", _validate_python_version, "python_requires"),
+    ("dependencies", _validate_dependencies, "dependencies"),
+)
+
 
 @register_stage
 class ValidationStage(Stage):
@@ -21,6 +327,13 @@ class ValidationStage(Stage):
     def __init__(self, name: str, config: Dict[str, Any] = None):
         super().__init__(name, config)
         self.dependencies = []  # No dependencies
+        self.fail_fast = self.config.get("fail_fast", False)
+
+        # Config field results keyed by the validated values, least recently used first
+        self._validation_cache: "OrderedDict[Tuple[Any, ...], Dict[str, Mapping[str, Any]]]" = (
+            OrderedDict()
+        )
+        self._validation_cache_lock = threading.Lock()
 
     def execute(self, context: Dict[str, Any]) -> StageResult:
         """Execute validation stage."""
@@ -49,16 +362,18 @@ class ValidationStage(Stage):
             else:
                 config = project_config
 
-            # Validation results
+            # The config fields are pure string checks and can be reused across
+            # reruns; the output directory is looked up on disk every time
+            validation_results = dict(self._validate_config_fields(config))
+            if not self.fail_fast or all(v["valid"] for v in validation_results.values()):
+                validation_results["output_directory"] = _validate_output_directory(
+                    context.get("output_dir")
+                )
+
+            # The shared results are read-only proxies; hand callers plain,
+            # JSON-serializable dicts of their own
             validation_results = {
-                "package_name": self._validate_package_name(config.package_name),
-                "project_name": self._validate_project_name(config.project_name),
-                "author": self._validate_author(config.author),
-                "email": self._validate_email(config.email),
-                "version": self._validate_version(config.version),
-                "python_requires": self._validate_python_version(config.python_requires),
-                "output_directory": self._validate_output_directory(context.get("output_dir")),
-                "dependencies": self._validate_dependencies(config.dependencies),
+                field: dict(result) for field, result in validation_results.items()
             }
 
             # Check for any validation failures
@@ -94,169 +409,44 @@ class ValidationStage(Stage):
                 error=e,
             )
 
-    def _validate_package_name(self, package_name: str) -> Dict[str, Any]:
-        """Validate package name follows Python naming conventions."""
-        if not package_name:
-            return {"valid": False, "message": "Package name is required"}
-
-        # Python package naming rules
-        if not re.match(r"^[a-z][a-z0-9_]*$", package_name):
-            return {
-                "valid": False,
-                "message": (
-                    "Package name must start with lowercase letter and contain only lowercase letters, numbers, and underscores"
-                ),
-            }
-
-        # Reserved keywords check
-        python_keywords = {
-            "and",
-            "as",
-            "assert",
-            "break",
-            "class",
-            "continue",
-            "def",
-            "del",
-            "elif",
-            "else",
-            "except",
-            "exec",
-            "finally",
-            "for",
-            "from",
-            "global",
-            "if",
-            "import",
-            "in",
-            "is",
-            "lambda",
-            "not",
-            "or",
-            "pass",
-            "print",
-            "raise",
-            "return",
-            "try",
-            "while",
-            "with",
-            "yield",
-        }
-
-        if package_name in python_keywords:
-            return {"valid": False, "message": f'Package name "{package_name}" is a Python keyword'}
-
-        return {"valid": True, "message": "Package name is valid"}
-
-    def _validate_project_name(self, project_name: str) -> Dict[str, Any]:
-        """Validate project name."""
-        if not project_name:
-            return {"valid": False, "message": "Project name is required"}
-
-        if len(project_name) > 100:
-            return {"valid": False, "message": "Project name too long (max 100 characters)"}
-
-        return {"valid": True, "message": "Project name is valid"}
-
-    def _validate_author(self, author: str) -> Dict[str, Any]:
-        """Validate author name."""
-        if not author:
-            return {"valid": False, "message": "Author name is required"}
-
-        if len(author) > 100:
-            return {"valid": False, "message": "Author name too long (max 100 characters)"}
-
-        return {"valid": True, "message": "Author name is valid"}
-
-    def _validate_email(self, email: str) -> Dict[str, Any]:
-        """Validate email address."""
-        if not email:
-            return {"valid": False, "message": "Email address is required"}
-
-        # Basic email validation
-        email_pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-        if not re.match(email_pattern, email):
-            return {"valid": False, "message": "Invalid email address format"}
-
-        return {"valid": True, "message": "Email address is valid"}
-
-    def _validate_version(self, version: str) -> Dict[str, Any]:
-        """Validate version string follows semantic versioning."""
-        if not version:
-            return {"valid": False, "message": "Version is required"}
-
-        # Semantic versioning pattern
-        semver_pattern = r"^(?P<major>0|[1-9]\d*)\.(?P<minor>0|[1-9]\d*)\.(?P<patch>0|[1-9]\d*)(?:-(?P<prerelease>(?:0|[1-9]\d*|\d*[a-zA-Z-][0-9a-zA-Z-]*)(?:\.(?:0|[1-9]\d*|\d*[a-zA-Z-][0-9a-zA-Z-]*))*))?(?:\+(?P<buildmetadata>[0-9a-zA-Z-]+(?:\.[0-9a-zA-Z-]+)*))?$"
-
-        if not re.match(semver_pattern, version):
-            return {
-                "valid": False,
-                "message": "Version must follow semantic versioning format (e.g., 1.0.0)",
-            }
-
-        return {"valid": True, "message": "Version is valid"}
-
-    def _validate_python_version(self, python_requires: str) -> Dict[str, Any]:
-        """Validate Python version requirement."""
-        if not python_requires:
-            return {"valid": False, "message": "Python version requirement is required"}
-
-        # Common patterns: >=3.8, >=3.8,<4.0, ==3.8.*, etc.
-        version_pattern = r"^(>=|>|<=|<|==|!=)\s*\d+\.\d+(\.\d+)?(\.\*)?(\s*,\s*(>=|>|<=|<|==|!=)\s*\d+\.\d+(\.\d+)?(\.\*)?)*$"
-
-        if not re.match(version_pattern, python_requires):
-            return {
-                "valid": False,
-                "message": 'Invalid Python version requirement format (e.g., ">=3.8")',
-            }
-
-        return {"valid": True, "message": "Python version requirement is valid"}
-
-    def _validate_output_directory(self, output_dir: str) -> Dict[str, Any]:
-        """Validate output directory."""
-        if not output_dir:
-            return {"valid": False, "message": "Output directory is required"}
-
+    def _validate_config_fields(self, config: Config) -> Dict[str, Mapping[str, Any]]:
+        """Validate the config fields, reusing results for identical inputs."""
+        dependencies = config.dependencies
+        key = (
+            self.fail_fast,
+            config.package_name,
+            config.project_name,
+            config.author,
+            config.email,
+            config.version,
+            config.python_requires,
+            tuple(dependencies) if isinstance(dependencies, list) else dependencies,
+        )
         try:
-            output_path = Path(output_dir)
-
-            # Check if parent directory exists
-            if not output_path.parent.exists():
-                return {
-                    "valid": False,
-                    "message": f"Parent directory does not exist: {output_path.parent}",
-                }
-
-            # Check if we can write to the parent directory
-            if not output_path.parent.is_dir():
-                return {
-                    "valid": False,
-                    "message": f"Parent path is not a directory: {output_path.parent}",
-                }
-
-            return {"valid": True, "message": "Output directory is valid"}
-
-        except Exception as e:
-            return {"valid": False, "message": f"Invalid output directory: {e}"}
-
-    def _validate_dependencies(self, dependencies: list) -> Dict[str, Any]:
-        """Validate project dependencies."""
-        if not isinstance(dependencies, list):
-            return {"valid": False, "message": "Dependencies must be a list"}
-
-        # Validate each dependency
-        for dep in dependencies:
-            if not isinstance(dep, str):
-                return {"valid": False, "message": "Each dependency must be a string"}
-
-            # Basic package name validation (can include version specifiers)
-            if not re.match(
-                r"^[a-zA-Z0-9][a-zA-Z0-9._-]*[a-zA-Z0-9]?(\[.*\])?([<>=!]+[0-9][a-zA-Z0-9._-]*)?$",
-                dep,
-            ):
-                return {"valid": False, "message": f"Invalid dependency format: {dep}"}
-
-        return {"valid": True, "message": "Dependencies are valid"}
+            with self._validation_cache_lock:
+                cached = self._validation_cache.get(key)
+                if cached is not None:
+                    self._validation_cache.move_to_end(key)
+        except TypeError:
+            # Unhashable inputs (e.g. non-string dependencies) are never cached
+            key = cached = None
+        if cached is not None:
+            return cached
+
+        results = {}
+        for field_name, validator, attr in _VALIDATORS:
+            results[field_name] = validator(getattr(config, attr))
+            if self.fail_fast and not results[field_name]["valid"]:
+                break
+
+        if key is not None:
+            with self._validation_cache_lock:
+                self._validation_cache[key] = results
+                if len(self._validation_cache) > _VALIDATION_CACHE_SIZE:
+                    # Evict the least recently used entry
+                    self._validation_cache.popitem(last=False)
+
+        return results
 
     def can_execute(self, context: Dict[str, Any]) -> bool:
         """Check if validation stage can execute."""
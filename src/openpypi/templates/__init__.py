@@ -8,8 +8,15 @@ __all__ = ["Template", "TemplateManager"]
 
 """Template utilities for OpenPypi."""
 
+import copy
+import functools
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 
 
 def get_template_path() -> Path:
@@ -17,8 +24,9 @@ def get_template_path() -> Path:
     return Path(__file__).parent
 
 
-def get_available_templates() -> List[str]:
-    """Get list of available project templates."""
+@functools.lru_cache(maxsize=1)
+def _scan_templates() -> Tuple[str, ...]:
+    """Scan the templates directory once per process."""
     template_dirs = []
     template_path = get_template_path()
 
@@ -26,11 +34,17 @@ def get_available_templates() -> List[str]:
         if item.is_dir() and not item.name.startswith("_"):
             template_dirs.append(item.name)
 
-    return sorted(template_dirs)
+    return tuple(sorted(template_dirs))
 
 
-def get_template_info(template_name: str) -> Optional[Dict[str, str]]:
-    """Get information about a specific template."""
+def get_available_templates() -> List[str]:
+    """Get list of available project templates."""
+    return list(_scan_templates())
+
+
+@functools.lru_cache(maxsize=128)
+def _load_template_info(template_name: str) -> Optional[Dict[str, str]]:
+    """Read a template's information once per process; treat the result as read-only."""
     template_path = get_template_path() / template_name
 
     if not template_path.exists():
@@ -38,13 +52,23 @@ def get_template_info(template_name: str) -> Optional[Dict[str, str]]:
 
     info_file = template_path / "template.json"
     if info_file.exists():
-        import json
-
-        with open(info_file) as f:
-            return json.load(f)
+        return _json_loads(info_file.read_bytes())
 
     return {
         "name": template_name,
         "description": f"Template for {template_name} projects",
         "version": "1.0.0",
     }
+
+
+def get_template_info(template_name: str) -> Optional[Dict[str, str]]:
+    """Get information about a specific template."""
+    info = _load_template_info(template_name)
+    # Callers get their own copy, so mutating it cannot affect later calls
+    return copy.deepcopy(info) if info is not None else None
+
+
+def _clear_cache() -> None:
+    """Forget cached template listings, e.g. after tests add a template directory."""
+    _scan_templates.cache_clear()
+    _load_template_info.cache_clear()
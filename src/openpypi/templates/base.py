@@ -2,19 +2,410 @@
 Base template system for OpenPypi package generation.
 """
 
+import asyncio
+import copy
+import dataclasses
+import functools
 import json
+import os
+import re
 import shutil
+import string
+import tempfile
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Set, Tuple
 
 import yaml
 
+try:
+    # libyaml bindings, when PyYAML was built with them
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeDumper, SafeLoader
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from openpypi.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Templates shipped inside the package, resolved once at import
+_DEFAULT_TEMPLATES_DIR = (Path(__file__).parent.parent / "templates").resolve()
+
+# Metadata and file layout of the templates shipped with OpenPypi. Built once at
+# import; treat the entries as read-only
+_BUILTIN_TEMPLATES: Tuple[Dict[str, Any], ...] = (
+    {
+        "name": "cli_tool",
+        "description": "Command-line interface application with Click",
+        "category": "cli",
+        "author": "Nik Jois",
+        "features": [
+            "Click CLI framework",
+            "Argument parsing",
+            "Configuration management",
+            "Logging setup",
+            "Progress bars",
+            "Error handling",
+        ],
+        "dependencies": ["click", "rich", "pyyaml"],
+        "dev_dependencies": ["pytest", "pytest-cov", "black", "flake8"],
+        "structure": {
+            "src/{package_name}": {
+                "__init__.py": "",
+                "__main__.py": "",
+                "cli.py": "",
+                "core.py": "",
+                "config.py": "",
+                "utils.py": "",
+            },
+            "tests": {
+                "__init__.py": "",
+                "test_cli.py": "",
+                "test_core.py": "",
+                "conftest.py": "",
+            },
+        },
+    },
+    {
+        "name": "library",
+        "description": "General-purpose Python library",
+        "category": "library",
+        "author": "Nik Jois",
+        "features": [
+            "Modular architecture",
+            "Type hints",
+            "Comprehensive documentation",
+            "Unit tests",
+            "API design",
+        ],
+        "dependencies": [],
+        "dev_dependencies": ["pytest", "pytest-cov", "black", "flake8", "mypy"],
+        "structure": {
+            "src/{package_name}": {
+                "__init__.py": "",
+                "core.py": "",
+                "utils.py": "",
+                "exceptions.py": "",
+            },
+            "tests": {
+                "__init__.py": "",
+                "test_core.py": "",
+                "test_utils.py": "",
+                "conftest.py": "",
+            },
+        },
+    },
+    {
+        "name": "web_api",
+        "description": "Web API with FastAPI",
+        "category": "web",
+        "author": "Nik Jois",
+        "features": [
+            "FastAPI framework",
+            "Async support",
+            "Pydantic models",
+            "OpenAPI documentation",
+            "Authentication",
+            "Database integration",
+        ],
+        "dependencies": ["fastapi", "uvicorn", "pydantic", "sqlalchemy"],
+        "dev_dependencies": ["pytest", "pytest-asyncio", "httpx", "black", "flake8"],
+        "structure": {
+            "src/{package_name}": {
+                "__init__.py": "",
+                "main.py": "",
+                "api": {"__init__.py": "", "routes.py": "", "dependencies.py": ""},
+                "models": {"__init__.py": "", "schemas.py": "", "database.py": ""},
+                "core": {"__init__.py": "", "config.py": "", "security.py": ""},
+            },
+            "tests": {
+                "__init__.py": "",
+                "test_api.py": "",
+                "test_models.py": "",
+                "conftest.py": "",
+            },
+        },
+    },
+    {
+        "name": "data_science",
+        "description": "Data science toolkit with pandas and numpy",
+        "category": "data-science",
+        "author": "Nik Jois",
+        "features": [
+            "Pandas integration",
+            "NumPy support",
+            "Data visualization",
+            "Statistical analysis",
+            "Jupyter notebooks",
+            "Data validation",
+        ],
+        "dependencies": ["pandas", "numpy", "matplotlib", "seaborn", "scipy"],
+        "dev_dependencies": ["pytest", "jupyter", "black", "flake8", "mypy"],
+        "structure": {
+            "src/{package_name}": {
+                "__init__.py": "",
+                "data": {
+                    "__init__.py": "",
+                    "loader.py": "",
+                    "processor.py": "",
+                    "validator.py": "",
+                },
+                "analysis": {
+                    "__init__.py": "",
+                    "statistics.py": "",
+                    "visualization.py": "",
+                },
+                "utils": {"__init__.py": "", "helpers.py": ""},
+            },
+            "notebooks": {"examples.ipynb": "", "tutorial.ipynb": ""},
+            "tests": {
+                "__init__.py": "",
+                "test_data.py": "",
+                "test_analysis.py": "",
+                "conftest.py": "",
+            },
+        },
+    },
+    {
+        "name": "ml_toolkit",
+        "description": "Machine learning toolkit with scikit-learn",
+        "category": "ml",
+        "author": "Nik Jois",
+        "features": [
+            "Scikit-learn compatibility",
+            "Model pipelines",
+            "Feature engineering",
+            "Model evaluation",
+            "Hyperparameter tuning",
+            "Model persistence",
+        ],
+        "dependencies": ["scikit-learn", "pandas", "numpy", "joblib"],
+        "dev_dependencies": ["pytest", "jupyter", "black", "flake8", "mypy"],
+        "structure": {
+            "src/{package_name}": {
+                "__init__.py": "",
+                "models": {
+                    "__init__.py": "",
+                    "base.py": "",
+                    "classifiers.py": "",
+                    "regressors.py": "",
+                },
+                "preprocessing": {
+                    "__init__.py": "",
+                    "features.py": "",
+                    "transformers.py": "",
+                },
+                "evaluation": {"__init__.py": "", "metrics.py": "", "validation.py": ""},
+                "utils": {"__init__.py": "", "io.py": "", "helpers.py": ""},
+            },
+            "tests": {
+                "__init__.py": "",
+                "test_models.py": "",
+                "test_preprocessing.py": "",
+                "test_evaluation.py": "",
+                "conftest.py": "",
+            },
+        },
+    },
+)
+
+# Names of the built-in templates, checked against the templates directory listing
+_BUILTIN_TEMPLATE_NAMES = frozenset(template["name"] for template in _BUILTIN_TEMPLATES)
+
+
+# Generated project files, parsed once at import and filled in by apply_template
+_PYPROJECT_TEMPLATE = string.Template("""[build-system]
+requires = ["setuptools>=69.0.0", "wheel"]
+build-backend = "setuptools.build_meta"
+
+[project]
+name = "${package_name}"
+version = "${version}"
+description = "${description}"
+readme = "README.md"
+requires-python = "${python_version}"
+license = {text = "${license}"}
+authors = [
+    {name = "Nik Jois", email = "nikjois@llamasearch.ai"},
+]
+keywords = ${keywords}
+classifiers = [
+    "Development Status :: 3 - Alpha",
+    "Intended Audience :: Developers",
+    "License :: OSI Approved :: MIT License",
+    "Operating System :: OS Independent",
+    "Programming Language :: Python :: 3",
+    "Programming Language :: Python :: 3.8",
+    "Programming Language :: Python :: 3.9",
+    "Programming Language :: Python :: 3.10",
+    "Programming Language :: Python :: 3.11",
+    "Programming Language :: Python :: 3.12",
+]
+dependencies = ${dependencies}
+
+[project.optional-dependencies]
+dev = ${dev_dependencies}
+
+[tool.setuptools]
+packages = ["${package_name}"]
+package-dir = {"" = "src"}
+
+[project.urls]
+Homepage = "https://github.com/NikJois/${package_name}"
+Repository = "https://github.com/NikJois/${package_name}"
+Issues = "https://github.com/NikJois/${package_name}/issues"
+""")
+
+_PYPROJECT_SCRIPTS_TEMPLATE = string.Template("""
+[project.scripts]
+${package_name} = "${package_name}.cli:main"
+""")
+
+_README_TEMPLATE = string.Template("""# ${package_name}
+
+${description}
+
+## Features
+
+${features}
+
+## Installation
+
+```bash
+pip install ${package_name}
+```
+
+## Usage
+
+```python
+import ${package_name}
+
+# Your code here
+```
+
+## Development
+
+1. Clone the repository:
+```bash
+git clone https://github.com/NikJois/${package_name}.git
+cd ${package_name}
+```
+
+2. Install development dependencies:
+```bash
+pip install -e .[dev]
+```
+
+3. Run tests:
+```bash
+pytest
+```
+
+## License
+
+${license} License
+""")
+
+
+def _walk_files(base_dir: Path, skip_names: Set[str]) -> Iterator[Tuple[str, str]]:
+    """
+    Yield ``(path, relative_path)`` for every file under ``base_dir``.
+
+    Uses ``os.scandir``, whose entries carry their file type, so no extra
+    ``stat`` call is made per entry. Entries named in ``skip_names`` are
+    skipped, along with everything below them.
+    """
+    stack = [(str(base_dir), "")]
+    while stack:
+        directory, rel_dir = stack.pop()
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name in skip_names:
+                    continue
+                rel_path = os.path.join(rel_dir, entry.name)
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append((entry.path, rel_path))
+                else:
+                    yield entry.path, rel_path
+
+
+def _read_metadata(metadata_file: Path) -> Dict[str, Any]:
+    """Read a template metadata file in JSON or YAML format."""
+    if metadata_file.suffix == ".json":
+        raw = metadata_file.read_bytes()
+        return orjson.loads(raw) if orjson is not None else json.loads(raw)
+    with open(metadata_file, "r") as f:
+        return yaml.load(f, Loader=SafeLoader)
+
+
+def _dump_json(data: Dict[str, Any]) -> bytes:
+    """Serialize metadata to indented JSON, writing datetimes in ISO 8601 format."""
+    if orjson is not None:
+        # orjson encodes datetimes natively
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+
+    def default(value: Any) -> str:
+        if isinstance(value, datetime):
+            return value.isoformat()
+        raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+    return (json.dumps(data, indent=2, default=default) + "\n").encode("utf-8")
+
+
+def _parse_timestamp(value: Any) -> Optional[datetime]:
+    """Parse an ISO 8601 timestamp; YAML metadata may already hold a datetime."""
+    if not value:
+        return None
+    if isinstance(value, datetime):
+        return value
+    return datetime.fromisoformat(value)
+
+
+def _write_metadata(metadata_file: Path, data: Dict[str, Any]) -> None:
+    """
+    Write template metadata in the format given by the file suffix.
+
+    The data goes to a uniquely named temporary file in the same directory
+    that is then renamed over the target, so concurrent readers never see a
+    truncated metadata file and concurrent writers never share a temp file.
+    """
+    fd, tmp_name = tempfile.mkstemp(
+        dir=metadata_file.parent, prefix=metadata_file.name + ".", suffix=".tmp"
+    )
+    try:
+        # The YAML emitter makes many small writes; a large buffer batches them
+        with os.fdopen(fd, "wb", buffering=65536) as f:
+            if metadata_file.suffix == ".json":
+                f.write(_dump_json(data))
+            else:
+                yaml.dump(data, f, Dumper=SafeDumper, default_flow_style=False, encoding="utf-8")
+        os.replace(tmp_name, metadata_file)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_metadata_cached(path_str: str, mtime_ns: int) -> Mapping[str, Any]:
+    """
+    Parse a template metadata file.
+
+    The modification time is part of the cache key, so an edited file is
+    parsed again while unchanged files are served from memory.
+    """
+    return MappingProxyType(_read_metadata(Path(path_str)))
+
 
 @dataclass
 class Template:
@@ -54,226 +445,48 @@ class Template:
     @classmethod
     def from_dict(cls, data: Dict[str, Any], template_path: Optional[Path] = None) -> "Template":
         """Create template from dictionary."""
-        created_at = None
-        if data.get("created_at"):
-            created_at = datetime.fromisoformat(data["created_at"])
-
-        updated_at = None
-        if data.get("updated_at"):
-            updated_at = datetime.fromisoformat(data["updated_at"])
-
+        fields = {key: data[key] for key in _TEMPLATE_DATA_FIELDS if key in data}
         return cls(
-            name=data["name"],
-            description=data["description"],
-            category=data["category"],
-            author=data["author"],
-            version=data.get("version", "1.0.0"),
-            features=data.get("features", []),
-            dependencies=data.get("dependencies", []),
-            dev_dependencies=data.get("dev_dependencies", []),
-            python_version=data.get("python_version", ">=3.8"),
+            **fields,
             template_path=template_path,
-            created_at=created_at,
-            updated_at=updated_at,
-            metadata=data.get("metadata", {}),
+            created_at=_parse_timestamp(data.get("created_at")),
+            updated_at=_parse_timestamp(data.get("updated_at")),
         )
 
 
+# Template fields read verbatim from metadata; the rest are set by from_dict itself
+_TEMPLATE_DATA_FIELDS = tuple(
+    f.name
+    for f in dataclasses.fields(Template)
+    if f.name not in ("template_path", "created_at", "updated_at")
+)
+
+
 class TemplateManager:
     """Manages package templates for OpenPypi."""
 
     def __init__(self, templates_dir: Optional[Path] = None):
         """Initialize template manager."""
-        if templates_dir is None:
-            # Default to package templates directory
-            package_dir = Path(__file__).parent.parent
-            templates_dir = package_dir / "templates"
-
-        self.templates_dir = Path(templates_dir)
+        # Default to package templates directory
+        self.templates_dir = (
+            Path(templates_dir) if templates_dir is not None else _DEFAULT_TEMPLATES_DIR
+        )
         self.templates_dir.mkdir(parents=True, exist_ok=True)
 
-        # Initialize built-in templates if they don't exist
-        self._initialize_builtin_templates()
+        # Templates returned by get_template, keyed by name, with the metadata
+        # file name and mtime they were loaded from
+        self._template_cache: Dict[str, Tuple[Tuple[str, int], Template]] = {}
+
+        # Initialize built-in templates if they don't exist. One directory listing
+        # answers this without probing each built-in directory or writing anything
+        with os.scandir(self.templates_dir) as entries:
+            existing = {entry.name for entry in entries if entry.is_dir()}
+        if not _BUILTIN_TEMPLATE_NAMES <= existing:
+            self._initialize_builtin_templates()
 
     def _initialize_builtin_templates(self) -> None:
         """Initialize built-in templates."""
-        builtin_templates = [
-            {
-                "name": "cli_tool",
-                "description": "Command-line interface application with Click",
-                "category": "cli",
-                "author": "Nik Jois",
-                "features": [
-                    "Click CLI framework",
-                    "Argument parsing",
-                    "Configuration management",
-                    "Logging setup",
-                    "Progress bars",
-                    "Error handling",
-                ],
-                "dependencies": ["click", "rich", "pyyaml"],
-                "dev_dependencies": ["pytest", "pytest-cov", "black", "flake8"],
-                "structure": {
-                    "src/{package_name}": {
-                        "__init__.py": "",
-                        "__main__.py": "",
-                        "cli.py": "",
-                        "core.py": "",
-                        "config.py": "",
-                        "utils.py": "",
-                    },
-                    "tests": {
-                        "__init__.py": "",
-                        "test_cli.py": "",
-                        "test_core.py": "",
-                        "conftest.py": "",
-                    },
-                },
-            },
-            {
-                "name": "library",
-                "description": "General-purpose Python library",
-                "category": "library",
-                "author": "Nik Jois",
-                "features": [
-                    "Modular architecture",
-                    "Type hints",
-                    "Comprehensive documentation",
-                    "Unit tests",
-                    "API design",
-                ],
-                "dependencies": [],
-                "dev_dependencies": ["pytest", "pytest-cov", "black", "flake8", "mypy"],
-                "structure": {
-                    "src/{package_name}": {
-                        "__init__.py": "",
-                        "core.py": "",
-                        "utils.py": "",
-                        "exceptions.py": "",
-                    },
-                    "tests": {
-                        "__init__.py": "",
-                        "test_core.py": "",
-                        "test_utils.py": "",
-                        "conftest.py": "",
-                    },
-                },
-            },
-            {
-                "name": "web_api",
-                "description": "Web API with FastAPI",
-                "category": "web",
-                "author": "Nik Jois",
-                "features": [
-                    "FastAPI framework",
-                    "Async support",
-                    "Pydantic models",
-                    "OpenAPI documentation",
-                    "Authentication",
-                    "Database integration",
-                ],
-                "dependencies": ["fastapi", "uvicorn", "pydantic", "sqlalchemy"],
-                "dev_dependencies": ["pytest", "pytest-asyncio", "httpx", "black", "flake8"],
-                "structure": {
-                    "src/{package_name}": {
-                        "__init__.py": "",
-                        "main.py": "",
-                        "api": {"__init__.py": "", "routes.py": "", "dependencies.py": ""},
-                        "models": {"__init__.py": "", "schemas.py": "", "database.py": ""},
-                        "core": {"__init__.py": "", "config.py": "", "security.py": ""},
-                    },
-                    "tests": {
-                        "__init__.py": "",
-                        "test_api.py": "",
-                        "test_models.py": "",
-                        "conftest.py": "",
-                    },
-                },
-            },
-            {
-                "name": "data_science",
-                "description": "Data science toolkit with pandas and numpy",
-                "category": "data-science",
-                "author": "Nik Jois",
-                "features": [
-                    "Pandas integration",
-                    "NumPy support",
-                    "Data visualization",
-                    "Statistical analysis",
-                    "Jupyter notebooks",
-                    "Data validation",
-                ],
-                "dependencies": ["pandas", "numpy", "matplotlib", "seaborn", "scipy"],
-                "dev_dependencies": ["pytest", "jupyter", "black", "flake8", "mypy"],
-                "structure": {
-                    "src/{package_name}": {
-                        "__init__.py": "",
-                        "data": {
-                            "__init__.py": "",
-                            "loader.py": "",
-                            "processor.py": "",
-                            "validator.py": "",
-                        },
-                        "analysis": {
-                            "__init__.py": "",
-                            "statistics.py": "",
-                            "visualization.py": "",
-                        },
-                        "utils": {"__init__.py": "", "helpers.py": ""},
-                    },
-                    "notebooks": {"examples.ipynb": "", "tutorial.ipynb": ""},
-                    "tests": {
-                        "__init__.py": "",
-                        "test_data.py": "",
-                        "test_analysis.py": "",
-                        "conftest.py": "",
-                    },
-                },
-            },
-            {
-                "name": "ml_toolkit",
-                "description": "Machine learning toolkit with scikit-learn",
-                "category": "ml",
-                "author": "Nik Jois",
-                "features": [
-                    "Scikit-learn compatibility",
-                    "Model pipelines",
-                    "Feature engineering",
-                    "Model evaluation",
-                    "Hyperparameter tuning",
-                    "Model persistence",
-                ],
-                "dependencies": ["scikit-learn", "pandas", "numpy", "joblib"],
-                "dev_dependencies": ["pytest", "jupyter", "black", "flake8", "mypy"],
-                "structure": {
-                    "src/{package_name}": {
-                        "__init__.py": "",
-                        "models": {
-                            "__init__.py": "",
-                            "base.py": "",
-                            "classifiers.py": "",
-                            "regressors.py": "",
-                        },
-                        "preprocessing": {
-                            "__init__.py": "",
-                            "features.py": "",
-                            "transformers.py": "",
-                        },
-                        "evaluation": {"__init__.py": "", "metrics.py": "", "validation.py": ""},
-                        "utils": {"__init__.py": "", "io.py": "", "helpers.py": ""},
-                    },
-                    "tests": {
-                        "__init__.py": "",
-                        "test_models.py": "",
-                        "test_preprocessing.py": "",
-                        "test_evaluation.py": "",
-                        "conftest.py": "",
-                    },
-                },
-            },
-        ]
-
-        for template_data in builtin_templates:
+        for template_data in _BUILTIN_TEMPLATES:
             template_dir = self.templates_dir / template_data["name"]
             if not template_dir.exists():
                 self._create_template_directory(template_data, template_dir)
@@ -282,10 +495,8 @@ class TemplateManager:
         """Create a template directory structure."""
         template_dir.mkdir(parents=True, exist_ok=True)
 
-        # Save template metadata
-        metadata_file = template_dir / "template.yaml"
-        with open(metadata_file, "w") as f:
-            yaml.dump(template_data, f, default_flow_style=False)
+        # Save template metadata as JSON, which parses far faster than YAML
+        _write_metadata(template_dir / "template.json", template_data)
 
         # Create directory structure if specified
         structure = template_data.get("structure", {})
@@ -295,65 +506,103 @@ class TemplateManager:
         logger.info(f"Created built-in template: {template_data['name']}")
 
     def _create_directory_structure(self, base_dir: Path, structure: Dict[str, Any]) -> None:
-        """Recursively create directory structure."""
-        for name, content in structure.items():
-            path = base_dir / name
-
-            if isinstance(content, dict):
-                # It's a directory
-                path.mkdir(parents=True, exist_ok=True)
-                self._create_directory_structure(path, content)
-            else:
-                # It's a file
-                path.parent.mkdir(parents=True, exist_ok=True)
-                if not path.exists():
-                    path.write_text(content or "# Module implementation\n")
+        """Create the directories and files described by a nested structure dict."""
+        directories = set()
+        files = []
+
+        # Flatten the structure: dict values are directories, anything else a file
+        stack = [(base_dir, structure)]
+        while stack:
+            parent, entries = stack.pop()
+            for name, content in entries.items():
+                path = parent / name
+                if isinstance(content, dict):
+                    directories.add(path)
+                    stack.append((path, content))
+                else:
+                    directories.add(path.parent)
+                    files.append((path, content))
+
+        # Deepest first, so each makedirs call also covers the ancestors
+        created = set()
+        for directory in sorted(directories, key=lambda p: len(p.parts), reverse=True):
+            if directory not in created:
+                os.makedirs(directory, exist_ok=True)
+                created.update(directory.parents)
+                created.add(directory)
+
+        for path, content in files:
+            # O_EXCL leaves existing files untouched without a separate exists() check
+            try:
+                fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+            except FileExistsError:
+                continue
+            with os.fdopen(fd, "w") as f:
+                f.write(content or "# Module implementation\n")
 
     async def list_templates(self) -> List[Template]:
         """List all available templates."""
-        templates = []
-
-        for template_dir in self.templates_dir.iterdir():
-            if template_dir.is_dir():
-                template = await self._load_template(template_dir)
-                if template:
-                    templates.append(template)
+        template_dirs = [d for d in self.templates_dir.iterdir() if d.is_dir()]
+        results = await asyncio.gather(*(self._load_template(d) for d in template_dirs))
 
-        return sorted(templates, key=lambda t: t.name)
+        return sorted((t for t in results if t), key=lambda t: t.name)
 
     async def _load_template(self, template_dir: Path) -> Optional[Template]:
         """Load a template from directory."""
         try:
-            metadata_file = template_dir / "template.yaml"
-            if not metadata_file.exists():
-                # Try JSON format as fallback
-                metadata_file = template_dir / "template.json"
-                if not metadata_file.exists():
-                    logger.warning(f"No metadata file found in template: {template_dir}")
-                    return None
-
-            # Load metadata
-            if metadata_file.suffix == ".yaml":
-                with open(metadata_file, "r") as f:
-                    data = yaml.safe_load(f)
-            else:
-                with open(metadata_file, "r") as f:
-                    data = json.load(f)
+            metadata_file = self._find_metadata_file(template_dir)
+            if metadata_file is None:
+                logger.warning(f"No metadata file found in template: {template_dir}")
+                return None
+
+            # Load metadata, parsing the file only if it changed since the last load.
+            # Parsing blocks, so it runs in the default executor off the event loop
+            loop = asyncio.get_running_loop()
+            data = await loop.run_in_executor(
+                None,
+                _parse_metadata_cached,
+                str(metadata_file),
+                metadata_file.stat().st_mtime_ns,
+            )
 
-            # Create template instance
-            template = Template.from_dict(data, template_path=template_dir)
+            # Create template instance from a copy so it never shares lists with the cache
+            template = Template.from_dict(copy.deepcopy(dict(data)), template_path=template_dir)
             return template
 
         except Exception as e:
             logger.error(f"Failed to load template from {template_dir}: {e}")
             return None
 
+    @staticmethod
+    def _find_metadata_file(template_dir: Path) -> Optional[Path]:
+        """Find a template's metadata file, preferring JSON over user-authored YAML."""
+        for filename in ("template.json", "template.yaml"):
+            metadata_file = template_dir / filename
+            if metadata_file.exists():
+                return metadata_file
+        return None
+
     async def get_template(self, name: str) -> Optional[Template]:
         """Get a specific template by name."""
         template_dir = self.templates_dir / name
-        if template_dir.exists():
-            return await self._load_template(template_dir)
-        return None
+        metadata_file = self._find_metadata_file(template_dir)
+        if metadata_file is None:
+            self._template_cache.pop(name, None)
+            # Let _load_template report a template directory without metadata
+            return await self._load_template(template_dir) if template_dir.exists() else None
+
+        # Reuse the Template built last time unless its metadata file changed.
+        # Callers get their own copy, so mutating it cannot affect later calls
+        freshness = (metadata_file.name, metadata_file.stat().st_mtime_ns)
+        cached = self._template_cache.get(name)
+        if cached is not None and cached[0] == freshness:
+            return copy.deepcopy(cached[1])
+
+        template = await self._load_template(template_dir)
+        if template:
+            self._template_cache[name] = (freshness, template)
+            return copy.deepcopy(template)
+        return template
 
     async def create_template(
         self,
@@ -402,7 +651,7 @@ class TemplateManager:
             "dependencies": dependencies or [],
             "dev_dependencies": dev_dependencies or [],
             "python_version": python_version,
-            "created_at": datetime.now().isoformat(),
+            "created_at": datetime.now(),
             "metadata": metadata,
         }
 
@@ -426,22 +675,20 @@ class TemplateManager:
         Returns:
             bool: True if updated successfully
         """
-        template = await self.get_template(name)
-        if not template:
+        # Read the metadata file directly; building a Template would parse it twice
+        metadata_file = self._find_metadata_file(self.templates_dir / name)
+        if metadata_file is None:
             raise TemplateError(f"Template '{name}' not found")
 
         # Load current metadata
-        metadata_file = template.template_path / "template.yaml"
-        with open(metadata_file, "r") as f:
-            data = yaml.safe_load(f)
+        data = _read_metadata(metadata_file)
 
         # Apply updates
         data.update(updates)
-        data["updated_at"] = datetime.now().isoformat()
+        data["updated_at"] = datetime.now()
 
-        # Save updated metadata
-        with open(metadata_file, "w") as f:
-            yaml.dump(data, f, default_flow_style=False)
+        # Save updated metadata in its existing format
+        _write_metadata(metadata_file, data)
 
         logger.info(f"Updated template: {name}")
         return True
@@ -461,10 +708,17 @@ class TemplateManager:
         if not template_dir.exists():
             raise TemplateError(f"Template '{name}' not found")
 
-        # Don't allow deletion of built-in templates
-        template = await self.get_template(name)
-        if template and template.author == "Nik Jois":
-            raise TemplateError(f"Cannot delete built-in template: {name}")
+        # Don't allow deletion of built-in templates. Only the author is needed,
+        # so read it from the cached metadata instead of building a Template
+        metadata_file = self._find_metadata_file(template_dir)
+        if metadata_file is not None:
+            try:
+                data = _parse_metadata_cached(str(metadata_file), metadata_file.stat().st_mtime_ns)
+            except (TypeError, ValueError, yaml.YAMLError):
+                # Unreadable metadata, as before, does not protect the template
+                data = {}
+            if data.get("author") == "Nik Jois":
+                raise TemplateError(f"Cannot delete built-in template: {name}")
 
         # Delete template directory
         shutil.rmtree(template_dir)
@@ -493,21 +747,25 @@ class TemplateManager:
 
         logger.info(f"Applying template '{template_name}' to {target_dir}")
 
-        # Prepare substitutions
-        substitutions.update(
-            {
-                "package_name": package_name,
-                "template_name": template_name,
-                "author": substitutions.get("author", "Unknown"),
-                "email": substitutions.get("email", "nikjois@llamasearch.ai"),
-                "description": substitutions.get(
-                    "description", f"A Python package generated from {template_name} template"
-                ),
-                "version": substitutions.get("version", "0.1.0"),
-                "license": substitutions.get("license", "MIT"),
-                "python_version": template.python_version,
-            }
-        )
+        # Prepare substitutions: defaults first, caller values override them, and
+        # the values fixed by this call override both
+        defaults = {
+            "author": "Unknown",
+            "email": "nikjois@llamasearch.ai",
+            "description": f"A Python package generated from {template_name} template",
+            "version": "0.1.0",
+            "license": "MIT",
+        }
+        substitutions = {
+            **defaults,
+            **substitutions,
+            "package_name": package_name,
+            "template_name": template_name,
+            "python_version": template.python_version,
+            # Feature lists as rendered into README.md and pyproject.toml
+            "features_md": "\n".join(f"- {feature}" for feature in template.features),
+            "features_toml": json.dumps(template.features[:5]),
+        }
 
         # Create target directory
         target_dir.mkdir(parents=True, exist_ok=True)
@@ -551,37 +809,38 @@ class TemplateManager:
         # Skip metadata files
         skip_files = {"template.yaml", "template.json", ".git"}
 
-        for item in template_dir.rglob("*"):
-            if item.name in skip_files or item.is_dir():
-                continue
+        # Replace every "{key}" token in a single pass over the text
+        pattern = re.compile(r"\{(" + "|".join(map(re.escape, substitutions)) + r")\}")
 
-            # Calculate relative path
-            rel_path = item.relative_to(template_dir)
+        def substitute(text: str) -> str:
+            # Most paths and many files hold no placeholder at all
+            if not substitutions or "{" not in text:
+                return text
+            return pattern.sub(lambda match: substitutions[match.group(1)], text)
 
+        created_dirs = set()
+        for source_path, rel_path in _walk_files(template_dir, skip_files):
             # Apply substitutions to path
-            target_path_str = str(rel_path)
-            for key, value in substitutions.items():
-                target_path_str = target_path_str.replace(f"{{{key}}}", value)
-
-            target_path = target_dir / target_path_str
-            target_path.parent.mkdir(parents=True, exist_ok=True)
-
-            # Read and process file content
-            try:
-                content = item.read_text(encoding="utf-8")
-
-                # Apply substitutions to content
-                for key, value in substitutions.items():
-                    content = content.replace(f"{{{key}}}", value)
-
-                # Write processed content
-                target_path.write_text(content, encoding="utf-8")
-                files_created.append(str(target_path))
-
-            except UnicodeDecodeError:
-                # Binary file, copy as-is
-                shutil.copy2(item, target_path)
-                files_created.append(str(target_path))
+            target_path = target_dir / substitute(rel_path)
+            if target_path.parent not in created_dirs:
+                target_path.parent.mkdir(parents=True, exist_ok=True)
+                created_dirs.add(target_path.parent)
+
+            with open(source_path, "rb") as f:
+                data = f.read()
+
+            # Only files that can hold a "{key}" token need decoding; everything
+            # else, binary files included, is written back byte for byte
+            if b"{" in data:
+                try:
+                    data = substitute(data.decode("utf-8")).encode("utf-8")
+                except UnicodeDecodeError:
+                    pass
+
+            target_path.write_bytes(data)
+            # Keep mode bits such as the executable flag on scripts and hooks
+            shutil.copymode(source_path, target_path)
+            files_created.append(str(target_path))
 
         return files_created
 
@@ -589,54 +848,25 @@ class TemplateManager:
         self, template: Template, output_path: Path, substitutions: Dict[str, str]
     ) -> None:
         """Generate pyproject.toml file."""
-        content = f"""[build-system]
-requires = ["setuptools>=69.0.0", "wheel"]
-build-backend = "setuptools.build_meta"
-
-[project]
-name = "{substitutions['package_name']}"
-version = "{substitutions['version']}"
-description = "{substitutions['description']}"
-readme = "README.md"
-requires-python = "{template.python_version}"
-license = {{text = "{substitutions['license']}"}}
-authors = [
-    {{name = "Nik Jois", email = "nikjois@llamasearch.ai"}},
-]
-keywords = {template.features[:5]}
-classifiers = [
-    "Development Status :: 3 - Alpha",
-    "Intended Audience :: Developers",
-    "License :: OSI Approved :: MIT License",
-    "Operating System :: OS Independent",
-    "Programming Language :: Python :: 3",
-    "Programming Language :: Python :: 3.8",
-    "Programming Language :: Python :: 3.9",
-    "Programming Language :: Python :: 3.10",
-    "Programming Language :: Python :: 3.11",
-    "Programming Language :: Python :: 3.12",
-]
-dependencies = {template.dependencies}
-
-[project.optional-dependencies]
-dev = {template.dev_dependencies + ["pytest", "pytest-cov", "black", "flake8"]}
-
-[tool.setuptools]
-packages = ["{substitutions['package_name']}"]
-package-dir = {{"" = "src"}}
-
-[project.urls]
-Homepage = "https://github.com/NikJois/{substitutions['package_name']}"
-Repository = "https://github.com/NikJois/{substitutions['package_name']}"
-Issues = "https://github.com/NikJois/{substitutions['package_name']}/issues"
-"""
+        content = _PYPROJECT_TEMPLATE.substitute(
+            package_name=substitutions["package_name"],
+            version=substitutions["version"],
+            description=substitutions["description"],
+            license=substitutions["license"],
+            python_version=template.python_version,
+            keywords=substitutions["features_toml"],
+            # JSON string arrays are valid TOML, unlike Python's list repr
+            dependencies=json.dumps(template.dependencies),
+            dev_dependencies=json.dumps(
+                template.dev_dependencies + ["pytest", "pytest-cov", "black", "flake8"]
+            ),
+        )
 
         # Add entry points for CLI templates
         if template.category == "cli":
-            content += f"""
-[project.scripts]
-{substitutions['package_name']} = "{substitutions['package_name']}.cli:main"
-"""
+            content += _PYPROJECT_SCRIPTS_TEMPLATE.substitute(
+                package_name=substitutions["package_name"]
+            )
 
         output_path.write_text(content)
 
@@ -644,50 +874,12 @@ Issues = "https://github.com/NikJois/{substitutions['package_name']}/issues"
         self, template: Template, output_path: Path, substitutions: Dict[str, str]
     ) -> None:
         """Generate README.md file."""
-        content = f"""# {substitutions['package_name']}
-
-{substitutions['description']}
-
-## Features
-
-{chr(10).join(f"- {feature}" for feature in template.features)}
-
-## Installation
-
-```bash
-pip install {substitutions['package_name']}
-```
-
-## Usage
-
-```python
-import {substitutions['package_name']}
-
-# Your code here
-```
-
-## Development
-
-1. Clone the repository:
-```bash
-git clone https://github.com/NikJois/{substitutions['package_name']}.git
-cd {substitutions['package_name']}
-```
-
-2. Install development dependencies:
-```bash
-pip install -e .[dev]
-```
-
-3. Run tests:
-```bash
-pytest
-```
-
-## License
-
-{substitutions['license']} License
-"""
+        content = _README_TEMPLATE.substitute(
+            package_name=substitutions["package_name"],
+            description=substitutions["description"],
+            features=substitutions["features_md"],
+            license=substitutions["license"],
+        )
 
         output_path.write_text(content)
 
@@ -3,164 +3,119 @@ Code formatting and style utilities for OpenPypi.
 """
 
 import ast
+import functools
+import hashlib
+import json
+import os
 import re
-import subprocess
-import sys
+import string
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, List, Tuple
 
 from openpypi.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 
-class CodeFormatter:
-    """Formats Python code according to best practices."""
-
-    def __init__(self):
-        self.line_length = 100
-        self.indent_size = 4
-        self.quote_style = "double"
-
-    def format_code(
-        self, code: str, use_black: bool = True, use_isort: bool = True
-    ) -> Tuple[str, List[str]]:
-        """
-        Format Python code using black and isort.
-
-        Args:
-            code: Python code to format
-            use_black: Whether to use black formatter
-            use_isort: Whether to use isort for imports
-
-        Returns:
-            Tuple of (formatted_code, warnings)
-        """
-        warnings = []
-        formatted_code = code
-
-        try:
-            # First, validate syntax
-            ast.parse(code)
-        except SyntaxError as e:
-            warnings.append(f"Syntax error prevents formatting: {e}")
-            return code, warnings
-
-        # Apply isort for import sorting
-        if use_isort:
-            try:
-                formatted_code = self._apply_isort(formatted_code)
-            except Exception as e:
-                warnings.append(f"isort formatting failed: {e}")
-
-        # Apply black for code formatting
-        if use_black:
-            try:
-                formatted_code = self._apply_black(formatted_code)
-            except Exception as e:
-                warnings.append(f"black formatting failed: {e}")
-
-        # Fallback manual formatting if tools fail
-        if warnings and formatted_code == code:
-            formatted_code = self._manual_format(code)
-            warnings.append("Used manual formatting as fallback")
-
-        return formatted_code, warnings
-
-    def _apply_black(self, code: str) -> str:
-        """Apply black formatting."""
-        try:
-            import black
-
-            mode = black.FileMode(
-                line_length=self.line_length, string_normalization=True, is_pyi=False
-            )
-
-            return black.format_str(code, mode=mode)
-
-        except ImportError:
-            logger.warning("black not available, using manual formatting")
-            return self._manual_format(code)
-        except Exception as e:
-            logger.warning(f"black formatting failed: {e}")
-            return code
-
-    def _apply_isort(self, code: str) -> str:
-        """Apply isort for import sorting."""
-        try:
-            import isort
-
-            config = isort.Config(
-                profile="black",
-                line_length=self.line_length,
-                multi_line_output=3,
-                include_trailing_comma=True,
-                force_grid_wrap=0,
-                use_parentheses=True,
-                ensure_newline_before_comments=True,
-            )
-
-            return isort.code(code, config=config)
-
-        except ImportError:
-            logger.warning("isort not available, skipping import sorting")
-            return code
-        except Exception as e:
-            logger.warning(f"isort formatting failed: {e}")
-            return code
-
-    def _manual_format(self, code: str) -> str:
-        """Manual formatting as fallback."""
-        lines = code.split("\n")
-        formatted_lines = []
-        indent_level = 0
-
-        for line in lines:
-            stripped = line.strip()
-            if not stripped:
-                formatted_lines.append("")
-                continue
-
-            # Basic indentation handling
-            if stripped.startswith(("def ", "class ", "if ", "for ", "while ", "with ", "try:")):
-                formatted_lines.append(" " * (indent_level * self.indent_size) + stripped)
-                if stripped.endswith(":"):
-                    indent_level += 1
-            elif stripped in ("else:", "elif ", "except:", "finally:"):
-                indent_level = max(0, indent_level - 1)
-                formatted_lines.append(" " * (indent_level * self.indent_size) + stripped)
-                indent_level += 1
-            elif stripped == "return" or stripped.startswith("return "):
-                formatted_lines.append(" " * (indent_level * self.indent_size) + stripped)
-                indent_level = max(0, indent_level - 1)
-            else:
-                formatted_lines.append(" " * (indent_level * self.indent_size) + stripped)
-
-        return "\n".join(formatted_lines)
-
-
-class ProjectGenerator:
-    """Generates complete Python project structure with templates."""
-
-    def __init__(self):
-        self.formatter = CodeFormatter()
-        self.test_frameworks = {
-            "pytest": self._generate_pytest_test,
-            "unittest": self._generate_unittest_test,
-        }
-
-    def generate_example_usage(self, package_name: str) -> str:
-        """Generate example usage code."""
-        return f"""# Example usage of {package_name}
-from {package_name} import AdvancedClass
-
-instance = AdvancedClass()
-instance.do_something()
-"""
-
-    def _generate_gitignore(self, package_name: str, metadata: Dict[str, Any]) -> str:
-        """Generate .gitignore file."""
-        return """# Byte-compiled / optimized / DLL files
+# Process-wide cache of format_code results, keyed on a digest of the source
+# plus every setting that affects the output. Bounded LRU, oldest evicted.
+_FORMAT_CACHE_SIZE = 1024
+_FORMAT_CACHE: "OrderedDict[tuple, Tuple[str, Tuple[str, ...]]]" = OrderedDict()
+_FORMAT_CACHE_LOCK = threading.Lock()
+
+
+@functools.lru_cache(maxsize=None)
+def _black_formatter(line_length: int):
+    """
+    Return a black formatting callable for the given line length.
+
+    black is imported and its mode built once per line length; None is
+    returned (and cached) when black is not installed.
+    """
+    try:
+        import black
+    except ImportError:
+        return None
+    mode = black.FileMode(line_length=line_length, string_normalization=True, is_pyi=False)
+    return functools.partial(black.format_str, mode=mode)
+
+
+@functools.lru_cache(maxsize=None)
+def _isort_formatter(line_length: int):
+    """
+    Return an isort sorting callable for the given line length.
+
+    isort is imported and its config built once per line length; None is
+    returned (and cached) when isort is not installed.
+    """
+    try:
+        import isort
+    except ImportError:
+        return None
+    config = isort.Config(
+        profile="black",
+        line_length=line_length,
+        multi_line_output=3,
+        include_trailing_comma=True,
+        force_grid_wrap=0,
+        use_parentheses=True,
+        ensure_newline_before_comments=True,
+    )
+    return functools.partial(isort.code, config=config)
+
+
+def _write_file(path: Path, content: str) -> bool:
+    """
+    Create a generated text file as UTF-8 through a single buffered write.
+
+    The file is opened exclusively, so an existing file is never replaced;
+    returns False instead of writing when the path already exists.
+    """
+    try:
+        with open(path, "xb", buffering=65536) as f:
+            f.write(content.encode("utf-8"))
+    except FileExistsError:
+        return False
+    return True
+
+
+@functools.lru_cache(maxsize=256)
+def _render(template: string.Template, **fields: str) -> str:
+    """
+    Fill in a generated file template.
+
+    Generated test files depend only on their string fields, so repeated
+    package/module combinations are served from the cache.
+    """
+    return template.substitute(fields)
+
+
+def _toml_string_array(values: List[str]) -> str:
+    """Render strings as a multi-line TOML array, one quoted entry per line."""
+    if not values:
+        return "[]"
+    # JSON string escaping is valid for TOML basic strings
+    return "[\n" + "".join(f"    {json.dumps(value)},\n" for value in values) + "]"
+
+
+# Line prefixes recognised by CodeFormatter._manual_format
+_BLOCK_STARTS = ("def ", "class ", "if ", "for ", "while ", "with ", "try:")
+_BLOCK_CONTINUATIONS = ("else:", "elif ", "except:", "finally:")
+
+# Classifies a stripped line in one match; alternatives are tried in the same
+# priority order as the branches in _manual_format
+_LINE_KIND_RE = re.compile(
+    r"(?P<block>{})|(?P<continuation>(?:{})\Z)|(?P<close>return(?: |\Z))".format(
+        "|".join(map(re.escape, _BLOCK_STARTS)),
+        "|".join(map(re.escape, _BLOCK_CONTINUATIONS)),
+    )
+)
+
+
+# Static bodies of generated project files, filled in with string.Template
+_GITIGNORE = """# Byte-compiled / optimized / DLL files
 __pycache__/
 *.py[cod]
 *$py.class
@@ -295,75 +250,8 @@ dmypy.json
 Thumbs.db
 """
 
-    def _generate_tests(
-        self, project_dir: Path, package_name: str, modules: List[str], framework: str
-    ) -> Dict[str, Any]:
-        """Generate test files for a package."""
-        results = {"files_created": [], "directories_created": [], "warnings": []}
-
-        tests_dir = project_dir / "tests"
-
-        # Create test directory structure
-        test_dirs = [
-            tests_dir,
-            tests_dir / "unit",
-            tests_dir / "integration",
-            tests_dir / "fixtures",
-        ]
-
-        for test_dir in test_dirs:
-            if not test_dir.exists():
-                test_dir.mkdir(parents=True, exist_ok=True)
-                results["directories_created"].append(str(test_dir.relative_to(project_dir)))
-
-        # Create __init__.py files
-        for test_dir in test_dirs:
-            init_file = test_dir / "__init__.py"
-            if not init_file.exists():
-                init_file.write_text('"""Test package."""\n')
-                results["files_created"].append(str(init_file.relative_to(project_dir)))
-
-        # Create conftest.py
-        conftest_path = tests_dir / "conftest.py"
-        if not conftest_path.exists():
-            conftest_content = self._generate_conftest(package_name, framework)
-            conftest_path.write_text(conftest_content)
-            results["files_created"].append("tests/conftest.py")
-
-        # Generate test files for each module
-        generator = self.test_frameworks.get(framework, self._generate_pytest_test)
-
-        for module in modules:
-            # Unit tests
-            unit_test_path = tests_dir / "unit" / f"test_{module}.py"
-            if not unit_test_path.exists():
-                test_content = generator(package_name, module, "unit")
-                unit_test_path.write_text(test_content)
-                results["files_created"].append(f"tests/unit/test_{module}.py")
-
-            # Integration tests (for main modules)
-            if module in ["core", "main", "__init__"]:
-                integration_test_path = tests_dir / "integration" / f"test_{module}_integration.py"
-                if not integration_test_path.exists():
-                    integration_content = generator(package_name, module, "integration")
-                    integration_test_path.write_text(integration_content)
-                    results["files_created"].append(
-                        f"tests/integration/test_{module}_integration.py"
-                    )
-
-        # Create test fixtures
-        fixtures_path = tests_dir / "fixtures" / "sample_data.py"
-        if not fixtures_path.exists():
-            fixtures_content = self._generate_test_fixtures(package_name)
-            fixtures_path.write_text(fixtures_content)
-            results["files_created"].append("tests/fixtures/sample_data.py")
-
-        return results
 
-    def _generate_conftest(self, package_name: str, framework: str) -> str:
-        """Generate conftest.py for pytest configuration."""
-        if framework == "pytest":
-            return f'''"""Pytest configuration and fixtures."""
+_PYTEST_CONFTEST_TEMPLATE = string.Template('''"""Pytest configuration and fixtures."""
 
 import pytest
 import sys
@@ -373,18 +261,18 @@ from pathlib import Path
 src_dir = Path(__file__).parent.parent / 'src'
 sys.path.insert(0, str(src_dir))
 
-import {package_name}
+import ${package_name}
 
 
 @pytest.fixture
 def sample_data():
     """Provide sample data for tests."""
-    return {{
+    return {
         'string': 'test_string',
         'number': 42,
         'list': [1, 2, 3],
-        'dict': {{'key': 'value'}}
-    }}
+        'dict': {'key': 'value'}
+    }
 
 
 @pytest.fixture
@@ -398,11 +286,11 @@ def temp_file(tmp_path):
 @pytest.fixture
 def mock_config():
     """Provide mock configuration for tests."""
-    return {{
+    return {
         'debug': True,
         'timeout': 30,
         'retries': 3
-    }}
+    }
 
 
 class MockResponse:
@@ -417,16 +305,17 @@ class MockResponse:
     
     def raise_for_status(self):
         if self.status_code >= 400:
-            raise Exception(f"HTTP {{self.status_code}}")
+            raise Exception(f"HTTP {self.status_code}")
 
 
 @pytest.fixture
 def mock_response():
     """Provide mock HTTP response."""
-    return MockResponse({{'result': 'success'}})
-'''
-        else:
-            return f'''"""Test configuration for unittest."""
+    return MockResponse({'result': 'success'})
+''')
+
+
+_UNITTEST_CONFTEST_TEMPLATE = string.Template('''"""Test configuration for unittest."""
 
 import unittest
 import sys
@@ -436,7 +325,7 @@ from pathlib import Path
 src_dir = Path(__file__).parent.parent / 'src'
 sys.path.insert(0, str(src_dir))
 
-import {package_name}
+import ${package_name}
 
 
 class BaseTestCase(unittest.TestCase):
@@ -444,35 +333,34 @@ class BaseTestCase(unittest.TestCase):
     
     def setUp(self):
         """Set up test fixtures."""
-        self.sample_data = {{
+        self.sample_data = {
             'string': 'test_string',
             'number': 42,
             'list': [1, 2, 3],
-            'dict': {{'key': 'value'}}
-        }}
+            'dict': {'key': 'value'}
+        }
     
     def tearDown(self):
         """Clean up after tests."""
         pass
-'''
+''')
 
-    def _generate_pytest_test(self, package_name: str, module: str, test_type: str) -> str:
-        """Generate pytest test file."""
-        if test_type == "unit":
-            return f'''"""Unit tests for {package_name}.{module} module."""
+
+_PYTEST_UNIT_TEST_TEMPLATE = string.Template(
+    '''"""Unit tests for ${package_name}.${module} module."""
 
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 
-from {package_name} import {module}
+from ${package_name} import ${module}
 
 
-class Test{module.title()}:
-    """Test cases for {module} module."""
+class Test${module_title}:
+    """Test cases for ${module} module."""
     
     def test_import(self):
         """Test that module can be imported."""
-        assert {module} is not None
+        assert ${module} is not None
     
     def test_basic_functionality(self, sample_data):
         """Test basic functionality."""
@@ -491,7 +379,7 @@ class Test{module.title()}:
         # TODO: Test edge cases
         assert True
     
-    @patch('{package_name}.{module}.external_dependency')
+    @patch('${package_name}.${module}.external_dependency')
     def test_with_mock(self, mock_dependency):
         """Test with mocked dependencies."""
         mock_dependency.return_value = "mocked_result"
@@ -509,20 +397,22 @@ class Test{module.title()}:
         assert input_value is not None
         assert expected is not None
 '''
+)
 
-        else:  # integration tests
-            return f'''"""Integration tests for {package_name}.{module} module."""
+
+_PYTEST_INTEGRATION_TEST_TEMPLATE = string.Template(
+    '''"""Integration tests for ${package_name}.${module} module."""
 
 import pytest
 import tempfile
 import os
 from pathlib import Path
 
-from {package_name} import {module}
+from ${package_name} import ${module}
 
 
-class Test{module.title()}Integration:
-    """Integration test cases for {module} module."""
+class Test${module_title}Integration:
+    """Integration test cases for ${module} module."""
     
     def test_full_workflow(self):
         """Test complete workflow integration."""
@@ -542,10 +432,11 @@ class Test{module.title()}Integration:
         # TODO: Test external integrations
         assert True
 '''
+)
 
-    def _generate_unittest_test(self, package_name: str, module: str, test_type: str) -> str:
-        """Generate unittest test file."""
-        return f'''"""Unit tests for {package_name}.{module} module using unittest."""
+
+_UNITTEST_TEST_TEMPLATE = string.Template(
+    '''"""Unit tests for ${package_name}.${module} module using unittest."""
 
 import unittest
 from unittest.mock import Mock, patch, MagicMock
@@ -555,20 +446,20 @@ from pathlib import Path
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src'))
 
-from {package_name} import {module}
+from ${package_name} import ${module}
 
 
-class Test{module.title()}(unittest.TestCase):
-    """Test cases for {module} module."""
+class Test${module_title}(unittest.TestCase):
+    """Test cases for ${module} module."""
     
     def setUp(self):
         """Set up test fixtures before each test method."""
-        self.sample_data = {{
+        self.sample_data = {
             'string': 'test_string',
             'number': 42,
             'list': [1, 2, 3],
-            'dict': {{'key': 'value'}}
-        }}
+            'dict': {'key': 'value'}
+        }
     
     def tearDown(self):
         """Clean up after each test method."""
@@ -576,7 +467,7 @@ class Test{module.title()}(unittest.TestCase):
     
     def test_import(self):
         """Test that module can be imported."""
-        self.assertIsNotNone({module})
+        self.assertIsNotNone(${module})
     
     def test_basic_functionality(self):
         """Test basic functionality."""
@@ -587,10 +478,11 @@ class Test{module.title()}(unittest.TestCase):
 if __name__ == '__main__':
     unittest.main()
 '''
+)
 
-    def _generate_test_fixtures(self, package_name: str) -> str:
-        """Generate test fixtures file."""
-        return f'''"""Test fixtures and sample data for {package_name} tests."""
+
+_TEST_FIXTURES_TEMPLATE = string.Template(
+    '''"""Test fixtures and sample data for ${package_name} tests."""
 
 import json
 from pathlib import Path
@@ -603,118 +495,53 @@ class SampleData:
     @staticmethod
     def get_simple_config() -> Dict[str, Any]:
         """Get simple configuration data."""
-        return {{
+        return {
             'debug': True,
             'timeout': 30,
             'retries': 3,
-            'endpoints': {{
+            'endpoints': {
                 'api': 'https://api.example.com',
                 'auth': 'https://auth.example.com'
-            }}
-        }}
+            }
+        }
     
     @staticmethod
     def get_user_data() -> List[Dict[str, Any]]:
         """Get sample user data."""
         return [
-            {{
+            {
                 'id': 1,
                 'name': 'John Doe',
                 'email': 'john@example.com',
                 'active': True
-            }},
-            {{
+            },
+            {
                 'id': 2,
                 'name': 'Jane Smith',
                 'email': 'jane@example.com',
                 'active': False
-            }}
+            }
         ]
 '''
+)
 
 
-class ConfigFormatter:
-    """Formats and generates configuration files."""
-
-    def __init__(self):
-        self.config_formats = {
-            "toml": self._generate_toml_config,
-            "yaml": self._generate_yaml_config,
-            "json": self._generate_json_config,
-            "ini": self._generate_ini_config,
-        }
-
-    def generate_config_files(
-        self,
-        project_dir: Path,
-        package_name: str,
-        metadata: Dict[str, Any],
-        formats: List[str] = None,
-    ) -> Dict[str, Any]:
-        """Generate configuration files in specified formats."""
-        if formats is None:
-            formats = ["toml"]
-
-        results = {"files_created": [], "directories_created": [], "warnings": []}
-
-        for format_type in formats:
-            if format_type in self.config_formats:
-                try:
-                    format_results = self.config_formats[format_type](
-                        project_dir, package_name, metadata
-                    )
-                    results["files_created"].extend(format_results.get("files_created", []))
-                    results["directories_created"].extend(
-                        format_results.get("directories_created", [])
-                    )
-                    results["warnings"].extend(format_results.get("warnings", []))
-                except Exception as e:
-                    results["warnings"].append(f"Failed to generate {format_type} config: {e}")
-            else:
-                results["warnings"].append(f"Unknown config format: {format_type}")
-
-        return results
-
-    def _generate_toml_config(
-        self, project_dir: Path, package_name: str, metadata: Dict[str, Any]
-    ) -> Dict[str, Any]:
-        """Generate TOML configuration files."""
-        results = {"files_created": [], "directories_created": [], "warnings": []}
-
-        # pyproject.toml (main project configuration)
-        pyproject_path = project_dir / "pyproject.toml"
-        if not pyproject_path.exists():
-            pyproject_content = self._generate_pyproject_toml(package_name, metadata)
-            pyproject_path.write_text(pyproject_content)
-            results["files_created"].append("pyproject.toml")
-
-        return results
-
-    def _generate_pyproject_toml(self, package_name: str, metadata: Dict[str, Any]) -> str:
-        """Generate pyproject.toml content."""
-        author = metadata.get("author", "Unknown Author")
-        email = metadata.get("email", "author@example.com")
-        description = metadata.get("description", f"{package_name} package")
-        license_name = metadata.get("license", "MIT")
-        python_requires = metadata.get("python_requires", ">=3.8")
-        dependencies = metadata.get("dependencies", [])
-
-        return f"""[build-system]
+_PYPROJECT_TOML_TEMPLATE = string.Template("""[build-system]
 requires = ["setuptools>=69.0.0", "wheel", "setuptools-scm>=8.0"]
 build-backend = "setuptools.build_meta"
 
 [project]
-name = "{package_name}"
+name = "${package_name}"
 dynamic = ["version"]
-description = "{description}"
+description = "${description}"
 readme = "README.md"
-requires-python = "{python_requires}"
-license = {{text = "{license_name}"}}
+requires-python = "${python_requires}"
+license = {text = "${license_name}"}
 authors = [
-    {{name = "{author}", email = "{email}"}},
+    {name = "${author}", email = "${email}"},
 ]
 maintainers = [
-    {{name = "{author}", email = "{email}"}},
+    {name = "${author}", email = "${email}"},
 ]
 keywords = [
     "python",
@@ -724,7 +551,7 @@ keywords = [
 classifiers = [
     "Development Status :: 4 - Beta",
     "Intended Audience :: Developers",
-    "License :: OSI Approved :: {license_name} License",
+    "License :: OSI Approved :: ${license_name} License",
     "Operating System :: OS Independent",
     "Programming Language :: Python :: 3",
     "Programming Language :: Python :: 3.8",
@@ -733,7 +560,7 @@ classifiers = [
     "Programming Language :: Python :: 3.11",
     "Programming Language :: Python :: 3.12",
 ]
-dependencies = {dependencies}
+dependencies = ${dependencies}
 
 [project.optional-dependencies]
 dev = [
@@ -752,11 +579,11 @@ test = [
 ]
 
 [project.urls]
-Homepage = "https://github.com/{author}/{package_name}"
-Repository = "https://github.com/{author}/{package_name}.git"
+Homepage = "https://github.com/${author}/${package_name}"
+Repository = "https://github.com/${author}/${package_name}.git"
 
 [tool.setuptools]
-package-dir = {{"" = "src"}}
+package-dir = {"" = "src"}
 
 [tool.setuptools.packages.find]
 where = ["src"]
@@ -775,10 +602,404 @@ addopts = "-ra -q --strict-markers --strict-config"
 testpaths = ["tests"]
 
 [tool.coverage.run]
-source = ["{package_name}"]
+source = ["${package_name}"]
 omit = ["tests/*"]
+""")
+
+
+class CodeFormatter:
+    """Formats Python code according to best practices."""
+
+    def __init__(self):
+        self.line_length = 100
+        self.indent_size = 4
+        self.quote_style = "double"
+
+    def format_code(
+        self, code: str, use_black: bool = True, use_isort: bool = True
+    ) -> Tuple[str, List[str]]:
+        """
+        Format Python code using black and isort.
+
+        Args:
+            code: Python code to format
+            use_black: Whether to use black formatter
+            use_isort: Whether to use isort for imports
+
+        Returns:
+            Tuple of (formatted_code, warnings)
+        """
+        key = (
+            hashlib.blake2b(code.encode("utf-8", "surrogatepass"), digest_size=16).digest(),
+            use_black,
+            use_isort,
+            self.line_length,
+            self.indent_size,
+        )
+        with _FORMAT_CACHE_LOCK:
+            cached = _FORMAT_CACHE.get(key)
+            if cached is not None:
+                _FORMAT_CACHE.move_to_end(key)
+        if cached is not None:
+            return cached[0], list(cached[1])
+
+        formatted_code, warnings = self._format_code(code, use_black, use_isort)
+
+        with _FORMAT_CACHE_LOCK:
+            _FORMAT_CACHE[key] = (formatted_code, tuple(warnings))
+            if len(_FORMAT_CACHE) > _FORMAT_CACHE_SIZE:
+                _FORMAT_CACHE.popitem(last=False)
+        return formatted_code, warnings
+
+    def _format_code(self, code: str, use_black: bool, use_isort: bool) -> Tuple[str, List[str]]:
+        """Format code without consulting the result cache."""
+        warnings = []
+        formatted_code = code
+
+        # black parses the source itself and rejects invalid input, so a
+        # separate syntax check is only needed when black will not run
+        if not use_black or _black_formatter(self.line_length) is None:
+            try:
+                ast.parse(code)
+            except SyntaxError as e:
+                warnings.append(f"Syntax error prevents formatting: {e}")
+                return code, warnings
+
+        # Apply isort for import sorting
+        if use_isort:
+            try:
+                formatted_code = self._apply_isort(formatted_code)
+            except Exception as e:
+                warnings.append(f"isort formatting failed: {e}")
+
+        # Apply black for code formatting
+        if use_black:
+            try:
+                formatted_code = self._apply_black(formatted_code)
+            except SyntaxError as e:
+                return code, [f"Syntax error prevents formatting: {e}"]
+            except Exception as e:
+                warnings.append(f"black formatting failed: {e}")
+
+        # Fallback manual formatting if tools fail
+        if warnings and formatted_code == code:
+            formatted_code = self._manual_format(code)
+            warnings.append("Used manual formatting as fallback")
+
+        return formatted_code, warnings
+
+    def format_many(
+        self, codes: List[str], use_black: bool = True, use_isort: bool = True
+    ) -> List[Tuple[str, List[str]]]:
+        """
+        Format several Python sources in one pass.
+
+        The black mode and isort config are shared by every source in the
+        batch, so formatting a generated project does no per-file setup.
+
+        Args:
+            codes: Python sources to format
+            use_black: Whether to use black formatter
+            use_isort: Whether to use isort for imports
+
+        Returns:
+            List of (formatted_code, warnings) tuples, in input order
+        """
+        return [self.format_code(code, use_black, use_isort) for code in codes]
+
+    def _apply_black(self, code: str) -> str:
+        """Apply black formatting."""
+        format_str = _black_formatter(self.line_length)
+        if format_str is None:
+            logger.warning("black not available, using manual formatting")
+            return self._manual_format(code)
+
+        try:
+            return format_str(code)
+        except ValueError as e:
+            # black.InvalidInput: the source does not parse
+            raise SyntaxError(str(e)) from e
+        except Exception as e:
+            logger.warning(f"black formatting failed: {e}")
+            return code
+
+    def _apply_isort(self, code: str) -> str:
+        """Apply isort for import sorting."""
+        sort_code = _isort_formatter(self.line_length)
+        if sort_code is None:
+            logger.warning("isort not available, skipping import sorting")
+            return code
+
+        try:
+            return sort_code(code)
+        except Exception as e:
+            logger.warning(f"isort formatting failed: {e}")
+            return code
+
+    def _manual_format(self, code: str) -> str:
+        """Manual formatting as fallback."""
+        formatted_lines = []
+        append = formatted_lines.append
+        # Indent strings are built once per level rather than once per line
+        unit = " " * self.indent_size
+        indents = [""]
+        indent_level = 0
+
+        for line in code.split("\n"):
+            stripped = line.strip()
+            if not stripped:
+                append("")
+                continue
+
+            # Basic indentation handling
+            match = _LINE_KIND_RE.match(stripped)
+            kind = match.lastgroup if match else None
+            if kind == "block":
+                append(indents[indent_level] + stripped)
+                if stripped.endswith(":"):
+                    indent_level += 1
+            elif kind == "continuation":
+                indent_level = max(0, indent_level - 1)
+                append(indents[indent_level] + stripped)
+                indent_level += 1
+            elif kind == "close":
+                append(indents[indent_level] + stripped)
+                indent_level = max(0, indent_level - 1)
+            else:
+                append(indents[indent_level] + stripped)
+
+            # Levels only ever grow by one per line
+            if indent_level == len(indents):
+                indents.append(indents[-1] + unit)
+
+        return "\n".join(formatted_lines)
+
+
+class ProjectGenerator:
+    """Generates complete Python project structure with templates."""
+
+    def __init__(self):
+        self.formatter = CodeFormatter()
+        self.test_frameworks = {
+            "pytest": self._generate_pytest_test,
+            "unittest": self._generate_unittest_test,
+        }
+
+    def generate_example_usage(self, package_name: str) -> str:
+        """Generate example usage code."""
+        return f"""# Example usage of {package_name}
+from {package_name} import AdvancedClass
+
+instance = AdvancedClass()
+instance.do_something()
 """
 
+    def _generate_gitignore(self, package_name: str, metadata: Dict[str, Any]) -> str:
+        """Generate .gitignore file."""
+        return _GITIGNORE
+
+    def _generate_tests(
+        self, project_dir: Path, package_name: str, modules: List[str], framework: str
+    ) -> Dict[str, Any]:
+        """Generate test files for a package."""
+        results = {"files_created": [], "directories_created": [], "warnings": []}
+
+        tests_dir = project_dir / "tests"
+
+        # Create test directory structure
+        test_dirs = [
+            tests_dir,
+            tests_dir / "unit",
+            tests_dir / "integration",
+            tests_dir / "fixtures",
+        ]
+
+        # Create missing directories and list pre-existing ones once; the
+        # existence checks below are then set lookups, not a stat per file.
+        # Files are still created exclusively in case one appears meanwhile.
+        existing = {}
+        for test_dir in test_dirs:
+            try:
+                test_dir.mkdir(parents=True)
+            except FileExistsError:
+                with os.scandir(test_dir) as entries:
+                    existing[test_dir] = {entry.name for entry in entries}
+            else:
+                # A directory that was just created has nothing to list
+                existing[test_dir] = set()
+                results["directories_created"].append(str(test_dir.relative_to(project_dir)))
+
+        # Create __init__.py files
+        for test_dir in test_dirs:
+            init_file = test_dir / "__init__.py"
+            if init_file.name not in existing[test_dir]:
+                if _write_file(init_file, '"""Test package."""\n'):
+                    results["files_created"].append(str(init_file.relative_to(project_dir)))
+
+        # Create conftest.py
+        conftest_path = tests_dir / "conftest.py"
+        if conftest_path.name not in existing[tests_dir]:
+            conftest_content = self._generate_conftest(package_name, framework)
+            if _write_file(conftest_path, conftest_content):
+                results["files_created"].append("tests/conftest.py")
+
+        # Generate test files for each module
+        generator = self.test_frameworks.get(framework, self._generate_pytest_test)
+
+        unit_tests = existing[tests_dir / "unit"]
+        integration_tests = existing[tests_dir / "integration"]
+        for module in modules:
+            # Unit tests
+            unit_test_path = tests_dir / "unit" / f"test_{module}.py"
+            if unit_test_path.name not in unit_tests:
+                test_content = generator(package_name, module, "unit")
+                unit_tests.add(unit_test_path.name)
+                if _write_file(unit_test_path, test_content):
+                    results["files_created"].append(f"tests/unit/test_{module}.py")
+
+            # Integration tests (for main modules)
+            if module in ["core", "main", "__init__"]:
+                integration_test_path = tests_dir / "integration" / f"test_{module}_integration.py"
+                if integration_test_path.name not in integration_tests:
+                    integration_content = generator(package_name, module, "integration")
+                    integration_tests.add(integration_test_path.name)
+                    if _write_file(integration_test_path, integration_content):
+                        results["files_created"].append(
+                            f"tests/integration/test_{module}_integration.py"
+                        )
+
+        # Create test fixtures
+        fixtures_path = tests_dir / "fixtures" / "sample_data.py"
+        if fixtures_path.name not in existing[tests_dir / "fixtures"]:
+            fixtures_content = self._generate_test_fixtures(package_name)
+            if _write_file(fixtures_path, fixtures_content):
+                results["files_created"].append("tests/fixtures/sample_data.py")
+
+        return results
+
+    def _generate_conftest(self, package_name: str, framework: str) -> str:
+        """Generate conftest.py for pytest configuration."""
+        if framework == "pytest":
+            return _render(_PYTEST_CONFTEST_TEMPLATE, package_name=package_name)
+        else:
+            return _render(_UNITTEST_CONFTEST_TEMPLATE, package_name=package_name)
+
+    def _generate_pytest_test(self, package_name: str, module: str, test_type: str) -> str:
+        """Generate pytest test file."""
+        if test_type == "unit":
+            return _render(
+                _PYTEST_UNIT_TEST_TEMPLATE,
+                package_name=package_name,
+                module=module,
+                module_title=module.title(),
+            )
+
+        else:  # integration tests
+            return _render(
+                _PYTEST_INTEGRATION_TEST_TEMPLATE,
+                package_name=package_name,
+                module=module,
+                module_title=module.title(),
+            )
+
+    def _generate_unittest_test(self, package_name: str, module: str, test_type: str) -> str:
+        """Generate unittest test file."""
+        return _render(
+            _UNITTEST_TEST_TEMPLATE,
+            package_name=package_name,
+            module=module,
+            module_title=module.title(),
+        )
+
+    def _generate_test_fixtures(self, package_name: str) -> str:
+        """Generate test fixtures file."""
+        return _render(_TEST_FIXTURES_TEMPLATE, package_name=package_name)
+
+
+class ConfigFormatter:
+    """Formats and generates configuration files."""
+
+    def __init__(self):
+        self.config_formats = {
+            "toml": self._generate_toml_config,
+            "yaml": self._generate_yaml_config,
+            "json": self._generate_json_config,
+            "ini": self._generate_ini_config,
+        }
+
+    def generate_config_files(
+        self,
+        project_dir: Path,
+        package_name: str,
+        metadata: Dict[str, Any],
+        formats: List[str] = None,
+    ) -> Dict[str, Any]:
+        """Generate configuration files in specified formats."""
+        # The default single format needs no merging of per-format results
+        if formats is None or formats == ["toml"]:
+            try:
+                return self.config_formats["toml"](project_dir, package_name, metadata)
+            except Exception as e:
+                return {
+                    "files_created": [],
+                    "directories_created": [],
+                    "warnings": [f"Failed to generate toml config: {e}"],
+                }
+
+        results = {"files_created": [], "directories_created": [], "warnings": []}
+
+        for format_type in formats:
+            if format_type in self.config_formats:
+                try:
+                    format_results = self.config_formats[format_type](
+                        project_dir, package_name, metadata
+                    )
+                    results["files_created"].extend(format_results.get("files_created", []))
+                    results["directories_created"].extend(
+                        format_results.get("directories_created", [])
+                    )
+                    results["warnings"].extend(format_results.get("warnings", []))
+                except Exception as e:
+                    results["warnings"].append(f"Failed to generate {format_type} config: {e}")
+            else:
+                results["warnings"].append(f"Unknown config format: {format_type}")
+
+        return results
+
+    def _generate_toml_config(
+        self, project_dir: Path, package_name: str, metadata: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Generate TOML configuration files."""
+        results = {"files_created": [], "directories_created": [], "warnings": []}
+
+        # pyproject.toml (main project configuration)
+        pyproject_path = project_dir / "pyproject.toml"
+        if not pyproject_path.exists():
+            pyproject_content = self._generate_pyproject_toml(package_name, metadata)
+            pyproject_path.write_text(pyproject_content)
+            results["files_created"].append("pyproject.toml")
+
+        return results
+
+    def _generate_pyproject_toml(self, package_name: str, metadata: Dict[str, Any]) -> str:
+        """Generate pyproject.toml content."""
+        author = metadata.get("author", "Unknown Author")
+        email = metadata.get("email", "author@example.com")
+        description = metadata.get("description", f"{package_name} package")
+        license_name = metadata.get("license", "MIT")
+        python_requires = metadata.get("python_requires", ">=3.8")
+        dependencies = metadata.get("dependencies", [])
+
+        return _PYPROJECT_TOML_TEMPLATE.substitute(
+            package_name=package_name,
+            author=author,
+            email=email,
+            description=description,
+            license_name=license_name,
+            python_requires=python_requires,
+            dependencies=_toml_string_array(dependencies),
+        )
+
     def _generate_yaml_config(
         self, project_dir: Path, package_name: str, metadata: Dict[str, Any]
     ) -> Dict[str, Any]:
@@ -3,10 +3,34 @@ Logging utilities for OpenPypi.
 """
 
 import logging
+import logging.handlers
 import sys
 from pathlib import Path
 from typing import Optional, Union
 
+_DEFAULT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+_DEFAULT_FORMATTER = logging.Formatter(_DEFAULT_FORMAT)
+
+# Log files rotate rather than growing without bound
+_LOG_FILE_MAX_BYTES = 10 * 1024 * 1024
+_LOG_FILE_BACKUP_COUNT = 3
+
+# Console handler shared by every logger using the default format. It is left
+# at NOTSET so each logger's own level decides what reaches it.
+_SHARED_CONSOLE_HANDLER = logging.StreamHandler(sys.stdout)
+_SHARED_CONSOLE_HANDLER.setFormatter(_DEFAULT_FORMATTER)
+
+
+def _make_file_handler(log_path: Path) -> logging.Handler:
+    """Create a rotating file handler that opens its file on first emit."""
+    return logging.handlers.RotatingFileHandler(
+        log_path,
+        maxBytes=_LOG_FILE_MAX_BYTES,
+        backupCount=_LOG_FILE_BACKUP_COUNT,
+        encoding="utf-8",
+        delay=True,
+    )
+
 
 def get_logger(
     name: str,
@@ -37,24 +61,23 @@ def get_logger(
         level = getattr(logging, level.upper())
     logger.setLevel(level)
 
-    # Default format
+    # Console handler; loggers with the default format share a single one
     if format_string is None:
-        format_string = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-
-    formatter = logging.Formatter(format_string)
-
-    # Console handler
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(level)
-    console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+        formatter = _DEFAULT_FORMATTER
+        logger.addHandler(_SHARED_CONSOLE_HANDLER)
+    else:
+        formatter = logging.Formatter(format_string)
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setLevel(level)
+        console_handler.setFormatter(formatter)
+        logger.addHandler(console_handler)
 
     # File handler if specified
     if log_file:
         log_path = Path(log_file)
         log_path.parent.mkdir(parents=True, exist_ok=True)
 
-        file_handler = logging.FileHandler(log_path)
+        file_handler = _make_file_handler(log_path)
         file_handler.setLevel(level)
         file_handler.setFormatter(formatter)
         logger.addHandler(file_handler)
@@ -81,7 +104,7 @@ def setup_logging(
 
     # Default format
     if format_string is None:
-        format_string = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+        format_string = _DEFAULT_FORMAT
 
     # Basic config
     handlers = [logging.StreamHandler(sys.stdout)]
@@ -90,6 +113,6 @@ def setup_logging(
     if log_file:
         log_path = Path(log_file)
         log_path.parent.mkdir(parents=True, exist_ok=True)
-        handlers.append(logging.FileHandler(log_path))
+        handlers.append(_make_file_handler(log_path))
 
     logging.basicConfig(level=level, format=format_string, handlers=handlers)
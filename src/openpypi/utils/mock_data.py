@@ -2,89 +2,102 @@
 Secure mock data generation for testing and development.
 """
 
-import os
 import random
-import secrets
+import time
 from datetime import datetime, timedelta
-from typing import Any, Dict, List
-
-from faker import Faker
-from pydantic import BaseModel, SecretStr
-
-fake = Faker()
-
-
-class SecureMockUser(BaseModel):
-    id: str
-    username: str
-    email: str
-    api_key: SecretStr
-    hashed_password: SecretStr
+from typing import Any, Dict, Iterator, List, Tuple
+
+_PROJECT_TYPES = ("library", "web_api", "cli_tool", "data_science", "ml_toolkit")
+
+# created_at offsets for mock rows, built once and drawn from directly
+_USER_AGES = tuple(timedelta(days=days) for days in range(1, 366))
+_PROJECT_AGES = _USER_AGES[:100]
+# Ages are drawn in batches of this size so streaming callers use bounded memory
+_AGE_BATCH_SIZE = 1024
+
+
+# Static mock project configuration, copied out by generate_mock_config
+_MOCK_CONFIG = {
+    "project_name": "test-project",
+    "package_name": "test_project",
+    "author": "Test Author",
+    "email": "demo@openpypi.dev",
+    "description": "A test project for OpenPypi",
+    "version": "0.1.0",
+    "license": "MIT",
+    "python_requires": ">=3.8",
+    "use_fastapi": True,
+    "use_docker": True,
+    "use_openai": False,
+    "create_tests": True,
+    "use_git": True,
+    "use_github_actions": True,
+    "test_framework": "pytest",
+}
+
+
+def _iter_ages(ages: Tuple[timedelta, ...], count: int) -> Iterator[timedelta]:
+    """Yield count random ages, drawn in fixed-size batches to bound memory."""
+    while count > 0:
+        batch = min(count, _AGE_BATCH_SIZE)
+        yield from random.choices(ages, k=batch)
+        count -= batch
+
+
+def iter_mock_users(count: int = 3) -> Iterator[Dict[str, Any]]:
+    """Lazily yield mock user data, for consumers that stream large counts."""
+    now = datetime.now()
+    for i, age in enumerate(_iter_ages(_USER_AGES, count)):
+        # Format the row number once and concatenate; cheaper than repeated f-strings
+        s = str(i + 1)
+        yield {
+            "id": i + 1,
+            "username": "user" + s,
+            "email": "user" + s + "@example.com",
+            "full_name": "Test User " + s,
+            "created_at": now - age,
+            "is_active": True,
+            "role": "user" if i else "admin",
+        }
 
 
 def generate_mock_users(count: int = 3) -> List[Dict[str, Any]]:
     """Generate mock user data for testing."""
-    users = []
-    for i in range(count):
-        users.append(
-            {
-                "id": i + 1,
-                "username": f"user{i + 1}",
-                "email": f"user{i + 1}@example.com",
-                "full_name": f"Test User {i + 1}",
-                "created_at": datetime.now() - timedelta(days=random.randint(1, 365)),
-                "is_active": True,
-                "role": "user" if i > 0 else "admin",
-            }
-        )
-    return users
+    return list(iter_mock_users(count))
+
+
+def iter_mock_projects(count: int = 5) -> Iterator[Dict[str, Any]]:
+    """Lazily yield mock project data, for consumers that stream large counts."""
+    now = datetime.now()
+    num_types = len(_PROJECT_TYPES)
+    for i, age in enumerate(_iter_ages(_PROJECT_AGES, count)):
+        s = str(i + 1)
+        yield {
+            "id": i + 1,
+            "name": "project" + s,
+            "package_name": "project_" + s,
+            "description": "Test project " + s + " description",
+            "author": "Author " + s,
+            "email": "author" + s + "@openpypi.dev",
+            "version": "0." + s + ".0",
+            "project_type": _PROJECT_TYPES[i % num_types],
+            "use_fastapi": not i & 1,
+            "use_docker": i % 3 == 0,
+            "use_openai": not i & 3,
+            "created_at": now - age,
+            "status": "active" if i % 5 != 4 else "archived",
+        }
 
 
 def generate_mock_projects(count: int = 5) -> List[Dict[str, Any]]:
     """Generate mock project data for testing."""
-    projects = []
-    project_types = ["library", "web_api", "cli_tool", "data_science", "ml_toolkit"]
-
-    for i in range(count):
-        projects.append(
-            {
-                "id": i + 1,
-                "name": f"project{i + 1}",
-                "package_name": f"project_{i + 1}",
-                "description": f"Test project {i + 1} description",
-                "author": f"Author {i + 1}",
-                "email": f"author{i + 1}@openpypi.dev",
-                "version": f"0.{i + 1}.0",
-                "project_type": project_types[i % len(project_types)],
-                "use_fastapi": i % 2 == 0,
-                "use_docker": i % 3 == 0,
-                "use_openai": i % 4 == 0,
-                "created_at": datetime.now() - timedelta(days=random.randint(1, 100)),
-                "status": "active" if i % 5 != 4 else "archived",
-            }
-        )
-    return projects
+    return list(iter_mock_projects(count))
 
 
 def generate_mock_config() -> Dict[str, Any]:
     """Generate mock configuration data."""
-    return {
-        "project_name": "test-project",
-        "package_name": "test_project",
-        "author": "Test Author",
-        "email": "demo@openpypi.dev",
-        "description": "A test project for OpenPypi",
-        "version": "0.1.0",
-        "license": "MIT",
-        "python_requires": ">=3.8",
-        "use_fastapi": True,
-        "use_docker": True,
-        "use_openai": False,
-        "create_tests": True,
-        "use_git": True,
-        "use_github_actions": True,
-        "test_framework": "pytest",
-    }
+    # The values are all immutable, so a shallow copy is independent
+    return dict(_MOCK_CONFIG)
 
 
 def generate_mock_api_response() -> Dict[str, Any]:
@@ -107,7 +120,7 @@ def generate_mock_openai_response() -> Dict[str, Any]:
     return {
         "id": "chatcmpl-test123",
         "object": "chat.completion",
-        "created": int(datetime.now().timestamp()),
+        "created": int(time.time()),
         "model": "gpt-3.5-turbo",
         "choices": [
             {
@@ -1,162 +1,247 @@
 """Monitoring utilities for OpenPypi."""
 
+import asyncio
+import threading
 import time
-from datetime import datetime
-from typing import Any, Dict
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
 
 import psutil
 
 from .logger import get_logger
 
+if TYPE_CHECKING:
+    from ..api.middleware import MiddlewareMetrics
+
 logger = get_logger(__name__)
 
+# cpu_percent(interval=None) reports usage since the previous call; prime it
+# here so the first scrape has a baseline instead of sleeping for a sample
+psutil.cpu_percent(interval=None)
 
-def get_system_metrics() -> Dict[str, Any]:
-    """Get system performance metrics."""
-    try:
-        # CPU metrics
-        cpu_percent = psutil.cpu_percent(interval=1)
-        cpu_count = psutil.cpu_count()
-        cpu_freq = psutil.cpu_freq()
+# The logical CPU count does not change while the process runs
+_CPU_COUNT = psutil.cpu_count()
 
-        # Memory metrics
-        memory = psutil.virtual_memory()
-        swap = psutil.swap_memory()
+# Concurrent scrapes within this many seconds share one metrics snapshot
+_SYSTEM_METRICS_TTL = 0.5
+_system_metrics_snapshot: Optional[Tuple[float, Dict[str, Any]]] = None
+_system_metrics_lock = threading.Lock()
 
-        # Disk metrics
-        disk = psutil.disk_usage("/")
-        disk_io = psutil.disk_io_counters()
 
-        # Network metrics
-        network_io = psutil.net_io_counters()
+def _now_iso() -> str:
+    """Return the current UTC time as an ISO 8601 string."""
+    return datetime.now(timezone.utc).isoformat()
 
-        return {
-            "cpu_percent": cpu_percent,
-            "cpu_count": cpu_count,
-            "cpu_frequency": {
-                "current": cpu_freq.current if cpu_freq else None,
-                "min": cpu_freq.min if cpu_freq else None,
-                "max": cpu_freq.max if cpu_freq else None,
-            },
-            "memory_percent": memory.percent,
-            "memory_available": memory.available,
-            "memory_used": memory.used,
-            "memory_total": memory.total,
-            "swap_percent": swap.percent,
-            "swap_used": swap.used,
-            "swap_total": swap.total,
-            "disk_usage": {
-                "total": disk.total,
-                "used": disk.used,
-                "free": disk.free,
-                "percent": (disk.used / disk.total) * 100,
-            },
-            "disk_io": {
-                "read_bytes": disk_io.read_bytes if disk_io else 0,
-                "write_bytes": disk_io.write_bytes if disk_io else 0,
-                "read_count": disk_io.read_count if disk_io else 0,
-                "write_count": disk_io.write_count if disk_io else 0,
-            },
-            "network_io": {
-                "bytes_sent": network_io.bytes_sent,
-                "bytes_recv": network_io.bytes_recv,
-                "packets_sent": network_io.packets_sent,
-                "packets_recv": network_io.packets_recv,
-            },
-            "timestamp": datetime.utcnow().isoformat(),
-        }
-    except Exception as e:
-        logger.error(f"Error getting system metrics: {e}")
-        return {"error": str(e), "timestamp": datetime.utcnow().isoformat()}
+
+def get_system_metrics() -> Dict[str, Any]:
+    """
+    Get system performance metrics.
+
+    Snapshots are reused for a short TTL so that concurrent callers share one
+    round of psutil calls; each caller receives its own top-level dict.
+    """
+    global _system_metrics_snapshot
+
+    snapshot = _system_metrics_snapshot
+    if snapshot is not None and time.monotonic() - snapshot[0] < _SYSTEM_METRICS_TTL:
+        return dict(snapshot[1])
+
+    with _system_metrics_lock:
+        # Another caller may have refreshed the snapshot while we waited
+        snapshot = _system_metrics_snapshot
+        if snapshot is not None and time.monotonic() - snapshot[0] < _SYSTEM_METRICS_TTL:
+            return dict(snapshot[1])
+        metrics = _collect_system_metrics()
+        if "errors" not in metrics:
+            _system_metrics_snapshot = (time.monotonic(), metrics)
+    return dict(metrics)
+
+
+def _cpu_metrics() -> Dict[str, Any]:
+    """Collect CPU usage, count and frequency."""
+    cpu_freq = psutil.cpu_freq()
+    return {
+        "cpu_percent": psutil.cpu_percent(interval=None),
+        "cpu_count": _CPU_COUNT,
+        "cpu_frequency": {
+            "current": cpu_freq.current if cpu_freq else None,
+            "min": cpu_freq.min if cpu_freq else None,
+            "max": cpu_freq.max if cpu_freq else None,
+        },
+    }
+
+
+def _memory_metrics() -> Dict[str, Any]:
+    """Collect virtual memory and swap usage."""
+    memory = psutil.virtual_memory()
+    swap = psutil.swap_memory()
+    return {
+        "memory_percent": memory.percent,
+        "memory_available": memory.available,
+        "memory_used": memory.used,
+        "memory_total": memory.total,
+        "swap_percent": swap.percent,
+        "swap_used": swap.used,
+        "swap_total": swap.total,
+    }
+
+
+def _disk_metrics() -> Dict[str, Any]:
+    """Collect root filesystem usage and disk I/O counters."""
+    disk = psutil.disk_usage("/")
+    disk_io = psutil.disk_io_counters()
+    return {
+        "disk_usage": {
+            "total": disk.total,
+            "used": disk.used,
+            "free": disk.free,
+            # Some container and pseudo filesystems report a zero size
+            "percent": (disk.used / disk.total) * 100 if disk.total else 0.0,
+        },
+        "disk_io": {
+            "read_bytes": disk_io.read_bytes if disk_io else 0,
+            "write_bytes": disk_io.write_bytes if disk_io else 0,
+            "read_count": disk_io.read_count if disk_io else 0,
+            "write_count": disk_io.write_count if disk_io else 0,
+        },
+    }
+
+
+def _network_metrics() -> Dict[str, Any]:
+    """Collect network I/O counters."""
+    network_io = psutil.net_io_counters()
+    return {
+        "network_io": {
+            "bytes_sent": network_io.bytes_sent if network_io else 0,
+            "bytes_recv": network_io.bytes_recv if network_io else 0,
+            "packets_sent": network_io.packets_sent if network_io else 0,
+            "packets_recv": network_io.packets_recv if network_io else 0,
+        },
+    }
+
+
+_METRIC_SECTIONS = (
+    ("cpu", _cpu_metrics),
+    ("memory", _memory_metrics),
+    ("disk", _disk_metrics),
+    ("network", _network_metrics),
+)
+
+
+def _collect_system_metrics() -> Dict[str, Any]:
+    """
+    Query psutil for a new set of system metrics.
+
+    Each section is collected independently, so one failing subsystem only
+    adds an entry under "errors" instead of discarding the whole snapshot.
+    Only the errors psutil raises for unavailable data are caught;
+    AttributeError covers fields missing on some platforms.
+    """
+    metrics: Dict[str, Any] = {}
+    errors: Dict[str, str] = {}
+    for section, collect in _METRIC_SECTIONS:
+        try:
+            metrics.update(collect())
+        except (psutil.Error, OSError, AttributeError) as e:
+            logger.error(f"Error getting {section} metrics: {e}")
+            errors[section] = str(e)
+
+    if errors:
+        metrics["errors"] = errors
+    metrics["timestamp"] = _now_iso()
+    return metrics
 
 
 def get_application_metrics() -> Dict[str, Any]:
     """Get application-specific metrics."""
+    timestamp = _now_iso()
     try:
         from ..api.middleware import get_middleware_metrics
+    except ImportError as e:
+        logger.error(f"Error getting application metrics: {e}")
+        return {"error": str(e), "timestamp": timestamp}
 
-        # Get middleware metrics
-        middleware_metrics = get_middleware_metrics()
+    # Get middleware metrics
+    middleware_metrics = get_middleware_metrics()
 
-        # Add application-specific metrics
-        return {
-            "requests_total": middleware_metrics.get("total_requests", 0),
-            "requests_per_second": calculate_requests_per_second(),
-            "average_response_time": middleware_metrics.get("average_response_time", 0),
-            "error_rate": calculate_error_rate(middleware_metrics),
-            "active_connections": middleware_metrics.get("active_connections", 0),
-            "uptime_seconds": get_uptime(),
-            "version": "0.3.0",
-            "timestamp": datetime.utcnow().isoformat(),
-        }
-    except Exception as e:
-        logger.error(f"Error getting application metrics: {e}")
-        return {"error": str(e), "timestamp": datetime.utcnow().isoformat()}
+    # Add application-specific metrics
+    return {
+        "requests_total": middleware_metrics["total_requests"],
+        "requests_per_second": calculate_requests_per_second(),
+        "average_response_time": middleware_metrics["average_response_time"],
+        "error_rate": calculate_error_rate(middleware_metrics),
+        "active_connections": middleware_metrics["active_connections"],
+        "uptime_seconds": get_uptime(),
+        "version": "0.3.0",
+        "timestamp": timestamp,
+    }
 
 
-# Application start time for uptime calculation
-_start_time = time.time()
+# Application start time for uptime calculation; monotonic so that wall-clock
+# adjustments cannot make uptime jump or go negative
+_start_time = time.monotonic()
 
 
 def get_uptime() -> float:
     """Get application uptime in seconds."""
-    return time.time() - _start_time
+    return time.monotonic() - _start_time
 
 
 def calculate_requests_per_second() -> float:
     """Calculate requests per second."""
     try:
         from ..api.middleware import request_counts
-
-        total_requests = sum(request_counts.values())
-        uptime = get_uptime()
-        return total_requests / uptime if uptime > 0 else 0
-    except Exception:
+    except ImportError:
         return 0.0
 
+    uptime = get_uptime()
+    return sum(request_counts.values()) / uptime if uptime > 0 else 0.0
 
-def calculate_error_rate(middleware_metrics: Dict[str, Any]) -> float:
-    """Calculate error rate percentage."""
-    try:
-        total_requests = middleware_metrics.get("total_requests", 0)
-        error_counts = middleware_metrics.get("error_counts", {})
-        total_errors = sum(error_counts.values())
-
-        if total_requests == 0:
-            return 0.0
 
-        return (total_errors / total_requests) * 100
-    except Exception:
+def calculate_error_rate(middleware_metrics: "MiddlewareMetrics") -> float:
+    """Calculate error rate percentage."""
+    total_requests = middleware_metrics.get("total_requests", 0)
+    if not total_requests:
         return 0.0
 
+    # Metrics built without a total_errors key carry only the per-key counts
+    total_errors = middleware_metrics.get("total_errors")
+    if total_errors is None:
+        total_errors = sum(middleware_metrics.get("error_counts", {}).values())
+    return total_errors / total_requests * 100
+
 
 class HealthChecker:
     """Health check manager."""
 
     def __init__(self):
         self.checks = {}
+        # Whether each registered check is a coroutine function, decided once
+        self._async_checks: Dict[str, bool] = {}
 
     def register_check(self, name: str, check_func):
         """Register a health check function."""
         self.checks[name] = check_func
+        self._async_checks[name] = asyncio.iscoroutinefunction(check_func)
 
     async def run_checks(self) -> Dict[str, Any]:
-        """Run all registered health checks."""
+        """Run all registered health checks concurrently."""
         results = {}
         overall_status = "healthy"
 
-        for name, check_func in self.checks.items():
+        outcomes = await asyncio.gather(
+            *(self._run_check(name, check_func) for name, check_func in self.checks.items()),
+            return_exceptions=True,
+        )
+
+        for name, outcome in zip(self.checks, outcomes):
             try:
-                if callable(check_func):
-                    result = (
-                        await check_func() if hasattr(check_func, "__await__") else check_func()
-                    )
-                else:
-                    result = {"status": "healthy"}
+                if isinstance(outcome, BaseException):
+                    raise outcome
 
-                results[name] = result
+                results[name] = outcome
 
-                if result.get("status") != "healthy":
+                if outcome.get("status") != "healthy":
                     overall_status = "unhealthy"
 
             except Exception as e:
@@ -167,9 +252,21 @@ class HealthChecker:
         return {
             "status": overall_status,
             "checks": results,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": _now_iso(),
         }
 
+    async def _run_check(self, name: str, check_func) -> Any:
+        """Run one check; synchronous checks run in the default executor."""
+        if not callable(check_func):
+            return {"status": "healthy"}
+        is_async = self._async_checks.get(name)
+        if is_async is None:
+            # Added to self.checks directly rather than via register_check
+            is_async = asyncio.iscoroutinefunction(check_func)
+        if is_async:
+            return await check_func()
+        return await asyncio.get_running_loop().run_in_executor(None, check_func)
+
 
 # Global health checker instance
 health_checker = HealthChecker()
@@ -11,21 +11,480 @@ This module provides extensive validation capabilities for:
 
 import ast
 import asyncio
+import atexit
+import bisect
+import copy
+import functools
+import hashlib
 import json
 import logging
+import os
 import re
 import shutil
 import subprocess
 import sys
 import tempfile
-from concurrent.futures import ThreadPoolExecutor
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Pattern,
+    Set,
+    Tuple,
+    Union,
+)
 
 from ..utils.logger import get_logger
 
+try:
+    import ijson
+
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
 logger = get_logger(__name__)
 
+# (pattern, description, lowercase literal every match must contain). Patterns
+# are matched against the whole source by one fused scanner, so none of them
+# may match a newline: "[^\S\n]" stands for whitespace within a line
+_SECURITY_PATTERNS = tuple(
+    (re.compile(pattern, re.IGNORECASE), description, hint)
+    for pattern, description, hint in (
+        (r"shell[^\S\n]*=[^\S\n]*True", "Shell injection risk", "shell"),
+        (r"eval[^\S\n]*\(", "Code injection risk", "eval"),
+        (r"exec[^\S\n]*\(", "Code execution risk", "exec"),
+        (r"__import__[^\S\n]*\(", "Dynamic import risk", "__import__"),
+        (r"pickle\.loads?[^\S\n]*\(", "Pickle deserialization risk", "pickle"),
+        (r"yaml\.load[^\S\n]*\((?!.*Loader)", "Unsafe YAML loading", "yaml"),
+        (
+            r"requests\.get[^\S\n]*\([^)\n]*verify[^\S\n]*=[^\S\n]*False",
+            "SSL verification disabled",
+            "requests",
+        ),
+    )
+)
+
+
+def _build_security_scanner(patterns: List[Tuple[Pattern, str, str]]) -> Pattern:
+    """
+    Fuse security patterns into one regex with a named group per pattern.
+
+    Each alternative sits in a lookahead, so matches of different patterns
+    may overlap just as they could when each pattern was searched separately.
+
+    Args:
+        patterns: (compiled pattern, description, hint) triples
+
+    Returns:
+        Compiled scanner whose ``lastgroup`` is ``p<index>`` of the match
+    """
+    return re.compile(
+        "|".join(
+            f"(?=(?P<p{index}>{pattern.pattern}))" for index, (pattern, _, _) in enumerate(patterns)
+        ),
+        re.IGNORECASE,
+    )
+
+
+# Caches and vendored environments; never part of a package's own sources
+_SKIP_DIRS = frozenset(
+    {
+        "__pycache__",
+        ".git",
+        ".hg",
+        ".tox",
+        ".nox",
+        ".venv",
+        "venv",
+        ".pytest_cache",
+        ".mypy_cache",
+        "htmlcov",
+        "node_modules",
+    }
+)
+
+# Build output directories; only skipped at the package root, since a nested
+# "build" or "dist" may be a legitimate subpackage
+_ROOT_SKIP_DIRS = frozenset({"build", "dist"})
+
+# Files a validation run itself writes (coverage data and reports)
+_RUN_ARTIFACT_PREFIXES = (".coverage", "coverage.")
+
+
+def _is_skipped_dir(name: str, at_root: bool = False) -> bool:
+    """Check whether a directory name is a build, cache or environment directory."""
+    return name in _SKIP_DIRS or name.endswith(".egg-info") or (at_root and name in _ROOT_SKIP_DIRS)
+
+
+# A score earns _GRADES[n], where n is the number of thresholds it reaches
+_GRADE_THRESHOLDS = (40, 50, 55, 60, 65, 70, 75, 80, 85, 90)
+_GRADES = ("F", "D", "C-", "C", "C+", "B-", "B", "B+", "A-", "A", "A+")
+
+# Below this many files the process pool start-up costs more than it saves
+_PARALLEL_MIN_FILES = 8
+
+# Process-wide cache of quality validation results, keyed on the package
+# directory plus the validation options and holding the file tree fingerprint
+# the results were computed for. Bounded LRU, oldest evicted.
+_RESULTS_CACHE_SIZE = 32
+_RESULTS_CACHE: "OrderedDict[Tuple[str, bool, bool, bool], Tuple[str, Dict[str, Any]]]" = (
+    OrderedDict()
+)
+_RESULTS_CACHE_LOCK = threading.Lock()
+
+# Process pool for docstring analysis, started on first use and kept for the
+# life of the interpreter so repeated validations do not pay worker start-up
+_PROCESS_POOL: Optional[ProcessPoolExecutor] = None
+_PROCESS_POOL_LOCK = threading.Lock()
+
+
+def _get_process_pool() -> ProcessPoolExecutor:
+    """Return the shared process pool, starting it on first use."""
+    global _PROCESS_POOL
+    with _PROCESS_POOL_LOCK:
+        if _PROCESS_POOL is None:
+            _PROCESS_POOL = ProcessPoolExecutor()
+            atexit.register(_PROCESS_POOL.shutdown)
+        return _PROCESS_POOL
+
+
+def _discard_process_pool(pool: ProcessPoolExecutor) -> None:
+    """Shut down a failed pool so the next caller starts a fresh one."""
+    global _PROCESS_POOL
+    with _PROCESS_POOL_LOCK:
+        if _PROCESS_POOL is pool:
+            _PROCESS_POOL = None
+    pool.shutdown(wait=False)
+
+
+_FUNCTION_NODES = (ast.FunctionDef, ast.AsyncFunctionDef)
+_DEFINITION_NODES = (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
+# Nodes that add to a function's cyclomatic complexity
+_BRANCH_NODES = (ast.If, ast.While, ast.For, ast.AsyncFor, ast.ExceptHandler, ast.BoolOp)
+
+_SNAKE_CASE_RE = re.compile(r"^[a-z_][a-z0-9_]*$")
+_PASCAL_CASE_RE = re.compile(r"^[A-Z][a-zA-Z0-9]*$")
+_SEMVER_PREFIX_RE = re.compile(r"^\d+\.\d+\.\d+")
+
+# CodeValidator checks run over the tree, with the label used in their error messages
+_CODE_CHECKS = {
+    "imports": "Import",
+    "naming": "Naming",
+    "docstrings": "Docstring",
+    "type_hints": "Type hint",
+    "complexity": "Complexity",
+}
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_source(code: str) -> ast.Module:
+    """
+    Parse Python source, sharing the tree across validators that check the same code.
+
+    The returned tree is cached, so callers must not modify it.
+
+    Args:
+        code: Python source to parse
+
+    Returns:
+        Parsed module
+
+    Raises:
+        SyntaxError: If the source cannot be parsed
+    """
+    return ast.parse(code)
+
+
+# Node class -> its fields in reverse declaration order, ready to push on a stack
+_CHILD_FIELDS: Dict[type, Tuple[str, ...]] = {}
+
+
+def _walk_nodes(tree: ast.AST, node_types: Tuple[type, ...]) -> Iterator[ast.AST]:
+    """
+    Yield nodes of the given types in source order.
+
+    An explicit stack avoids the per-node generator resumption of ``ast.walk``
+    and ``ast.iter_child_nodes``; each class's field order is looked up once.
+
+    Args:
+        tree: Root node to traverse
+        node_types: Node classes to yield
+
+    Yields:
+        Matching nodes
+    """
+    child_fields = _CHILD_FIELDS
+    stack = [tree]
+    push = stack.append
+    while stack:
+        node = stack.pop()
+        if isinstance(node, node_types):
+            yield node
+        node_type = type(node)
+        fields = child_fields.get(node_type)
+        if fields is None:
+            fields = child_fields[node_type] = node_type._fields[::-1]
+        for field in fields:
+            value = getattr(node, field, None)
+            if isinstance(value, list):
+                for item in reversed(value):
+                    if isinstance(item, ast.AST):
+                        push(item)
+            elif isinstance(value, ast.AST):
+                push(value)
+
+
+def _analyze_docstrings_source(content: Union[str, bytes], filename: str) -> Dict[str, Any]:
+    """Analyze docstrings in a single module's source."""
+    analysis = {
+        "total_functions": 0,
+        "documented_functions": 0,
+        "total_classes": 0,
+        "documented_classes": 0,
+        "has_module_docstring": False,
+        "quality_issues": [],
+    }
+
+    try:
+        tree = ast.parse(content)
+
+        # Check module docstring
+        if ast.get_docstring(tree):
+            analysis["has_module_docstring"] = True
+
+        for node in _walk_nodes(tree, _DEFINITION_NODES):
+            if isinstance(node, _FUNCTION_NODES):
+                # Skip private methods and special methods for now
+                if not node.name.startswith("_"):
+                    analysis["total_functions"] += 1
+
+                    docstring = ast.get_docstring(node)
+                    if docstring:
+                        analysis["documented_functions"] += 1
+
+                        # Check docstring quality
+                        if len(docstring.strip()) < 20:
+                            analysis["quality_issues"].append(
+                                f"{filename}: Function '{node.name}' has very short docstring"
+                            )
+                    else:
+                        analysis["quality_issues"].append(
+                            f"{filename}: Function '{node.name}' missing docstring"
+                        )
+
+            elif isinstance(node, ast.ClassDef):
+                analysis["total_classes"] += 1
+
+                docstring = ast.get_docstring(node)
+                if docstring:
+                    analysis["documented_classes"] += 1
+
+                    if len(docstring.strip()) < 30:
+                        analysis["quality_issues"].append(
+                            f"{filename}: Class '{node.name}' has very short docstring"
+                        )
+                else:
+                    analysis["quality_issues"].append(
+                        f"{filename}: Class '{node.name}' missing docstring"
+                    )
+
+    except Exception as e:
+        analysis["quality_issues"].append(f"{filename}: Docstring analysis failed: {str(e)}")
+
+    return analysis
+
+
+def _analyze_docstrings_file(path: str) -> Dict[str, Any]:
+    """
+    Read and analyze docstrings in a single file.
+
+    Defined at module level so it can be dispatched to a process pool.
+
+    Args:
+        path: Path to the Python source file
+
+    Returns:
+        Docstring analysis, or a dict with an ``error`` key if the file
+        could not be read
+    """
+    # Only the parser sees the source, and it takes the raw bytes directly,
+    # so skip decoding the file into a str first
+    try:
+        content = Path(path).read_bytes()
+    except Exception as e:
+        return {"error": f"Failed to analyze {path}: {str(e)}"}
+
+    return _analyze_docstrings_source(content, os.path.basename(path))
+
+
+def _read_coverage_report(
+    coverage_file: Path,
+) -> Tuple[float, Iterable[Tuple[str, Dict[str, Any]]]]:
+    """
+    Read a coverage.py JSON report.
+
+    With ijson installed the per-file entries are decoded lazily, one at a
+    time, instead of materialising the whole report up front.
+
+    Args:
+        coverage_file: Path to coverage.json
+
+    Returns:
+        Tuple of (total percent covered, iterable of (filename, file data))
+    """
+    if not IJSON_AVAILABLE:
+        with open(coverage_file) as f:
+            coverage_data = json.load(f)
+        total = coverage_data.get("totals", {}).get("percent_covered", 0)
+        return total, coverage_data.get("files", {}).items()
+
+    total = 0
+    with open(coverage_file, "rb") as f:
+        for total in ijson.items(f, "totals.percent_covered", use_float=True):
+            break
+
+    def iter_files() -> Iterator[Tuple[str, Dict[str, Any]]]:
+        with open(coverage_file, "rb") as f:
+            yield from ijson.kvitems(f, "files", use_float=True)
+
+    return total, iter_files()
+
+
+class FileIndex:
+    """
+    Index of the files under a package directory.
+
+    The tree is walked once, on first use, so the validators taking part in a
+    quality run share a single traversal instead of each calling ``rglob``.
+    Build, cache and environment directories are pruned during the walk
+    rather than filtered afterwards, so their contents are never listed.
+    File contents read through the index are kept, so each source file is
+    read from disk once per run however many checks look at it, and file
+    sizes come from the directory entries found by the walk.
+    """
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self._files: Optional[List[Path]] = None
+        self._py_files: Optional[List[Path]] = None
+        self._entries: Dict[Path, os.DirEntry] = {}
+        self._contents: Dict[Path, str] = {}
+        self._root_names: Set[str] = set()
+
+    @property
+    def files(self) -> List[Path]:
+        """All files under the root, in sorted walk order."""
+        if self._files is None:
+            self._files = self._walk()
+        return self._files
+
+    def _walk(self) -> List[Path]:
+        """Walk the tree top-down like ``os.walk``, keeping each file's entry."""
+        files = []
+        stack = [self.root]
+        while stack:
+            directory = stack.pop()
+            try:
+                with os.scandir(directory) as it:
+                    entries = sorted(it, key=lambda entry: entry.name)
+            except OSError:
+                continue
+
+            at_root = directory is self.root
+            if at_root:
+                self._root_names = {entry.name for entry in entries}
+
+            subdirs = []
+            for entry in entries:
+                if entry.is_dir():
+                    if not entry.is_symlink() and not _is_skipped_dir(entry.name, at_root):
+                        subdirs.append(Path(entry.path))
+                else:
+                    path = Path(entry.path)
+                    files.append(path)
+                    self._entries[path] = entry
+            stack.extend(reversed(subdirs))
+        return files
+
+    @property
+    def root_names(self) -> Set[str]:
+        """Names of the files and directories directly under the root."""
+        self.files
+        return self._root_names
+
+    def has(self, name: str) -> bool:
+        """Check whether a file or directory of this name sits directly under the root."""
+        return name in self.root_names
+
+    @property
+    def py_files(self) -> List[Path]:
+        """All Python source files under the root."""
+        if self._py_files is None:
+            self._py_files = [path for path in self.files if path.name.endswith(".py")]
+        return self._py_files
+
+    def files_under(self, directory: Path) -> List[Path]:
+        """Files below ``directory``, which must lie inside the root."""
+        return self._under(self.files, directory)
+
+    def py_files_under(self, directory: Path) -> List[Path]:
+        """Python source files below ``directory``, which must lie inside the root."""
+        return self._under(self.py_files, directory)
+
+    def size(self, path: Path) -> int:
+        """Size of a file in bytes, stat-ed at most once per index."""
+        entry = self._entries.get(path)
+        if entry is None:
+            return path.stat().st_size
+        return entry.stat().st_size
+
+    def fingerprint(self) -> str:
+        """
+        Digest of the path, size and mtime of every indexed file.
+
+        Files written by a validation run itself, such as coverage data, are
+        left out so that running the checks does not change the fingerprint.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        for path in self.files:
+            if path.name.startswith(_RUN_ARTIFACT_PREFIXES):
+                continue
+            try:
+                stat = self._entries[path].stat()
+            except OSError:
+                continue
+            digest.update(f"{path}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode())
+        return digest.hexdigest()
+
+    def read_text(self, path: Path) -> str:
+        """Read a file's text, reusing the contents of an earlier read."""
+        content = self._contents.get(path)
+        if content is None:
+            content = self._contents[path] = path.read_text()
+        return content
+
+    @staticmethod
+    def _under(paths: List[Path], directory: Path) -> List[Path]:
+        prefix = os.path.join(str(directory), "")
+        return [path for path in paths if str(path).startswith(prefix)]
+
+
+def _has_entry(package_dir: Path, name: str, file_index: Optional[FileIndex]) -> bool:
+    """Check for a top-level entry, from the index's listing when one is shared."""
+    if file_index is not None:
+        return file_index.has(name)
+    return (package_dir / name).exists()
+
 
 class CodeValidator:
     """Validates Python code quality and correctness."""
@@ -67,6 +526,21 @@ class CodeValidator:
             "yield",
         }
 
+        # Per-node checks keyed on exact node type: node type -> (check, handler)
+        self._node_checks: Dict[type, List[Tuple[str, Callable[..., None]]]] = {}
+        for check, node_types, handler in (
+            ("imports", (ast.Import,), self._check_import),
+            ("imports", (ast.ImportFrom,), self._check_import_from),
+            ("naming", (ast.FunctionDef,), self._check_function_name),
+            ("naming", (ast.ClassDef,), self._check_class_name),
+            ("naming", (ast.Name,), self._check_variable_name),
+            ("docstrings", _DEFINITION_NODES, self._check_docstring),
+            ("type_hints", _FUNCTION_NODES, self._check_type_hints),
+            ("complexity", _FUNCTION_NODES, self._check_complexity),
+        ):
+            for node_type in node_types:
+                self._node_checks.setdefault(node_type, []).append((check, handler))
+
     def validate_syntax(self, code: str) -> Tuple[bool, List[str]]:
         """
         Validate Python syntax.
@@ -80,7 +554,7 @@ class CodeValidator:
         errors = []
 
         try:
-            ast.parse(code)
+            _parse_source(code)
             return True, []
         except SyntaxError as e:
             errors.append(f"Syntax error at line {e.lineno}: {e.msg}")
@@ -89,43 +563,59 @@ class CodeValidator:
 
         return False, errors
 
-    def validate_imports(self, code: str) -> Tuple[bool, List[str]]:
+    def analyze(self, code: str, max_complexity: int = 10) -> Dict[str, Tuple[bool, List[str]]]:
         """
-        Validate import statements.
+        Run every code check over one parse and one walk of the tree.
 
         Args:
             code: Python code to validate
+            max_complexity: Maximum allowed complexity
 
         Returns:
-            Tuple of (is_valid, issues)
+            Dict mapping "syntax" and each check in _CODE_CHECKS to the
+            (is_valid, issues) tuple its validate_* method would return
+        """
+        results = {"syntax": self.validate_syntax(code)}
+        for check, issues in self._run_checks(code, tuple(_CODE_CHECKS), max_complexity).items():
+            results[check] = (len(issues) == 0, issues)
+        return results
+
+    def _run_checks(
+        self, code: str, checks: Tuple[str, ...], max_complexity: int = 10
+    ) -> Dict[str, List[str]]:
         """
-        issues = []
+        Walk the parsed code once, dispatching each node to the selected checks.
+
+        Args:
+            code: Python code to validate
+            checks: Names of the checks to run, from _CODE_CHECKS
+            max_complexity: Maximum allowed complexity
+
+        Returns:
+            Dict mapping each check name to its issues
+        """
+        issues: Dict[str, List[str]] = {check: [] for check in checks}
 
         try:
-            tree = ast.parse(code)
-
-            for node in ast.walk(tree):
-                if isinstance(node, ast.Import):
-                    for alias in node.names:
-                        if alias.name.startswith("."):
-                            issues.append(f"Relative import without 'from': {alias.name}")
-
-                elif isinstance(node, ast.ImportFrom):
-                    if node.module and node.level == 0:
-                        # Check for common problematic imports
-                        if node.module in ["os", "sys"] and any(
-                            alias.name in ["system", "exec", "eval"] for alias in node.names
-                        ):
-                            issues.append(f"Potentially unsafe import: {node.module}")
+            tree = _parse_source(code)
+
+            # Dispatch on the exact node type; a dict lookup per node replaces
+            # one isinstance chain per check
+            node_checks = self._node_checks
+            for node in _walk_nodes(tree, (ast.AST,)):
+                for check, handler in node_checks.get(type(node), ()):
+                    if check in issues:
+                        handler(node, issues[check], max_complexity)
 
         except Exception as e:
-            issues.append(f"Import validation error: {str(e)}")
+            for check in checks:
+                issues[check].append(f"{_CODE_CHECKS[check]} validation error: {str(e)}")
 
-        return len(issues) == 0, issues
+        return issues
 
-    def validate_naming_conventions(self, code: str) -> Tuple[bool, List[str]]:
+    def validate_imports(self, code: str) -> Tuple[bool, List[str]]:
         """
-        Validate Python naming conventions (PEP 8).
+        Validate import statements.
 
         Args:
             code: Python code to validate
@@ -133,39 +623,68 @@ class CodeValidator:
         Returns:
             Tuple of (is_valid, issues)
         """
-        issues = []
-
-        try:
-            tree = ast.parse(code)
-
-            for node in ast.walk(tree):
-                if isinstance(node, ast.FunctionDef):
-                    if not self._is_snake_case(node.name):
-                        issues.append(f"Function '{node.name}' should use snake_case")
+        issues = self._run_checks(code, ("imports",))["imports"]
+        return len(issues) == 0, issues
 
-                elif isinstance(node, ast.ClassDef):
-                    if not self._is_pascal_case(node.name):
-                        issues.append(f"Class '{node.name}' should use PascalCase")
+    def _check_import(self, node: ast.Import, issues: List[str], max_complexity: int) -> None:
+        """Check a plain import statement."""
+        for alias in node.names:
+            if alias.name.startswith("."):
+                issues.append(f"Relative import without 'from': {alias.name}")
+
+    def _check_import_from(
+        self, node: ast.ImportFrom, issues: List[str], max_complexity: int
+    ) -> None:
+        """Check a from-import statement."""
+        if node.module and node.level == 0:
+            # Check for common problematic imports
+            if node.module in ["os", "sys"] and any(
+                alias.name in ["system", "exec", "eval"] for alias in node.names
+            ):
+                issues.append(f"Potentially unsafe import: {node.module}")
 
-                elif isinstance(node, ast.Name) and isinstance(node.ctx, ast.Store):
-                    if node.id.isupper() and len(node.id) > 1:
-                        # Constants are OK
-                        continue
-                    elif not self._is_snake_case(node.id) and node.id not in self.python_keywords:
-                        issues.append(f"Variable '{node.id}' should use snake_case")
+    def validate_naming_conventions(self, code: str) -> Tuple[bool, List[str]]:
+        """
+        Validate Python naming conventions (PEP 8).
 
-        except Exception as e:
-            issues.append(f"Naming validation error: {str(e)}")
+        Args:
+            code: Python code to validate
 
+        Returns:
+            Tuple of (is_valid, issues)
+        """
+        issues = self._run_checks(code, ("naming",))["naming"]
         return len(issues) == 0, issues
 
+    def _check_function_name(
+        self, node: ast.FunctionDef, issues: List[str], max_complexity: int
+    ) -> None:
+        """Check that a function name uses snake_case."""
+        if not self._is_snake_case(node.name):
+            issues.append(f"Function '{node.name}' should use snake_case")
+
+    def _check_class_name(self, node: ast.ClassDef, issues: List[str], max_complexity: int) -> None:
+        """Check that a class name uses PascalCase."""
+        if not self._is_pascal_case(node.name):
+            issues.append(f"Class '{node.name}' should use PascalCase")
+
+    def _check_variable_name(self, node: ast.Name, issues: List[str], max_complexity: int) -> None:
+        """Check that an assigned variable name uses snake_case."""
+        if not isinstance(node.ctx, ast.Store):
+            return
+        if node.id.isupper() and len(node.id) > 1:
+            # Constants are OK
+            return
+        if not self._is_snake_case(node.id) and node.id not in self.python_keywords:
+            issues.append(f"Variable '{node.id}' should use snake_case")
+
     def _is_snake_case(self, name: str) -> bool:
         """Check if name follows snake_case convention."""
-        return re.match(r"^[a-z_][a-z0-9_]*$", name) is not None
+        return _SNAKE_CASE_RE.match(name) is not None
 
     def _is_pascal_case(self, name: str) -> bool:
         """Check if name follows PascalCase convention."""
-        return re.match(r"^[A-Z][a-zA-Z0-9]*$", name) is not None
+        return _PASCAL_CASE_RE.match(name) is not None
 
     def validate_docstrings(self, code: str) -> Tuple[bool, List[str]]:
         """
@@ -177,27 +696,17 @@ class CodeValidator:
         Returns:
             Tuple of (is_valid, issues)
         """
-        issues = []
-
-        try:
-            tree = ast.parse(code)
-
-            for node in ast.walk(tree):
-                if isinstance(node, (ast.FunctionDef, ast.ClassDef, ast.AsyncFunctionDef)):
-                    if not ast.get_docstring(node):
-                        issues.append(f"{type(node).__name__} '{node.name}' missing docstring")
-                    else:
-                        docstring = ast.get_docstring(node)
-                        if len(docstring.strip()) < 10:
-                            issues.append(
-                                f"{type(node).__name__} '{node.name}' has very short docstring"
-                            )
-
-        except Exception as e:
-            issues.append(f"Docstring validation error: {str(e)}")
-
+        issues = self._run_checks(code, ("docstrings",))["docstrings"]
         return len(issues) == 0, issues
 
+    def _check_docstring(self, node: ast.AST, issues: List[str], max_complexity: int) -> None:
+        """Check the docstring of a function or class."""
+        docstring = ast.get_docstring(node)
+        if not docstring:
+            issues.append(f"{type(node).__name__} '{node.name}' missing docstring")
+        elif len(docstring.strip()) < 10:
+            issues.append(f"{type(node).__name__} '{node.name}' has very short docstring")
+
     def validate_type_hints(self, code: str) -> Tuple[bool, List[str]]:
         """
         Validate type hint usage.
@@ -208,33 +717,26 @@ class CodeValidator:
         Returns:
             Tuple of (is_valid, issues)
         """
-        issues = []
-
-        try:
-            tree = ast.parse(code)
-
-            for node in ast.walk(tree):
-                if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                    # Skip special methods
-                    if node.name.startswith("__") and node.name.endswith("__"):
-                        continue
-
-                    # Check return type annotation
-                    if not node.returns:
-                        issues.append(f"Function '{node.name}' missing return type annotation")
-
-                    # Check argument type annotations
-                    for arg in node.args.args:
-                        if not arg.annotation and arg.arg != "self" and arg.arg != "cls":
-                            issues.append(
-                                f"Argument '{arg.arg}' in function '{node.name}' missing type annotation"
-                            )
-
-        except Exception as e:
-            issues.append(f"Type hint validation error: {str(e)}")
-
+        issues = self._run_checks(code, ("type_hints",))["type_hints"]
         return len(issues) == 0, issues
 
+    def _check_type_hints(self, node: ast.AST, issues: List[str], max_complexity: int) -> None:
+        """Check the annotations of a function."""
+        # Skip special methods
+        if node.name.startswith("__") and node.name.endswith("__"):
+            return
+
+        # Check return type annotation
+        if not node.returns:
+            issues.append(f"Function '{node.name}' missing return type annotation")
+
+        # Check argument type annotations
+        for arg in node.args.args:
+            if not arg.annotation and arg.arg != "self" and arg.arg != "cls":
+                issues.append(
+                    f"Argument '{arg.arg}' in function '{node.name}' missing type annotation"
+                )
+
     def validate_complexity(self, code: str, max_complexity: int = 10) -> Tuple[bool, List[str]]:
         """
         Validate cyclomatic complexity.
@@ -246,30 +748,22 @@ class CodeValidator:
         Returns:
             Tuple of (is_valid, issues)
         """
-        issues = []
-
-        try:
-            tree = ast.parse(code)
-
-            for node in ast.walk(tree):
-                if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                    complexity = self._calculate_complexity(node)
-                    if complexity > max_complexity:
-                        issues.append(
-                            f"Function '{node.name}' has complexity {complexity} "
-                            f"(max: {max_complexity})"
-                        )
-
-        except Exception as e:
-            issues.append(f"Complexity validation error: {str(e)}")
-
+        issues = self._run_checks(code, ("complexity",), max_complexity)["complexity"]
         return len(issues) == 0, issues
 
+    def _check_complexity(self, node: ast.AST, issues: List[str], max_complexity: int) -> None:
+        """Check the cyclomatic complexity of a function."""
+        complexity = self._calculate_complexity(node)
+        if complexity > max_complexity:
+            issues.append(
+                f"Function '{node.name}' has complexity {complexity} (max: {max_complexity})"
+            )
+
     def _calculate_complexity(self, node: ast.AST) -> int:
         """Calculate cyclomatic complexity of a function."""
         complexity = 1  # Base complexity
 
-        for child in ast.walk(node):
+        for child in _walk_nodes(node, _BRANCH_NODES):
             if isinstance(child, (ast.If, ast.While, ast.For, ast.AsyncFor)):
                 complexity += 1
             elif isinstance(child, ast.ExceptHandler):
@@ -315,15 +809,21 @@ class PackageValidator:
             "structure_score": 0.0,
         }
 
-        if not package_dir.exists():
+        # List the directory once and probe names against the set instead of
+        # stat-ing every candidate path
+        try:
+            with os.scandir(package_dir) as entries:
+                names = {entry.name for entry in entries}
+        except FileNotFoundError:
             results["valid"] = False
             results["errors"].append(f"Package directory does not exist: {package_dir}")
             return results
+        except NotADirectoryError:
+            names = set()
 
         # Check required files
         for filename, description in self.required_files.items():
-            file_path = package_dir / filename
-            if file_path.exists():
+            if filename in names:
                 results["found_files"].append(filename)
             else:
                 results["missing_files"].append(filename)
@@ -331,35 +831,25 @@ class PackageValidator:
                 results["valid"] = False
 
         # Check recommended files
+        recommended_found = 0
         for filename, description in self.recommended_files.items():
-            file_path = package_dir / filename
-            if not file_path.exists():
+            if filename in names:
+                recommended_found += 1
+            else:
                 results["warnings"].append(f"Missing recommended file: {filename} ({description})")
 
         # Check for source directory
-        src_dirs = ["src", package_dir.name]
-        src_found = False
-        for src_dir in src_dirs:
-            if (package_dir / src_dir).exists():
-                src_found = True
-                break
-
-        if not src_found:
+        if "src" not in names and package_dir.name not in names:
             results["errors"].append("No source directory found (expected 'src' or package name)")
             results["valid"] = False
 
         # Check for tests directory
-        test_dirs = ["tests", "test"]
-        test_found = any((package_dir / test_dir).exists() for test_dir in test_dirs)
-
-        if not test_found:
+        if "tests" not in names and "test" not in names:
             results["warnings"].append("No tests directory found")
 
         # Calculate structure score
         total_files = len(self.required_files) + len(self.recommended_files)
-        found_files = len(results["found_files"]) + len(
-            [f for f in self.recommended_files if (package_dir / f).exists()]
-        )
+        found_files = len(results["found_files"]) + recommended_found
 
         results["structure_score"] = (found_files / total_files) * 100
 
@@ -416,7 +906,7 @@ class PackageValidator:
                 # Validate version format
                 if "version" in project:
                     version = project["version"]
-                    if not re.match(r"^\d+\.\d+\.\d+", version):
+                    if not _SEMVER_PREFIX_RE.match(version):
                         results["warnings"].append(
                             f"Version '{version}' doesn't follow semantic versioning"
                         )
@@ -507,15 +997,15 @@ class SecurityValidator:
             "marshal.loads",
         }
 
-        self.security_patterns = [
-            (r"shell\s*=\s*True", "Shell injection risk"),
-            (r"eval\s*\(", "Code injection risk"),
-            (r"exec\s*\(", "Code execution risk"),
-            (r"__import__\s*\(", "Dynamic import risk"),
-            (r"pickle\.loads?\s*\(", "Pickle deserialization risk"),
-            (r"yaml\.load\s*\((?!.*Loader)", "Unsafe YAML loading"),
-            (r"requests\.get\s*\([^)]*verify\s*=\s*False", "SSL verification disabled"),
-        ]
+        self.security_patterns = list(_SECURITY_PATTERNS)
+        self._security_scanner = _build_security_scanner(self.security_patterns)
+
+        # Shortest source that can produce a finding: a bare call such as
+        # "open()" or a pattern hint plus one character such as "eval("
+        self.min_finding_size = min(
+            [len(name) + 2 for name in self.dangerous_functions]
+            + [len(hint) + 1 for _, _, hint in self.security_patterns]
+        )
 
     def validate_security(self, code: str) -> Dict[str, Any]:
         """
@@ -537,9 +1027,9 @@ class SecurityValidator:
 
         # Check for dangerous function calls
         try:
-            tree = ast.parse(code)
+            tree = _parse_source(code)
 
-            for node in ast.walk(tree):
+            for node in _walk_nodes(tree, (ast.Call,)):
                 if isinstance(node, ast.Call):
                     func_name = self._get_function_name(node.func)
 
@@ -562,14 +1052,28 @@ class SecurityValidator:
         except Exception as e:
             results["medium_risk"].append(f"Security analysis error: {str(e)}")
 
-        # Check for security patterns using regex
-        lines = code.split("\n")
-        for i, line in enumerate(lines, 1):
-            for pattern, description in self.security_patterns:
-                if re.search(pattern, line, re.IGNORECASE):
-                    results["medium_risk"].append(f"{description} at line {i}: {line.strip()}")
-                    if results["secure"]:
-                        results["secure"] = len(results["high_risk"]) == 0
+        # Check for security patterns in a single pass over the code, skipped
+        # entirely when none of the patterns' literal hints occur in it
+        lowered = code.lower()
+        if any(hint in lowered for _, _, hint in self.security_patterns):
+            lines = code.split("\n")
+            reported = set()
+            line_number = 1
+            position = 0
+            for match in self._security_scanner.finditer(code):
+                line_number += code.count("\n", position, match.start())
+                position = match.start()
+                index = int(match.lastgroup[1:])
+                if (line_number, index) in reported:
+                    continue
+
+                reported.add((line_number, index))
+                description = self.security_patterns[index][1]
+                results["medium_risk"].append(
+                    f"{description} at line {line_number}: {lines[line_number - 1].strip()}"
+                )
+                if results["secure"]:
+                    results["secure"] = len(results["high_risk"]) == 0
 
         # Generate recommendations
         if results["high_risk"]:
@@ -607,9 +1111,6 @@ class SecurityValidator:
 
         try:
             # Try to use safety to check for known vulnerabilities
-            import subprocess
-            import tempfile
-
             with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
                 for dep in dependencies:
                     f.write(f"{dep}\n")
@@ -629,8 +1130,6 @@ class SecurityValidator:
                     else:
                         # Parse safety output
                         try:
-                            import json
-
                             safety_data = json.loads(result.stdout)
                             for vuln in safety_data:
                                 results["vulnerabilities"].append(
@@ -665,12 +1164,15 @@ class TestValidator:
         self.test_frameworks = ["pytest", "unittest", "nose2"]
         self.test_patterns = [r"def test_", r"class Test", r"@pytest\.", r"unittest\.TestCase"]
 
-    def validate_tests(self, package_dir: Path) -> Dict[str, Any]:
+    def validate_tests(
+        self, package_dir: Path, file_index: Optional[FileIndex] = None
+    ) -> Dict[str, Any]:
         """
         Validate test structure and quality.
 
         Args:
             package_dir: Path to package directory
+            file_index: Optional shared index of the package's files
 
         Returns:
             Dict containing test validation results
@@ -686,11 +1188,11 @@ class TestValidator:
         }
 
         # Find test directories
-        test_dirs = []
-        for test_dir_name in ["tests", "test"]:
-            test_dir = package_dir / test_dir_name
-            if test_dir.exists():
-                test_dirs.append(test_dir)
+        test_dirs = [
+            package_dir / name
+            for name in ["tests", "test"]
+            if _has_entry(package_dir, name, file_index)
+        ]
 
         if not test_dirs:
             results["recommendations"].append("Create a tests directory")
@@ -700,13 +1202,14 @@ class TestValidator:
 
         # Analyze test files
         for test_dir in test_dirs:
-            for test_file in test_dir.rglob("*.py"):
+            test_index = file_index or FileIndex(test_dir)
+            for test_file in test_index.py_files_under(test_dir):
                 if test_file.name.startswith("test_") or test_file.name.endswith("_test.py"):
                     results["test_files"].append(str(test_file.relative_to(package_dir)))
 
                     # Analyze test file content
                     try:
-                        content = test_file.read_text()
+                        content = test_index.read_text(test_file)
                         test_analysis = self._analyze_test_file(content)
                         results["test_functions"] += test_analysis["functions"]
                         results["test_classes"] += test_analysis["classes"]
@@ -721,10 +1224,9 @@ class TestValidator:
 
         # Check for coverage configuration
         coverage_files = [".coveragerc", "pyproject.toml", "setup.cfg"]
-        for coverage_file in coverage_files:
-            if (package_dir / coverage_file).exists():
-                results["coverage_configurable"] = True
-                break
+        results["coverage_configurable"] = any(
+            _has_entry(package_dir, name, file_index) for name in coverage_files
+        )
 
         # Generate recommendations
         if results["test_functions"] == 0:
@@ -749,7 +1251,7 @@ class TestValidator:
         try:
             tree = ast.parse(content)
 
-            for node in ast.walk(tree):
+            for node in _walk_nodes(tree, (ast.FunctionDef, ast.ClassDef)):
                 if isinstance(node, ast.FunctionDef):
                     if node.name.startswith("test_"):
                         analysis["functions"] += 1
@@ -790,9 +1292,6 @@ class TestValidator:
         }
 
         try:
-            import json
-            import subprocess
-
             # Try to run coverage
             cmd = [
                 sys.executable,
@@ -812,17 +1311,13 @@ class TestValidator:
             # Look for coverage.json
             coverage_file = package_dir / "coverage.json"
             if coverage_file.exists():
-                with open(coverage_file) as f:
-                    coverage_data = json.load(f)
+                total_coverage, files = _read_coverage_report(coverage_file)
 
                 results["coverage_available"] = True
-                results["total_coverage"] = coverage_data.get("totals", {}).get(
-                    "percent_covered", 0
-                )
+                results["total_coverage"] = total_coverage
 
                 # File-level coverage
-                files = coverage_data.get("files", {})
-                for filename, file_data in files.items():
+                for filename, file_data in files:
                     results["file_coverage"][filename] = file_data.get("summary", {}).get(
                         "percent_covered", 0
                     )
@@ -905,13 +1400,17 @@ class DocumentationValidator:
                     results["sections_found"].append(section)
                 else:
                     results["sections_missing"].append(section)
+            found = set(results["sections_found"])
 
             # Check for badges
             if any(badge in content for badge in ["![", "https://img.shields.io", "badge"]):
                 results["has_badges"] = True
 
-            # Check for examples
-            if any(example in content for example in ["```", "example", "usage"]):
+            # Check for examples; a found "usage" or "examples" section already
+            # proves a marker is present, so only rescan the content otherwise
+            if "usage" in found or "examples" in found:
+                results["has_examples"] = True
+            elif "```" in content or "example" in content:
                 results["has_examples"] = True
 
             # Calculate quality score
@@ -944,12 +1443,60 @@ class DocumentationValidator:
 
         return results
 
-    def validate_docstrings(self, package_dir: Path) -> Dict[str, Any]:
+    def validate_docstrings(
+        self, package_dir: Path, file_index: Optional[FileIndex] = None
+    ) -> Dict[str, Any]:
         """
         Validate docstring coverage and quality.
 
         Args:
             package_dir: Path to package directory
+            file_index: Optional shared index of the package's files
+
+        Returns:
+            Dict containing docstring validation results
+        """
+        python_files = self._find_source_files(package_dir, file_index)
+        if python_files is None:
+            return self._summarize_docstrings(None)
+
+        analyses = [_analyze_docstrings_file(str(py_file)) for py_file in python_files]
+        return self._summarize_docstrings(analyses)
+
+    def _find_source_files(
+        self, package_dir: Path, file_index: Optional[FileIndex] = None
+    ) -> Optional[List[Path]]:
+        """
+        Find the source files subject to docstring analysis.
+
+        Returns None when the package has no Python sources at all; special
+        modules such as ``__init__.py`` are found but not returned.
+        """
+        src_dirs = ["src", package_dir.name]
+        python_files = []
+
+        for src_dir_name in src_dirs:
+            src_dir = package_dir / src_dir_name
+            if src_dir.exists():
+                python_files.extend((file_index or FileIndex(src_dir)).py_files_under(src_dir))
+                break
+
+        if not python_files:
+            return None
+
+        # Skip __init__.py, __main__.py etc.
+        return [
+            py_file
+            for py_file in python_files
+            if not (py_file.name.startswith("__") and py_file.name.endswith("__.py"))
+        ]
+
+    def _summarize_docstrings(self, analyses: Optional[List[Dict[str, Any]]]) -> Dict[str, Any]:
+        """
+        Aggregate per-file docstring analyses into coverage results.
+
+        Args:
+            analyses: Per-file analyses, or None if no source files were found
 
         Returns:
             Dict containing docstring validation results
@@ -966,41 +1513,25 @@ class DocumentationValidator:
             "recommendations": [],
         }
 
-        # Find Python source files
-        src_dirs = ["src", package_dir.name]
-        python_files = []
-
-        for src_dir_name in src_dirs:
-            src_dir = package_dir / src_dir_name
-            if src_dir.exists():
-                python_files.extend(src_dir.rglob("*.py"))
-                break
-
-        if not python_files:
+        if analyses is None:
             results["recommendations"].append("No Python source files found")
             return results
 
-        for py_file in python_files:
-            if py_file.name.startswith("__") and py_file.name.endswith("__.py"):
-                continue  # Skip __init__.py, __main__.py etc.
-
-            try:
-                content = py_file.read_text()
-                file_analysis = self._analyze_docstrings(content, py_file.name)
+        for file_analysis in analyses:
+            if "error" in file_analysis:
+                results["quality_issues"].append(file_analysis["error"])
+                continue
 
-                results["total_functions"] += file_analysis["total_functions"]
-                results["documented_functions"] += file_analysis["documented_functions"]
-                results["total_classes"] += file_analysis["total_classes"]
-                results["documented_classes"] += file_analysis["documented_classes"]
-                results["total_modules"] += 1
+            results["total_functions"] += file_analysis["total_functions"]
+            results["documented_functions"] += file_analysis["documented_functions"]
+            results["total_classes"] += file_analysis["total_classes"]
+            results["documented_classes"] += file_analysis["documented_classes"]
+            results["total_modules"] += 1
 
-                if file_analysis["has_module_docstring"]:
-                    results["documented_modules"] += 1
+            if file_analysis["has_module_docstring"]:
+                results["documented_modules"] += 1
 
-                results["quality_issues"].extend(file_analysis["quality_issues"])
-
-            except Exception as e:
-                results["quality_issues"].append(f"Failed to analyze {py_file}: {str(e)}")
+            results["quality_issues"].extend(file_analysis["quality_issues"])
 
         # Calculate coverage
         total_items = (
@@ -1029,69 +1560,17 @@ class DocumentationValidator:
 
     def _analyze_docstrings(self, content: str, filename: str) -> Dict[str, Any]:
         """Analyze docstrings in a single file."""
-        analysis = {
-            "total_functions": 0,
-            "documented_functions": 0,
-            "total_classes": 0,
-            "documented_classes": 0,
-            "has_module_docstring": False,
-            "quality_issues": [],
-        }
-
-        try:
-            tree = ast.parse(content)
-
-            # Check module docstring
-            if ast.get_docstring(tree):
-                analysis["has_module_docstring"] = True
+        return _analyze_docstrings_source(content, filename)
 
-            for node in ast.walk(tree):
-                if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                    # Skip private methods and special methods for now
-                    if not node.name.startswith("_"):
-                        analysis["total_functions"] += 1
-
-                        docstring = ast.get_docstring(node)
-                        if docstring:
-                            analysis["documented_functions"] += 1
-
-                            # Check docstring quality
-                            if len(docstring.strip()) < 20:
-                                analysis["quality_issues"].append(
-                                    f"{filename}: Function '{node.name}' has very short docstring"
-                                )
-                        else:
-                            analysis["quality_issues"].append(
-                                f"{filename}: Function '{node.name}' missing docstring"
-                            )
-
-                elif isinstance(node, ast.ClassDef):
-                    analysis["total_classes"] += 1
-
-                    docstring = ast.get_docstring(node)
-                    if docstring:
-                        analysis["documented_classes"] += 1
-
-                        if len(docstring.strip()) < 30:
-                            analysis["quality_issues"].append(
-                                f"{filename}: Class '{node.name}' has very short docstring"
-                            )
-                    else:
-                        analysis["quality_issues"].append(
-                            f"{filename}: Class '{node.name}' missing docstring"
-                        )
-
-        except Exception as e:
-            analysis["quality_issues"].append(f"{filename}: Docstring analysis failed: {str(e)}")
-
-        return analysis
-
-    def validate_api_docs(self, package_dir: Path) -> Dict[str, Any]:
+    def validate_api_docs(
+        self, package_dir: Path, file_index: Optional[FileIndex] = None
+    ) -> Dict[str, Any]:
         """
         Validate API documentation structure.
 
         Args:
             package_dir: Path to package directory
+            file_index: Optional shared index of the package's files
 
         Returns:
             Dict containing API documentation validation results
@@ -1119,11 +1598,10 @@ class DocumentationValidator:
                 results["config_found"] = True
 
             # Check for API documentation
-            api_patterns = ["api.rst", "api.md", "reference.rst", "reference.md"]
-            for pattern in api_patterns:
-                if list(docs_dir.rglob(pattern)):
-                    results["api_docs_generated"] = True
-                    break
+            api_patterns = {"api.rst", "api.md", "reference.rst", "reference.md"}
+            doc_files = (file_index or FileIndex(docs_dir)).files_under(docs_dir)
+            if any(doc_file.name in api_patterns for doc_file in doc_files):
+                results["api_docs_generated"] = True
 
             # Try to build documentation
             if results["doc_format"] == "sphinx":
@@ -1146,8 +1624,6 @@ class DocumentationValidator:
     def _test_sphinx_build(self, docs_dir: Path) -> bool:
         """Test if Sphinx documentation builds successfully."""
         try:
-            import subprocess
-
             # Look for Makefile or make.bat
             if (docs_dir / "Makefile").exists():
                 result = subprocess.run(
@@ -1172,8 +1648,6 @@ class DocumentationValidator:
     def _test_mkdocs_build(self, docs_dir: Path) -> bool:
         """Test if MkDocs documentation builds successfully."""
         try:
-            import subprocess
-
             result = subprocess.run(
                 ["mkdocs", "build"],
                 cwd=docs_dir.parent,  # mkdocs.yml is usually in project root
@@ -1206,6 +1680,10 @@ class QualityValidator:
         """
         Perform comprehensive package quality validation.
 
+        Results are remembered per package and options; re-validating a
+        package whose files are unchanged since the last run returns a copy
+        of the earlier results without re-running any checks.
+
         Args:
             package_dir: Path to package directory
             run_tests: Whether to run test validation
@@ -1227,6 +1705,19 @@ class QualityValidator:
             "summary": {},
         }
 
+        # Walk the package once and share the listing between validators
+        file_index = FileIndex(package_dir)
+
+        cache_key = (str(Path(package_dir).resolve()), run_tests, check_security, analyze_docs)
+        fingerprint = file_index.fingerprint()
+        with _RESULTS_CACHE_LOCK:
+            cached = _RESULTS_CACHE.get(cache_key)
+            if cached is not None:
+                _RESULTS_CACHE.move_to_end(cache_key)
+        if cached is not None and cached[0] == fingerprint:
+            logger.info(f"Package unchanged since last validation, reusing results: {package_dir}")
+            return copy.deepcopy(cached[1])
+
         logger.info(f"Starting comprehensive quality validation for {package_dir}")
 
         # 1. Package Structure Validation
@@ -1235,17 +1726,17 @@ class QualityValidator:
 
         # 2. Code Quality Validation
         logger.info("Validating code quality...")
-        results["code_quality"] = await self._validate_all_code(package_dir)
+        results["code_quality"] = await self._validate_all_code(package_dir, file_index)
 
         # 3. Security Validation
         if check_security:
             logger.info("Performing security validation...")
-            results["security"] = await self._validate_security(package_dir)
+            results["security"] = await self._validate_security(package_dir, file_index)
 
         # 4. Test Validation
         if run_tests:
             logger.info("Validating tests...")
-            results["tests"] = self.test_validator.validate_tests(package_dir)
+            results["tests"] = self.test_validator.validate_tests(package_dir, file_index)
 
             # Run coverage analysis if tests exist
             if results["tests"]["has_tests"]:
@@ -1255,7 +1746,7 @@ class QualityValidator:
         # 5. Documentation Validation
         if analyze_docs:
             logger.info("Validating documentation...")
-            results["documentation"] = await self._validate_documentation(package_dir)
+            results["documentation"] = await self._validate_documentation(package_dir, file_index)
 
         # 6. Calculate Overall Score and Grade
         results["overall_score"], results["grade"] = self._calculate_overall_score(results)
@@ -1268,9 +1759,17 @@ class QualityValidator:
             f"Quality validation completed. Overall score: {results['overall_score']:.1f} ({results['grade']})"
         )
 
+        with _RESULTS_CACHE_LOCK:
+            _RESULTS_CACHE[cache_key] = (fingerprint, copy.deepcopy(results))
+            _RESULTS_CACHE.move_to_end(cache_key)
+            if len(_RESULTS_CACHE) > _RESULTS_CACHE_SIZE:
+                _RESULTS_CACHE.popitem(last=False)
+
         return results
 
-    async def _validate_all_code(self, package_dir: Path) -> Dict[str, Any]:
+    async def _validate_all_code(
+        self, package_dir: Path, file_index: Optional[FileIndex] = None
+    ) -> Dict[str, Any]:
         """Validate all Python code in the package."""
         results = {
             "files_analyzed": 0,
@@ -1282,35 +1781,29 @@ class QualityValidator:
             "overall_quality_score": 0.0,
         }
 
-        # Find all Python files
-        python_files = []
-        for pattern in ["*.py", "**/*.py"]:
-            python_files.extend(package_dir.rglob(pattern))
+        file_index = file_index or FileIndex(package_dir)
 
-        # Filter out __pycache__ and other non-source files
-        python_files = [
-            f for f in python_files if "__pycache__" not in str(f) and not f.name.startswith(".")
-        ]
+        # Find all Python files, filtering out hidden non-source files
+        python_files = [f for f in file_index.py_files if not f.name.startswith(".")]
 
         results["files_analyzed"] = len(python_files)
 
         total_score = 0.0
         for py_file in python_files:
             try:
-                content = py_file.read_text()
+                content = file_index.read_text(py_file)
                 file_score = 0.0
+                checks = self.code_validator.analyze(content)
 
                 # Syntax validation
-                syntax_valid, syntax_errors = self.code_validator.validate_syntax(content)
+                syntax_valid, syntax_errors = checks["syntax"]
                 if not syntax_valid:
                     results["syntax_errors"].extend([f"{py_file}: {err}" for err in syntax_errors])
                 else:
                     file_score += 25  # 25 points for valid syntax
 
                 # Naming conventions
-                naming_valid, naming_issues = self.code_validator.validate_naming_conventions(
-                    content
-                )
+                naming_valid, naming_issues = checks["naming"]
                 if not naming_valid:
                     results["naming_issues"].extend(
                         [f"{py_file}: {issue}" for issue in naming_issues]
@@ -1319,7 +1812,7 @@ class QualityValidator:
                     file_score += 20  # 20 points for good naming
 
                 # Docstrings
-                doc_valid, doc_issues = self.code_validator.validate_docstrings(content)
+                doc_valid, doc_issues = checks["docstrings"]
                 if not doc_valid:
                     results["docstring_issues"].extend(
                         [f"{py_file}: {issue}" for issue in doc_issues]
@@ -1328,7 +1821,7 @@ class QualityValidator:
                     file_score += 25  # 25 points for docstrings
 
                 # Type hints
-                type_valid, type_issues = self.code_validator.validate_type_hints(content)
+                type_valid, type_issues = checks["type_hints"]
                 if not type_valid:
                     results["type_hint_issues"].extend(
                         [f"{py_file}: {issue}" for issue in type_issues]
@@ -1337,9 +1830,7 @@ class QualityValidator:
                     file_score += 20  # 20 points for type hints
 
                 # Complexity
-                complexity_valid, complexity_issues = self.code_validator.validate_complexity(
-                    content
-                )
+                complexity_valid, complexity_issues = checks["complexity"]
                 if not complexity_valid:
                     results["complexity_issues"].extend(
                         [f"{py_file}: {issue}" for issue in complexity_issues]
@@ -1358,7 +1849,9 @@ class QualityValidator:
 
         return results
 
-    async def _validate_security(self, package_dir: Path) -> Dict[str, Any]:
+    async def _validate_security(
+        self, package_dir: Path, file_index: Optional[FileIndex] = None
+    ) -> Dict[str, Any]:
         """Validate security aspects of the package."""
         results = {
             "code_security": {"secure": True, "issues": []},
@@ -1366,11 +1859,14 @@ class QualityValidator:
             "overall_secure": True,
         }
 
-        # Validate code security
-        python_files = list(package_dir.rglob("*.py"))
-        for py_file in python_files:
+        # Validate code security, skipping files too small to hold any finding
+        # without reading them
+        file_index = file_index or FileIndex(package_dir)
+        for py_file in file_index.py_files:
             try:
-                content = py_file.read_text()
+                if file_index.size(py_file) < self.security_validator.min_finding_size:
+                    continue
+                content = file_index.read_text(py_file)
                 security_results = self.security_validator.validate_security(content)
 
                 if not security_results["secure"]:
@@ -1407,26 +1903,27 @@ class QualityValidator:
 
         return results
 
-    async def _validate_documentation(self, package_dir: Path) -> Dict[str, Any]:
+    async def _validate_documentation(
+        self, package_dir: Path, file_index: Optional[FileIndex] = None
+    ) -> Dict[str, Any]:
         """Validate documentation quality."""
         results = {"readme": {}, "docstrings": {}, "api_docs": {}, "overall_doc_score": 0.0}
 
         # Validate README
         readme_files = ["README.md", "README.rst", "README.txt"]
         for readme_name in readme_files:
-            readme_path = package_dir / readme_name
-            if readme_path.exists():
-                results["readme"] = self.doc_validator.validate_readme(readme_path)
+            if _has_entry(package_dir, readme_name, file_index):
+                results["readme"] = self.doc_validator.validate_readme(package_dir / readme_name)
                 break
 
         if not results["readme"]:
             results["readme"] = {"exists": False, "quality_score": 0.0}
 
         # Validate docstrings
-        results["docstrings"] = self.doc_validator.validate_docstrings(package_dir)
+        results["docstrings"] = await self._validate_docstrings(package_dir, file_index)
 
         # Validate API documentation
-        results["api_docs"] = self.doc_validator.validate_api_docs(package_dir)
+        results["api_docs"] = self.doc_validator.validate_api_docs(package_dir, file_index)
 
         # Calculate overall documentation score
         readme_score = results["readme"].get("quality_score", 0) * 0.4
@@ -1437,6 +1934,52 @@ class QualityValidator:
 
         return results
 
+    async def _validate_docstrings(
+        self, package_dir: Path, file_index: Optional[FileIndex] = None
+    ) -> Dict[str, Any]:
+        """Validate docstrings, parsing source files across worker processes."""
+        file_index = file_index or FileIndex(package_dir)
+        python_files = self.doc_validator._find_source_files(package_dir, file_index)
+        if python_files is None:
+            return self.doc_validator._summarize_docstrings(None)
+
+        # Sources come from the index, so files already read by the code and
+        # security checks are not read again; workers only parse
+        analyses: List[Optional[Dict[str, Any]]] = []
+        sources = {}
+        for position, py_file in enumerate(python_files):
+            try:
+                sources[position] = (file_index.read_text(py_file), py_file.name)
+                analyses.append(None)
+            except Exception as e:
+                analyses.append({"error": f"Failed to analyze {py_file}: {str(e)}"})
+
+        if len(sources) < _PARALLEL_MIN_FILES:
+            for position, source in sources.items():
+                analyses[position] = _analyze_docstrings_source(*source)
+            return self.doc_validator._summarize_docstrings(analyses)
+
+        loop = asyncio.get_running_loop()
+        pool = None
+        try:
+            pool = _get_process_pool()
+            parsed = await asyncio.gather(
+                *(
+                    loop.run_in_executor(pool, _analyze_docstrings_source, *source)
+                    for source in sources.values()
+                )
+            )
+        except (BrokenProcessPool, OSError) as e:
+            logger.warning(f"Parallel docstring analysis unavailable, running inline: {e}")
+            if pool is not None:
+                _discard_process_pool(pool)
+            parsed = [_analyze_docstrings_source(*source) for source in sources.values()]
+
+        for position, analysis in zip(sources, parsed):
+            analyses[position] = analysis
+
+        return self.doc_validator._summarize_docstrings(analyses)
+
     def _calculate_overall_score(self, results: Dict[str, Any]) -> Tuple[float, str]:
         """Calculate overall quality score and grade."""
         scores = []
@@ -1485,28 +2028,7 @@ class QualityValidator:
             overall_score = 0.0
 
         # Determine grade
-        if overall_score >= 90:
-            grade = "A+"
-        elif overall_score >= 85:
-            grade = "A"
-        elif overall_score >= 80:
-            grade = "A-"
-        elif overall_score >= 75:
-            grade = "B+"
-        elif overall_score >= 70:
-            grade = "B"
-        elif overall_score >= 65:
-            grade = "B-"
-        elif overall_score >= 60:
-            grade = "C+"
-        elif overall_score >= 55:
-            grade = "C"
-        elif overall_score >= 50:
-            grade = "C-"
-        elif overall_score >= 40:
-            grade = "D"
-        else:
-            grade = "F"
+        grade = _GRADES[bisect.bisect_right(_GRADE_THRESHOLDS, overall_score)]
 
         return overall_score, grade
 
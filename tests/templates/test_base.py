@@ -0,0 +1,128 @@
+"""
+Tests for the template manager.
+"""
+
+import asyncio
+import os
+import stat
+
+import pytest
+
+from openpypi.templates.base import TemplateManager
+
+
+@pytest.fixture
+def manager(tmp_path):
+    """Template manager over a fresh templates directory with the built-ins."""
+    return TemplateManager(tmp_path / "templates")
+
+
+class TestTemplateManager:
+    """Test template storage, caching and application."""
+
+    def test_builtins_created_without_extra_files(self, manager):
+        """Test that only the built-in template directories are written."""
+        names = sorted(os.listdir(manager.templates_dir))
+
+        assert names == ["cli_tool", "data_science", "library", "ml_toolkit", "web_api"]
+
+    def test_builtins_not_recreated(self, manager, monkeypatch):
+        """Test that a directory with every built-in skips initialization."""
+        monkeypatch.setattr(
+            TemplateManager,
+            "_initialize_builtin_templates",
+            lambda self: pytest.fail("built-ins initialized again"),
+        )
+
+        TemplateManager(manager.templates_dir)
+
+    @pytest.mark.asyncio
+    async def test_list_templates(self, manager):
+        """Test that every template is loaded and returned sorted by name."""
+        templates = await manager.list_templates()
+
+        assert [t.name for t in templates] == sorted(os.listdir(manager.templates_dir))
+
+    @pytest.mark.asyncio
+    async def test_get_template_returns_isolated_copies(self, manager):
+        """Test that mutating a returned template does not affect later calls."""
+        first = await manager.get_template("cli_tool")
+        first.dependencies.append("mutated")
+        first.description = "mutated"
+
+        second = await manager.get_template("cli_tool")
+
+        assert second is not first
+        assert "mutated" not in second.dependencies
+        assert second.description != "mutated"
+
+    @pytest.mark.asyncio
+    async def test_get_template_sees_updates(self, manager):
+        """Test that a changed metadata file is loaded again."""
+        await manager.get_template("library")
+        await manager.update_template("library", description="Updated description")
+
+        template = await manager.get_template("library")
+
+        assert template.description == "Updated description"
+        assert template.updated_at is not None
+
+    @pytest.mark.asyncio
+    async def test_concurrent_updates(self, manager):
+        """Test that concurrent updates of one template never clobber each other's writes."""
+
+        def update(index):
+            return asyncio.run(manager.update_template("cli_tool", version=f"1.{index}.0"))
+
+        loop = asyncio.get_running_loop()
+        results = await asyncio.gather(
+            *(loop.run_in_executor(None, update, index) for index in range(50))
+        )
+
+        assert all(results)
+        template_dir = manager.templates_dir / "cli_tool"
+        assert not [name for name in os.listdir(template_dir) if name.endswith(".tmp")]
+        template = await manager.get_template("cli_tool")
+        assert template.version.startswith("1.")
+
+    @pytest.mark.asyncio
+    async def test_create_template_structure(self, manager):
+        """Test that nested structures become directories and files, keeping existing files."""
+        template_dir = await manager.create_template(
+            "custom",
+            "Custom template",
+            "library",
+            ["Feature"],
+            structure={"src": {"pkg": {"__init__.py": "", "core.py": "VALUE = 1\n"}}, "a.txt": "a"},
+        )
+
+        core = template_dir / "src" / "pkg" / "core.py"
+        assert core.read_text() == "VALUE = 1\n"
+        assert (template_dir / "src" / "pkg" / "__init__.py").read_text() == (
+            "# Module implementation\n"
+        )
+        assert (template_dir / "a.txt").read_text() == "a"
+
+        core.write_text("edited\n")
+        manager._create_directory_structure(template_dir, {"src": {"pkg": {"core.py": "x"}}})
+        assert core.read_text() == "edited\n"
+
+    @pytest.mark.asyncio
+    async def test_apply_template_substitutes_and_keeps_modes(self, manager, tmp_path):
+        """Test that applied files get substitutions and keep their mode bits."""
+        template_dir = manager.templates_dir / "cli_tool"
+        script = template_dir / "scripts" / "run_{package_name}.sh"
+        script.parent.mkdir()
+        script.write_text("#!/bin/sh\necho {package_name}\n")
+        script.chmod(0o755)
+        (template_dir / "data.bin").write_bytes(b"\xff{package_name}")
+
+        target = tmp_path / "out"
+        result = await manager.apply_template("cli_tool", target, "demo")
+
+        applied = target / "scripts" / "run_demo.sh"
+        assert str(applied) in result["files_created"]
+        assert applied.read_text() == "#!/bin/sh\necho demo\n"
+        assert stat.S_IMODE(applied.stat().st_mode) == 0o755
+        assert (target / "data.bin").read_bytes() == b"\xff{package_name}"
+        assert (target / "pyproject.toml").exists()
@@ -3,6 +3,11 @@ Tests for the stage pipeline system.
 """
 
 import asyncio
+import json
+import shutil
+import stat
+import sys
+import threading
 from datetime import datetime
 from typing import Any, Dict
 from unittest.mock import Mock, patch
@@ -20,6 +25,7 @@ from openpypi.stages import (
     register_stage,
     registry,
 )
+from openpypi.stages import validation
 
 
 class TestStage:
@@ -368,15 +374,20 @@ class TestValidationStage:
 
         context = {"project_config": config, "output_dir": "/tmp/test"}
 
-        with patch("pathlib.Path.parent") as mock_parent:
-            mock_parent.exists.return_value = True
-            mock_parent.is_dir.return_value = True
+        with patch("openpypi.stages.validation.os.stat") as mock_stat:
+            mock_stat.return_value.st_mode = stat.S_IFDIR
 
             result = stage.execute(context)
 
         assert result.status == StageStatus.SUCCESS
         assert "validated_config" in result.data
         assert "validation_results" in result.data
+        assert all(v["valid"] for v in result.data["validation_results"].values())
+        assert result.data["validation_results"]["package_name"]["message"] == (
+            "Package name is valid"
+        )
+        # Stage data is serialized by the API and CLI
+        json.dumps(result.data["validation_results"])
 
     def test_validation_stage_invalid_package_name(self):
         """Test validation with invalid package name."""
@@ -419,6 +430,68 @@ class TestValidationStage:
         assert result.status == StageStatus.FAILED
         assert "email" in result.message
 
+    def test_validation_stage_fail_fast(self):
+        """Test that fail_fast stops at the first failed validation."""
+        stage = ValidationStage("validation", {"fail_fast": True})
+
+        config = Config(
+            package_name="123invalid",
+            project_name="Test Project",
+            author="Test Author",
+            email="invalid-email",
+            version="1.0.0",
+            python_requires=">=3.8",
+        )
+
+        context = {"project_config": config, "output_dir": "/tmp/test"}
+
+        result = stage.execute(context)
+
+        assert result.status == StageStatus.FAILED
+        assert "package_name" in result.message
+        assert "email" not in result.data["validation_results"]
+
+    def test_validation_stage_reuses_results(self, tmp_path):
+        """Test that identical configs are validated only once."""
+        stage = ValidationStage("validation")
+
+        config = Config(
+            package_name="test_package",
+            project_name="Test Project",
+            author="Test Author",
+            email="test@example.com",
+            version="1.0.0",
+            python_requires=">=3.8",
+        )
+        context = {"project_config": config, "output_dir": str(tmp_path / "project")}
+
+        first = stage.execute(context)
+        # With no validators left, only a cache hit can reproduce the results
+        with patch.object(validation, "_VALIDATORS", ()):
+            second = stage.execute(context)
+
+        assert first.status == second.status == StageStatus.SUCCESS
+        assert first.data["validation_results"] == second.data["validation_results"]
+
+    def test_validation_cache_is_per_instance_and_bounded(self, tmp_path, monkeypatch):
+        """Test that each stage keeps its own cache, evicting the least recently used config."""
+        monkeypatch.setattr(validation, "_VALIDATION_CACHE_SIZE", 2)
+        stage = ValidationStage("validation")
+
+        for version in ("1.0.0", "1.0.1", "1.0.2"):
+            config = Config(
+                package_name="test_package",
+                project_name="Test Project",
+                author="Test Author",
+                email="test@example.com",
+                version=version,
+                python_requires=">=3.8",
+            )
+            stage.execute({"project_config": config, "output_dir": str(tmp_path / "project")})
+
+        assert [key[5] for key in stage._validation_cache] == ["1.0.1", "1.0.2"]
+        assert not ValidationStage("validation")._validation_cache
+
     def test_validation_stage_invalid_version(self):
         """Test validation with invalid version."""
         stage = ValidationStage("validation")
@@ -439,6 +512,99 @@ class TestValidationStage:
         assert result.status == StageStatus.FAILED
         assert "version" in result.message
 
+    @pytest.mark.parametrize("name, valid", [("async", False), ("await", False), ("print", True)])
+    def test_package_name_keywords(self, name, valid):
+        """Test that package names are checked against the current keyword list."""
+        result = validation._validate_package_name(name)
+
+        assert result["valid"] is valid
+
+    @pytest.mark.parametrize(
+        "version, valid",
+        [
+            ("1.0.0", True),
+            ("0.10.2-alpha.1+build.5", True),
+            ("1.0.0-x-y-z.--", True),
+            ("1.0", False),
+            ("01.0.0", False),
+            ("1.0.0-01", False),
+            ("1.0.0-", False),
+            ("1.0.0+", False),
+            ("1.0.0-alpha..1", False),
+        ],
+    )
+    def test_version_semver(self, version, valid):
+        """Test semantic version parsing."""
+        result = validation._validate_version(version)
+
+        assert result["valid"] is valid
+
+    @pytest.mark.parametrize(
+        "email, valid",
+        [
+            ("test@example.com", True),
+            ("first.last+tag@mail.example.org", True),
+            ("@example.com", False),
+            ("test@", False),
+            ("test@example", False),
+            ("test@example.c0m", False),
+            ("te st@example.com", False),
+        ],
+    )
+    def test_email_format(self, email, valid):
+        """Test email address checks."""
+        result = validation._validate_email(email)
+
+        assert result["valid"] is valid
+
+    @pytest.mark.parametrize(
+        "python_requires, valid",
+        [
+            (">=3.8", True),
+            (">=3.8, <4.0", True),
+            ("==3.8.*", True),
+            (" >=3.8", False),
+            (">=3.8,", False),
+            (">=3", False),
+            ("~=3.8", False),
+        ],
+    )
+    def test_python_requires_clauses(self, python_requires, valid):
+        """Test python_requires parsing clause by clause."""
+        result = validation._validate_python_version(python_requires)
+
+        assert result["valid"] is valid
+
+    @pytest.mark.parametrize(
+        "dependency, valid",
+        [
+            ("requests", True),
+            ("uvicorn[standard]", True),
+            ("pydantic>=2.0", True),
+            ("fastapi[all]==0.104.1", True),
+            ("-requests", False),
+            ("requests>=", False),
+            ("requests >=2.0", False),
+            ("uvicorn[standard", False),
+        ],
+    )
+    def test_dependency_specs(self, dependency, valid):
+        """Test dependency spec scanning."""
+        result = validation._validate_dependencies([dependency])
+
+        assert result["valid"] is valid
+
+    def test_output_directory_parent(self, tmp_path):
+        """Test output directory checks against its parent path."""
+        parent_file = tmp_path / "file.txt"
+        parent_file.write_text("")
+
+        assert validation._validate_output_directory(str(tmp_path / "project"))["valid"] is True
+        missing = validation._validate_output_directory(str(tmp_path / "missing" / "project"))
+        assert "does not exist" in missing["message"]
+        not_dir = validation._validate_output_directory(str(parent_file / "project"))
+        assert "not a directory" in not_dir["message"]
+
     def test_validation_stage_no_config(self):
         """Test validation with missing configuration."""
         stage = ValidationStage("validation")
@@ -451,6 +617,113 @@ class TestValidationStage:
         assert "No project configuration found" in result.message
 
 
+class TestTestingStage:
+    """Test the TestingStage implementation."""
+
+    def test_security_scan_in_process(self, tmp_path):
+        """Test bandit runs in-process and reports findings like the CLI."""
+        pytest.importorskip("bandit")
+        from openpypi.stages.testing import TestingStage
+
+        src_dir = tmp_path / "src"
+        src_dir.mkdir()
+        (src_dir / "module.py").write_text('import subprocess\nsubprocess.call("ls", shell=True)\n')
+
+        with patch("subprocess.run") as mock_run:
+            result = TestingStage("testing")._run_security_scan(tmp_path)
+
+        mock_run.assert_not_called()
+        assert result["success"] is True
+        assert result["exit_code"] == 1
+        report = json.loads(result["stdout"])
+        assert any(issue["test_id"] == "B602" for issue in report["results"])
+
+    def test_security_scan_timeout_is_reported(self, tmp_path, monkeypatch):
+        """Test that a hung in-process scan fails the check without starting a second scan."""
+        from openpypi.stages import testing
+
+        release = threading.Event()
+        monkeypatch.setattr(testing, "BANDIT_AVAILABLE", True)
+        monkeypatch.setattr(testing, "BANDIT_TIMEOUT", 0.1)
+        monkeypatch.setattr(
+            testing.TestingStage, "_run_bandit_in_process", lambda self, path: release.wait(5)
+        )
+
+        try:
+            with patch("subprocess.run") as mock_run:
+                result = testing.TestingStage("testing")._run_security_scan(tmp_path)
+        finally:
+            release.set()
+
+        mock_run.assert_not_called()
+        assert result == {"success": False, "error": "bandit timed out"}
+
+    @pytest.mark.parametrize("exit_code, success", [(0, True), (1, True), (2, False)])
+    def test_security_scan_cli_exit_codes(self, tmp_path, monkeypatch, exit_code, success):
+        """Test that the bandit CLI treats 'issues found' as a successful scan."""
+        from openpypi.stages import testing
+
+        monkeypatch.setattr(testing, "BANDIT_AVAILABLE", False)
+
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = Mock(returncode=exit_code, stdout="{}", stderr="")
+            result = testing.TestingStage("testing")._run_security_scan(tmp_path)
+
+        assert mock_run.call_args.kwargs["timeout"] == testing.BANDIT_TIMEOUT
+        assert result["success"] is success
+        assert result["exit_code"] == exit_code
+
+    def test_linting_with_ruff(self, tmp_path):
+        """Test that ruff replaces the separate linters when selected."""
+        if shutil.which("ruff") is None:
+            pytest.skip("ruff is not installed")
+        from openpypi.stages.testing import TestingStage
+
+        (tmp_path / "src").mkdir()
+        (tmp_path / "tests").mkdir()
+        (tmp_path / "src" / "module.py").write_text("import os\n")
+
+        result = TestingStage("testing", {"linter": "ruff"})._run_linting(tmp_path)
+
+        assert not result["success"]
+        assert set(result) == {"success", "ruff", "ruff_format"}
+        assert [issue["code"] for issue in result["ruff"]["issues"]] == ["F401"]
+
+    def test_linting_defaults_to_legacy_tools(self, tmp_path, monkeypatch):
+        """Test that ruff is not picked up from PATH unless it is selected."""
+        from openpypi.stages import testing
+
+        monkeypatch.setattr(testing.shutil, "which", lambda name: "/usr/bin/" + name)
+        monkeypatch.setattr(
+            testing,
+            "LINT_COMMANDS",
+            {tool: [sys.executable, "-c", "pass"] for tool in testing.LINT_COMMANDS},
+        )
+
+        result = testing.TestingStage("testing")._run_linting(tmp_path)
+
+        assert set(result) == {"success", *testing.LINT_COMMANDS}
+
+    def test_linting_drains_verbose_tools_concurrently(self, tmp_path, monkeypatch):
+        """Test that a tool with large output does not stall behind another tool."""
+        from openpypi.stages import testing
+
+        noisy = "import sys; sys.stderr.write('x' * 1000000); sys.stdout.write('y' * 1000000)"
+        monkeypatch.setattr(
+            testing,
+            "LINT_COMMANDS",
+            {
+                "slow": [sys.executable, "-c", "import time; time.sleep(0.5)"],
+                "noisy": [sys.executable, "-c", noisy],
+            },
+        )
+
+        result = testing.TestingStage("testing", {"linter": "legacy"})._run_linting(tmp_path)
+
+        assert result["success"] is True
+        assert len(result["noisy"]["stderr"]) == len(result["noisy"]["stdout"]) == 1000000
+
+
 class TestStageRegistry:
     """Test the stage registry."""
 
@@ -0,0 +1,120 @@
+"""
+Tests for the formatting and project generation utilities.
+"""
+
+import pytest
+
+from openpypi.utils import formatters
+from openpypi.utils.formatters import CodeFormatter, ConfigFormatter, ProjectGenerator
+
+
+class TestCodeFormatter:
+    """Test code formatting helpers."""
+
+    def test_black_formatter_is_built_once_per_line_length(self):
+        """Test that the black mode is reused across formatter instances."""
+        pytest.importorskip("black")
+
+        first = formatters._black_formatter(100)
+        assert formatters._black_formatter(100) is first
+        assert formatters._black_formatter(80) is not first
+
+        formatted, warnings = CodeFormatter().format_code("x=1\n", use_isort=False)
+        assert formatted == "x = 1\n"
+        assert warnings == []
+
+    def test_format_many_keeps_input_order(self):
+        """Test that batch formatting returns one result per source, in order."""
+        pytest.importorskip("black")
+
+        results = CodeFormatter().format_many(["a=1\n", "def f(:\n", "b=2\n"], use_isort=False)
+
+        assert [formatted for formatted, _ in results] == ["a = 1\n", "def f(:\n", "b = 2\n"]
+        assert results[0][1] == [] and results[2][1] == []
+        assert results[1][1][0].startswith("Syntax error prevents formatting")
+
+    def test_format_code_reuses_cached_results(self, monkeypatch):
+        """Test that identical sources are only formatted once per settings."""
+        monkeypatch.setattr(formatters, "_FORMAT_CACHE", formatters.OrderedDict())
+        formatter = CodeFormatter()
+        calls = []
+
+        def fake_format(code, use_black, use_isort):
+            calls.append(code)
+            return code.upper(), ["note"]
+
+        monkeypatch.setattr(formatter, "_format_code", fake_format)
+
+        first = formatter.format_code("x = 1\n")
+        first[1].append("caller mutation")
+        assert formatter.format_code("x = 1\n") == ("X = 1\n", ["note"])
+        assert len(calls) == 1
+
+        formatter.line_length = 80
+        formatter.format_code("x = 1\n")
+        assert len(calls) == 2
+
+    @pytest.mark.parametrize("use_black", [True, False])
+    def test_format_code_reports_syntax_errors(self, use_black):
+        """Test that invalid source is returned unchanged with a warning."""
+        code = "def broken(:\n    pass\n"
+
+        formatted, warnings = CodeFormatter().format_code(code, use_black=use_black)
+
+        assert formatted == code
+        assert len(warnings) == 1
+        assert warnings[0].startswith("Syntax error prevents formatting")
+
+
+class TestProjectGenerator:
+    """Test generated test-suite scaffolding."""
+
+    def test_generate_tests_creates_missing_files_once(self, tmp_path):
+        """Test that existing test files are kept and duplicates are not rewritten."""
+        unit_dir = tmp_path / "tests" / "unit"
+        unit_dir.mkdir(parents=True)
+        (unit_dir / "test_utils.py").write_text("# hand-written\n")
+        generator = ProjectGenerator()
+
+        results = generator._generate_tests(tmp_path, "sample", ["core", "utils", "core"], "pytest")
+
+        assert results["files_created"].count("tests/unit/test_core.py") == 1
+        assert "tests/unit/test_utils.py" not in results["files_created"]
+        assert "tests/integration/test_core_integration.py" in results["files_created"]
+        assert (unit_dir / "test_utils.py").read_text() == "# hand-written\n"
+
+        rerun = generator._generate_tests(tmp_path, "sample", ["core", "utils"], "pytest")
+        assert rerun["files_created"] == []
+
+
+class TestConfigFormatter:
+    """Test configuration file generation."""
+
+    def test_default_format_writes_pyproject_once(self, tmp_path):
+        """Test that the default toml path creates pyproject.toml only when missing."""
+        formatter = ConfigFormatter()
+
+        results = formatter.generate_config_files(tmp_path, "sample", {"author": "Ann"})
+        assert results == {
+            "files_created": ["pyproject.toml"],
+            "directories_created": [],
+            "warnings": [],
+        }
+        assert 'name = "sample"' in (tmp_path / "pyproject.toml").read_text()
+
+        rerun = formatter.generate_config_files(tmp_path, "sample", {}, formats=["toml"])
+        assert rerun["files_created"] == []
+
+    def test_pyproject_dependencies_are_toml_strings(self):
+        """Test that dependencies render as double-quoted TOML array entries."""
+        content = ConfigFormatter()._generate_pyproject_toml(
+            "sample", {"dependencies": ["requests>=2.0", 'tomli; python_version<"3.11"']}
+        )
+
+        assert (
+            "dependencies = [\n"
+            '    "requests>=2.0",\n'
+            '    "tomli; python_version<\\"3.11\\"",\n'
+            "]\n"
+        ) in content
+        assert "dependencies = []\n" in ConfigFormatter()._generate_pyproject_toml("sample", {})
@@ -0,0 +1,42 @@
+"""
+Tests for the logging utilities.
+"""
+
+import logging
+
+from openpypi.utils.logger import get_logger
+
+
+class TestGetLogger:
+    """Test logger configuration."""
+
+    def test_default_loggers_share_one_console_handler(self):
+        """Test that default-format loggers reuse the same handler."""
+        first = get_logger("openpypi.tests.shared_a")
+        second = get_logger("openpypi.tests.shared_b", level="DEBUG")
+
+        assert first.handlers == second.handlers
+        assert len(first.handlers) == 1
+        assert second.level == logging.DEBUG
+
+    def test_custom_format_gets_its_own_handler(self):
+        """Test that a custom format string does not alter the shared handler."""
+        shared = get_logger("openpypi.tests.default").handlers[0]
+        custom = get_logger("openpypi.tests.custom", format_string="%(message)s")
+
+        assert custom.handlers[0] is not shared
+        assert custom.handlers[0].formatter._fmt == "%(message)s"
+        assert shared.formatter._fmt != "%(message)s"
+
+    def test_log_file_is_opened_on_first_record(self, tmp_path):
+        """Test that the file handler defers opening the log file."""
+        log_file = tmp_path / "logs" / "app.log"
+        logger = get_logger("openpypi.tests.file", log_file=log_file)
+
+        assert log_file.parent.is_dir()
+        assert not log_file.exists()
+
+        logger.info("hello")
+        for handler in logger.handlers:
+            handler.flush()
+        assert "hello" in log_file.read_text(encoding="utf-8")
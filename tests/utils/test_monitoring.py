@@ -0,0 +1,159 @@
+"""
+Tests for the monitoring utilities.
+"""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("psutil")
+
+from openpypi.utils import monitoring  # noqa: E402
+
+
+class TestSystemMetrics:
+    """Test system metrics collection."""
+
+    def test_snapshot_is_shared_within_ttl(self, monkeypatch):
+        """Test that back-to-back calls reuse one psutil snapshot."""
+        calls = []
+
+        def collect():
+            calls.append(1)
+            return {"cpu_percent": 1.0, "timestamp": "now"}
+
+        monkeypatch.setattr(monitoring, "_collect_system_metrics", collect)
+        monkeypatch.setattr(monitoring, "_system_metrics_snapshot", None)
+
+        first = monitoring.get_system_metrics()
+        first["timestamp"] = "changed by caller"
+        second = monitoring.get_system_metrics()
+
+        assert len(calls) == 1
+        assert second == {"cpu_percent": 1.0, "timestamp": "now"}
+
+    def test_errors_are_not_cached(self, monkeypatch):
+        """Test that a partly failed collection is retried on the next call."""
+        calls = []
+
+        def collect():
+            calls.append(1)
+            return {"errors": {"disk": "boom"}, "timestamp": "now"}
+
+        monkeypatch.setattr(monitoring, "_collect_system_metrics", collect)
+        monkeypatch.setattr(monitoring, "_system_metrics_snapshot", None)
+
+        monitoring.get_system_metrics()
+        monitoring.get_system_metrics()
+
+        assert len(calls) == 2
+
+    def test_failing_section_keeps_other_metrics(self, monkeypatch):
+        """Test that one failing psutil section does not discard the others."""
+
+        def broken_disk():
+            raise OSError("no such mount")
+
+        monkeypatch.setattr(
+            monitoring,
+            "_METRIC_SECTIONS",
+            (("cpu", lambda: {"cpu_percent": 5.0}), ("disk", broken_disk)),
+        )
+
+        metrics = monitoring._collect_system_metrics()
+
+        assert metrics["cpu_percent"] == 5.0
+        assert metrics["errors"] == {"disk": "no such mount"}
+        assert "timestamp" in metrics
+
+    def test_programming_errors_propagate(self, monkeypatch):
+        """Test that bugs in a section are raised rather than reported as metrics errors."""
+
+        def broken_cpu():
+            raise TypeError("bad operand")
+
+        monkeypatch.setattr(monitoring, "_METRIC_SECTIONS", (("cpu", broken_cpu),))
+
+        with pytest.raises(TypeError):
+            monitoring._collect_system_metrics()
+
+
+class TestHealthChecker:
+    """Test health check aggregation."""
+
+    @pytest.mark.asyncio
+    async def test_checks_run_concurrently(self):
+        """Test that async checks overlap and sync checks are still run."""
+        checker = monitoring.HealthChecker()
+        ready = asyncio.Event()
+
+        async def waits_for_peer():
+            await asyncio.wait_for(ready.wait(), timeout=1)
+            return {"status": "healthy"}
+
+        async def signals_peer():
+            ready.set()
+            return {"status": "healthy"}
+
+        checker.register_check("waiter", waits_for_peer)
+        checker.register_check("signaller", signals_peer)
+        checker.register_check("sync", lambda: {"status": "healthy"})
+
+        result = await checker.run_checks()
+
+        assert result["status"] == "healthy"
+        assert list(result["checks"]) == ["waiter", "signaller", "sync"]
+
+    @pytest.mark.asyncio
+    async def test_failing_check_marks_status_unhealthy(self):
+        """Test that an exception in one check is reported, not raised."""
+        checker = monitoring.HealthChecker()
+
+        async def broken():
+            raise RuntimeError("database down")
+
+        checker.register_check("db", broken)
+        checker.register_check("ok", lambda: {"status": "healthy"})
+
+        result = await checker.run_checks()
+
+        assert result["status"] == "unhealthy"
+        assert result["checks"]["db"] == {"status": "unhealthy", "error": "database down"}
+        assert result["checks"]["ok"] == {"status": "healthy"}
+
+    @pytest.mark.asyncio
+    async def test_checks_assigned_directly_are_still_detected(self):
+        """Test that checks added to the mapping directly are awaited correctly."""
+        checker = monitoring.HealthChecker()
+
+        async def direct():
+            return {"status": "healthy"}
+
+        checker.checks["direct"] = direct
+
+        result = await checker.run_checks()
+
+        assert result["checks"]["direct"] == {"status": "healthy"}
+
+
+class TestApplicationMetrics:
+    """Test derived application metrics."""
+
+    @pytest.mark.parametrize(
+        "total_requests,total_errors,expected",
+        [(0, 0, 0.0), (200, 5, 2.5), (4, 4, 100.0)],
+    )
+    def test_calculate_error_rate(self, total_requests, total_errors, expected):
+        """Test the error percentage derived from the running totals."""
+        metrics = {"total_requests": total_requests, "total_errors": total_errors}
+
+        assert monitoring.calculate_error_rate(metrics) == expected
+
+    def test_calculate_error_rate_from_error_counts(self):
+        """Test metrics without a total_errors key fall back to the per-key counts."""
+        metrics = {
+            "total_requests": 10,
+            "error_counts": {"GET:/a:500": 2, "POST:/b:404": 3},
+        }
+
+        assert monitoring.calculate_error_rate(metrics) == 50.0
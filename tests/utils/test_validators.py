@@ -0,0 +1,483 @@
+"""
+Tests for the validation utilities.
+"""
+
+import ast
+import json
+import multiprocessing
+from pathlib import Path
+
+import pytest
+
+from openpypi.utils import validators
+from openpypi.utils.validators import (
+    CodeValidator,
+    DocumentationValidator,
+    FileIndex,
+    PackageValidator,
+    QualityValidator,
+    SecurityValidator,
+    validate_package_comprehensive,
+)
+
+
+def _write_package(root: Path, module_count: int) -> Path:
+    """Create a small src-layout package with a mix of documented code."""
+    package_dir = root / "sample"
+    src_dir = package_dir / "src" / "sample"
+    src_dir.mkdir(parents=True)
+    (src_dir / "__init__.py").write_text('"""Sample package."""\n')
+
+    for index in range(module_count):
+        docstring = '    """Return the module index for callers."""\n' if index % 2 else ""
+        (src_dir / f"module_{index}.py").write_text(
+            f'"""Module {index}."""\n\n\ndef public_{index}():\n{docstring}    return {index}\n'
+        )
+
+    return package_dir
+
+
+class TestDocumentationValidator:
+    """Test docstring coverage analysis."""
+
+    def test_validate_docstrings_counts(self, tmp_path):
+        """Test docstring counts across a package."""
+        package_dir = _write_package(tmp_path, 4)
+
+        results = DocumentationValidator().validate_docstrings(package_dir)
+
+        assert results["total_modules"] == 4
+        assert results["documented_modules"] == 4
+        assert results["total_functions"] == 4
+        assert results["documented_functions"] == 2
+
+    def test_validate_readme(self, tmp_path):
+        """Test README section, badge and example detection."""
+        readme = tmp_path / "README.md"
+        readme.write_text("# Sample\n\n## Installation\n\n## Usage\n\nSee the license.\n")
+
+        results = DocumentationValidator().validate_readme(readme)
+
+        assert results["sections_found"] == ["installation", "usage", "license"]
+        assert results["sections_missing"] == ["examples", "api", "contributing"]
+        assert results["has_examples"]
+        assert not results["has_badges"]
+
+    def test_validate_docstrings_no_sources(self, tmp_path):
+        """Test a package without Python sources."""
+        results = DocumentationValidator().validate_docstrings(tmp_path)
+
+        assert results["recommendations"] == ["No Python source files found"]
+
+
+class TestFileIndex:
+    """Test the shared package file listing."""
+
+    def test_walks_once_and_filters_by_directory(self, tmp_path, monkeypatch):
+        """Test that lookups are served from a single traversal."""
+        package_dir = _write_package(tmp_path, 2)
+        (package_dir / "tests").mkdir()
+        (package_dir / "tests" / "test_sample.py").write_text("")
+        (package_dir / "README.md").write_text("# Sample\n")
+
+        index = FileIndex(package_dir)
+        src_files = index.py_files_under(package_dir / "src")
+
+        scans = []
+        real_scandir = validators.os.scandir
+        monkeypatch.setattr(
+            validators.os, "scandir", lambda path: scans.append(path) or real_scandir(path)
+        )
+        test_files = index.py_files_under(package_dir / "tests")
+
+        assert scans == []
+        assert [f.name for f in src_files] == ["__init__.py", "module_0.py", "module_1.py"]
+        assert test_files == [package_dir / "tests" / "test_sample.py"]
+        assert package_dir / "README.md" in index.files
+        assert index.size(package_dir / "README.md") == 9
+        assert index.has("tests") and index.has("README.md") and not index.has("docs")
+        assert index.py_files_under(package_dir / "src" / "sample" / "module_0") == []
+
+    def test_prunes_build_and_environment_directories(self, tmp_path):
+        """Test that skipped directories are never descended into."""
+        package_dir = _write_package(tmp_path, 1)
+        for skipped in [".venv/lib", "build/lib", "sample.egg-info", "src/sample/__pycache__"]:
+            (package_dir / skipped).mkdir(parents=True)
+            (package_dir / skipped / "generated.py").write_text("")
+
+        index = FileIndex(package_dir)
+
+        assert [f.name for f in index.py_files] == ["__init__.py", "module_0.py"]
+
+    def test_keeps_nested_build_and_dist_packages(self, tmp_path):
+        """Test that build and dist are only pruned at the package root."""
+        package_dir = _write_package(tmp_path, 0)
+        for subpackage in ["build", "dist"]:
+            (package_dir / "src" / "sample" / subpackage).mkdir()
+            (package_dir / "src" / "sample" / subpackage / "steps.py").write_text("")
+        (package_dir / "dist").mkdir()
+        (package_dir / "dist" / "setup.py").write_text("")
+
+        index = FileIndex(package_dir)
+
+        assert sorted(f.relative_to(package_dir).as_posix() for f in index.py_files) == [
+            "src/sample/__init__.py",
+            "src/sample/build/steps.py",
+            "src/sample/dist/steps.py",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_quality_checks_read_each_source_once(self, tmp_path, monkeypatch):
+        """Test that code, security and docstring checks share file reads."""
+        package_dir = _write_package(tmp_path, 3)
+        index = FileIndex(package_dir)
+        reads = []
+        real_read_text = Path.read_text
+        monkeypatch.setattr(
+            Path, "read_text", lambda self, *a, **k: reads.append(self) or real_read_text(self)
+        )
+
+        validator = QualityValidator()
+        await validator._validate_all_code(package_dir, index)
+        await validator._validate_security(package_dir, index)
+        await validator._validate_docstrings(package_dir, index)
+
+        assert sorted(reads) == sorted(index.py_files)
+
+
+class TestPackageValidator:
+    """Test package structure checks."""
+
+    def test_validate_structure(self, tmp_path):
+        """Test required, recommended and layout probes."""
+        package_dir = _write_package(tmp_path, 1)
+        (package_dir / "pyproject.toml").write_text("")
+        (package_dir / "README.md").write_text("")
+        (package_dir / ".gitignore").write_text("")
+
+        results = PackageValidator().validate_structure(package_dir)
+
+        assert not results["valid"]
+        assert results["found_files"] == ["pyproject.toml", "README.md"]
+        assert results["missing_files"] == ["LICENSE"]
+        assert "No tests directory found" in results["warnings"]
+        assert results["structure_score"] == pytest.approx(50.0)
+
+    def test_validate_structure_missing_directory(self, tmp_path):
+        """Test that a missing package directory is reported."""
+        results = PackageValidator().validate_structure(tmp_path / "missing")
+
+        assert not results["valid"]
+        assert results["errors"][0].startswith("Package directory does not exist")
+
+
+class TestCoverageReport:
+    """Test coverage.json parsing."""
+
+    @pytest.mark.parametrize("streaming", [True, False])
+    def test_read_coverage_report(self, tmp_path, monkeypatch, streaming):
+        """Test totals and per-file entries with and without ijson."""
+        if streaming:
+            pytest.importorskip("ijson")
+        monkeypatch.setattr(validators, "IJSON_AVAILABLE", streaming)
+        coverage_file = tmp_path / "coverage.json"
+        coverage_file.write_text(
+            json.dumps(
+                {
+                    "meta": {"version": "7.0"},
+                    "files": {
+                        "a.py": {"summary": {"percent_covered": 50.0}, "missing_lines": [3]},
+                        "b.py": {"summary": {"percent_covered": 100.0}, "missing_lines": []},
+                    },
+                    "totals": {"percent_covered": 75.5},
+                }
+            )
+        )
+
+        total, files = validators._read_coverage_report(coverage_file)
+
+        assert total == 75.5
+        assert [(name, data["missing_lines"]) for name, data in files] == [
+            ("a.py", [3]),
+            ("b.py", []),
+        ]
+
+
+class TestQualityValidator:
+    """Test the combined quality validator."""
+
+    @pytest.mark.asyncio
+    async def test_parallel_docstrings_match_serial(self, tmp_path):
+        """Test process-pool docstring analysis matches the serial scan."""
+        package_dir = _write_package(tmp_path, 12)
+        parallel = await QualityValidator()._validate_docstrings(package_dir)
+        # The worker processes stay up and are reused by the next call
+        pool = validators._get_process_pool()
+        await QualityValidator()._validate_docstrings(package_dir)
+        assert validators._get_process_pool() is pool
+
+        serial = DocumentationValidator().validate_docstrings(package_dir)
+        assert parallel["total_functions"] == serial["total_functions"] == 12
+        assert parallel["documented_functions"] == serial["documented_functions"] == 6
+        assert sorted(parallel["quality_issues"]) == sorted(serial["quality_issues"])
+
+    @pytest.mark.asyncio
+    async def test_broken_process_pool_is_replaced(self, tmp_path):
+        """Test that a pool whose workers died is discarded and analysis runs inline."""
+        package_dir = _write_package(tmp_path, 12)
+        pool = validators._get_process_pool()
+        await QualityValidator()._validate_docstrings(package_dir)
+        for process in multiprocessing.active_children():
+            process.kill()
+            process.join()
+
+        results = await QualityValidator()._validate_docstrings(package_dir)
+
+        assert results["total_functions"] == 12
+        assert validators._get_process_pool() is not pool
+
+    @pytest.mark.asyncio
+    async def test_security_scan_skips_vendored_and_tiny_files(self, tmp_path):
+        """Test that environments and files too small for a finding are not read."""
+        package_dir = _write_package(tmp_path, 0)
+        (package_dir / "src" / "sample" / "risky.py").write_text("eval(data)\n")
+        (package_dir / "src" / "sample" / "stub.py").write_text("x=(")
+        vendored = package_dir / ".venv" / "lib"
+        vendored.mkdir(parents=True)
+        (vendored / "vendored.py").write_text("exec(data)\n")
+
+        results = await QualityValidator()._validate_security(package_dir)
+
+        issues = results["code_security"]["issues"]
+        assert issues and all(issue.startswith("risky.py: ") for issue in issues)
+
+    @pytest.mark.asyncio
+    async def test_unchanged_package_reuses_results(self, tmp_path, monkeypatch):
+        """Test that results are memoized until a file in the package changes."""
+        package_dir = _write_package(tmp_path, 2)
+        validator = QualityValidator()
+        calls = []
+        real_validate_all_code = validator._validate_all_code
+
+        async def counting_validate_all_code(*args):
+            calls.append(args)
+            return await real_validate_all_code(*args)
+
+        monkeypatch.setattr(validator, "_validate_all_code", counting_validate_all_code)
+
+        first = await validator.validate_package_quality(package_dir, run_tests=False)
+        first["grade"] = "mutated by caller"
+        second = await validator.validate_package_quality(package_dir, run_tests=False)
+        assert len(calls) == 1
+        assert second["grade"] != "mutated by caller"
+
+        (package_dir / "src" / "sample" / "module_0.py").write_text('"""Changed."""\n')
+        await validator.validate_package_quality(package_dir, run_tests=False)
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_results_cache_is_shared_and_bounded(self, tmp_path, monkeypatch):
+        """Test that fresh validators share one bounded results cache."""
+        monkeypatch.setattr(validators, "_RESULTS_CACHE", validators.OrderedDict())
+        monkeypatch.setattr(validators, "_RESULTS_CACHE_SIZE", 1)
+        calls = []
+        real_validate_all_code = QualityValidator._validate_all_code
+
+        async def counting_validate_all_code(self, *args):
+            calls.append(args)
+            return await real_validate_all_code(self, *args)
+
+        monkeypatch.setattr(QualityValidator, "_validate_all_code", counting_validate_all_code)
+        first_dir = _write_package(tmp_path / "first", 1)
+        second_dir = _write_package(tmp_path / "second", 1)
+
+        await validate_package_comprehensive(first_dir, run_tests=False)
+        await validate_package_comprehensive(first_dir, run_tests=False)
+        assert len(calls) == 1
+
+        await validate_package_comprehensive(second_dir, run_tests=False)
+        await validate_package_comprehensive(first_dir, run_tests=False)
+        assert len(calls) == 3
+        assert len(validators._RESULTS_CACHE) == 1
+
+    @pytest.mark.parametrize(
+        "score, grade",
+        [(0, "F"), (39.9, "F"), (40, "D"), (64.9, "C+"), (65, "B-"), (89.99, "A"), (90, "A+")],
+    )
+    def test_grade_boundaries(self, score, grade):
+        """Test that each grade starts exactly at its threshold."""
+        results = {
+            "package_structure": {"structure_score": score},
+            "code_quality": {},
+            "security": {},
+            "tests": {},
+            "documentation": {},
+        }
+
+        assert QualityValidator()._calculate_overall_score(results) == (score, grade)
+
+
+class TestWalkNodes:
+    """Test the AST traversal shared by the validators."""
+
+    def test_visits_every_node_in_source_order(self):
+        """Test that the walk reaches the same nodes as ast.walk, in source order."""
+        tree = ast.parse(Path(validators.__file__).read_text())
+
+        nodes = list(validators._walk_nodes(tree, (ast.AST,)))
+
+        assert len(nodes) == sum(1 for _ in ast.walk(tree))
+        functions = [node.lineno for node in nodes if isinstance(node, ast.FunctionDef)]
+        assert functions == sorted(functions)
+
+
+class TestCodeValidator:
+    """Test per-module code checks."""
+
+    def test_validate_docstrings_reports_in_source_order(self):
+        """Test that nested definitions are reported in source order."""
+        code = (
+            "class Outer:\n"
+            "    def first(self):\n"
+            "        pass\n"
+            "\n"
+            "    def second(self):\n"
+            "        pass\n"
+            "\n"
+            "\n"
+            "async def third():\n"
+            "    pass\n"
+        )
+
+        valid, issues = CodeValidator().validate_docstrings(code)
+
+        assert not valid
+        assert issues == [
+            "ClassDef 'Outer' missing docstring",
+            "FunctionDef 'first' missing docstring",
+            "FunctionDef 'second' missing docstring",
+            "AsyncFunctionDef 'third' missing docstring",
+        ]
+
+    def test_validators_share_one_parse(self, monkeypatch):
+        """Test that checking the same source with several validators parses it once."""
+        code = "def greet(name: str) -> str:\n    return name\n"
+        parses = []
+        real_parse = validators.ast.parse
+
+        def counting_parse(source, *args, **kwargs):
+            parses.append(source)
+            return real_parse(source, *args, **kwargs)
+
+        validators._parse_source.cache_clear()
+        monkeypatch.setattr(validators.ast, "parse", counting_parse)
+        code_validator = CodeValidator()
+
+        assert code_validator.validate_syntax(code) == (True, [])
+        code_validator.validate_naming_conventions(code)
+        code_validator.validate_type_hints(code)
+        code_validator.validate_complexity(code)
+        SecurityValidator().validate_security(code)
+
+        assert parses == [code]
+
+    def test_analyze_matches_individual_validators(self):
+        """Test that the single-pass analysis agrees with each validate_* method."""
+        code = (
+            "import os\n"
+            "from os import system\n"
+            "\n"
+            "\n"
+            "class bad_name:\n"
+            "    def Method(self, x):\n"
+            "        BadVar = x and x or x\n"
+            "        if x:\n"
+            "            return BadVar\n"
+        )
+        code_validator = CodeValidator()
+
+        results = code_validator.analyze(code, max_complexity=1)
+
+        assert results == {
+            "syntax": code_validator.validate_syntax(code),
+            "imports": code_validator.validate_imports(code),
+            "naming": code_validator.validate_naming_conventions(code),
+            "docstrings": code_validator.validate_docstrings(code),
+            "type_hints": code_validator.validate_type_hints(code),
+            "complexity": code_validator.validate_complexity(code, max_complexity=1),
+        }
+        assert results["naming"] == (
+            False,
+            [
+                "Class 'bad_name' should use PascalCase",
+                "Function 'Method' should use snake_case",
+                "Variable 'BadVar' should use snake_case",
+            ],
+        )
+        assert results["imports"] == (False, ["Potentially unsafe import: os"])
+        assert not results["complexity"][0]
+
+    def test_syntax_error_reported_by_each_validator(self):
+        """Test that unparsable source is still reported rather than cached."""
+        code = "def broken(:\n"
+        code_validator = CodeValidator()
+
+        valid, errors = code_validator.validate_syntax(code)
+        assert not valid
+        assert errors[0].startswith("Syntax error at line 1")
+
+        valid, issues = code_validator.validate_naming_conventions(code)
+        assert not valid
+        assert issues[0].startswith("Naming validation error")
+
+
+class TestSecurityValidator:
+    """Test source-level security checks."""
+
+    def test_flags_risky_patterns(self):
+        """Test regex-based risk detection."""
+        code = "import yaml\n\ndata = yaml.load(stream)\nsubprocess.run(cmd, SHELL=True)\n"
+
+        results = SecurityValidator().validate_security(code)
+
+        assert any(
+            issue.startswith("Unsafe YAML loading at line 3") for issue in results["medium_risk"]
+        )
+        assert any(
+            issue.startswith("Shell injection risk at line 4") for issue in results["medium_risk"]
+        )
+
+    def test_clean_code_has_no_pattern_hits(self):
+        """Test that code without risky constructs is not flagged."""
+        results = SecurityValidator().validate_security("def add(a, b):\n    return a + b\n")
+
+        assert results["medium_risk"] == []
+        assert results["secure"]
+
+    def test_overlapping_patterns_reported_once_per_line(self):
+        """Test that each pattern is reported at most once per line."""
+        code = "requests.get(url, shell=True, verify=False); eval(x); eval(y)\n"
+
+        results = SecurityValidator().validate_security(code)
+        descriptions = [issue.split(" at line ")[0] for issue in results["medium_risk"]]
+
+        assert sorted(descriptions) == [
+            "Code injection risk",
+            "SSL verification disabled",
+            "Shell injection risk",
+        ]
+
+    def test_patterns_do_not_span_lines(self):
+        """Test that a pattern split across adjacent lines is not reported."""
+        code = (
+            "options = dict(shell=\n"
+            "    True)\n"
+            "response = requests.get(url,\n"
+            "    verify=False)\n"
+            "yaml.load(\n"
+            "    stream, Loader=SafeLoader)\n"
+        )
+
+        results = SecurityValidator().validate_security(code)
+
+        assert results["medium_risk"] == ["Unsafe YAML loading at line 5: yaml.load("]